@@ -8,12 +8,11 @@ Usage:
 """
 
 import os
-import time
 
 from flask import Flask, render_template, request, redirect, url_for, jsonify
 
 from config import config_by_name
-from core.extensions import db, jwt, migrate, cors
+from core.extensions import db, jwt, migrate, cors, worker_pool, ai_worker_pool
 from core.security import register_jwt_handlers
 from core.errors import register_error_handlers
 from core.logging_config import setup_logging
@@ -36,10 +35,53 @@ def create_app(config_name=None):
     setup_logging(app)
 
     # ── Initialise extensions ──────────────────────────────────
+    from core.db_engine import engine_options, register_db_engine
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
     db.init_app(app)
+    register_db_engine(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
     cors.init_app(app)
+    worker_pool.init_app(app)
+    ai_worker_pool.init_app(app)
+
+    # ── Background recalculation queue ─────────────────────────
+    from services.recalc_queue import recalc_queue
+    recalc_queue.init_app(app)
+
+    # ── AI provider registry (clients shared across requests) ──
+    from infrastructure.ai.registry import ai_registry
+    ai_registry.init_app(app)
+    if app.config.get("AI_WARMUP"):
+        ai_worker_pool.submit(ai_registry.warm_up)
+
+    # ── Cached career × skill matrix ───────────────────────────
+    from services.career_matrix import career_matrix
+    career_matrix.init_app(app)
+
+    # ── Indexed student search ─────────────────────────────────
+    from services.student_search import student_search
+    student_search.init_app(app)
+
+    # ── Rule-based student alerts ──────────────────────────────
+    from services.alert_engine import alert_engine
+    alert_engine.init_app(app)
+
+    # ── Background import of heavy optional modules ───────────
+    from core.preload import register_preload
+    register_preload(app)
+
+    # ── Request-scoped profile cache ───────────────────────────
+    from core.identity import register_identity
+    register_identity(app)
+
+    # ── Read-replica routing (read-your-writes stickiness) ─────
+    from core.db_routing import register_db_routing
+    register_db_routing(app)
+
+    # ── Per-request SQL counters / N+1 detection ───────────────
+    from core.query_stats import register_query_stats
+    register_query_stats(app)
 
     # ── Security: JWT error handlers ───────────────────────────
     register_jwt_handlers(jwt)
@@ -56,11 +98,13 @@ def create_app(config_name=None):
     app.register_blueprint(dashboard_bp)
     app.register_blueprint(teacher_bp)
 
-    # ── Context processors ─────────────────────────────────────
-    @app.context_processor
-    def inject_css_version():
-        """Inject a timestamp-based version for cache busting."""
-        return {"css_version": int(time.time())}
+    # ── CLI commands ───────────────────────────────────────────
+    from commands import register_commands
+    register_commands(app)
+
+    # ── Fingerprinted static assets (immutable, precompressed) ─
+    from core.static_assets import static_assets
+    static_assets.init_app(app)
 
     # ── Dev-mode cache control ─────────────────────────────────
     if config_name != "production":
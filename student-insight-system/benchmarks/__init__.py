@@ -0,0 +1,17 @@
+"""
+Benchmarks for the student and teacher hot paths.
+
+Runs each case against a seeded database (see seed.py) through the
+service layer or the Flask test client and reports p50 / p95 / p99
+latency, throughput and SQL statements per operation:
+
+    python -m benchmarks                                 # every case, default scale
+    python -m benchmarks --students 20000 --iterations 500
+    python -m benchmarks --only teacher_dashboard --only login
+    python -m benchmarks --compare benchmarks/results/abc1234.json
+
+The database comes from ``BENCHMARK_DATABASE_URL`` (``BenchmarkConfig``;
+a SQLite file under ``instance/`` by default) and is seeded on first use.
+Results are written as JSON, named after the current commit, so runs on
+two commits can be compared with ``--compare``.
+"""
@@ -0,0 +1,90 @@
+"""Command line entry point: ``python -m benchmarks --help``."""
+
+import argparse
+import logging
+import os
+import sys
+
+from sqlalchemy import func, select
+
+import seed
+from benchmarks.cases import CASES, BenchContext
+from benchmarks.harness import build_report, format_table, git_revision, load_report, measure, write_report
+from core.extensions import db
+from models import StudentProfile, TeacherProfile
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the hot paths.")
+    parser.add_argument("--only", action="append", choices=sorted(CASES), metavar="CASE",
+                        help=f"run only this case (repeatable): {', '.join(sorted(CASES))}")
+    parser.add_argument("--iterations", type=int, default=200, help="timed operations per case")
+    parser.add_argument("--warmup", type=int, default=10, help="untimed operations per case")
+    parser.add_argument("--sample", type=int, default=200, help="students / assignments rotated through")
+    parser.add_argument("--students", type=int, default=2000, help="students to seed into an empty database")
+    parser.add_argument("--seed", type=int, default=42, help="seed for the dataset and the user sample")
+    parser.add_argument("--config", default="benchmark", help="config name (default: benchmark)")
+    parser.add_argument("--output", default=None, help="result file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="earlier result file to compare against")
+    return parser
+
+
+def prepare_database(app, args):
+    """Create and seed the schema when the database has no students yet."""
+    with app.app_context():
+        db.create_all()
+        students = db.session.scalar(select(func.count(StudentProfile.id)))
+        if not students:
+            print(f"Seeding {args.students} students (seed {args.seed}) — one-off", file=sys.stderr)
+            seed_args = seed.build_parser().parse_args(
+                ["--all", "--num-students", str(args.students), "--seed", str(args.seed)]
+            )
+            with db.engine.connect() as connection:
+                seed.run(seed_args, connection)
+            students = db.session.scalar(select(func.count(StudentProfile.id)))
+        return {
+            "database": db.engine.url.render_as_string(hide_password=True),
+            "dialect": db.engine.dialect.name,
+            "students": students,
+            "teachers": db.session.scalar(select(func.count(TeacherProfile.id))),
+        }
+
+
+def run(app, args):
+    """Run the selected cases against ``app`` and return the report dict."""
+    environment = prepare_database(app, args)
+    environment.update(iterations=args.iterations, warmup=args.warmup, sample=args.sample, seed=args.seed)
+    ctx = BenchContext(app, sample_size=args.sample, seed=args.seed)
+    with app.app_context():
+        engine = db.engine
+
+    results = []
+    for name in args.only or CASES:
+        print(f"Running {name}", file=sys.stderr)
+        results.append(measure(name, CASES[name](ctx), engine, args.iterations, args.warmup))
+    return build_report(results, environment)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    from app import create_app
+
+    app = create_app(args.config)
+    # Request logging would be timed along with the work.
+    logging.getLogger().setLevel(logging.WARNING)
+
+    report = run(app, args)
+    output = args.output or os.path.join(RESULTS_DIR, f"{git_revision()[0] or 'results'}.json")
+    write_report(report, output)
+
+    baseline = load_report(args.compare) if args.compare else None
+    print(format_table(report, baseline))
+    print(f"\nWrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Benchmark cases — one per hot path.
+
+Each case is registered with ``@case(name)`` as a setup function taking
+the BenchContext and returning the operation to time. Operations rotate
+through a fixed random sample of students / teachers, so caches and the
+database see a realistic spread of users rather than one hot row.
+
+Service-layer cases run each call in its own app context (a fresh
+session, as a request would get); HTTP cases go through a test client
+with the signed-in user's JWT cookie, so the full request pipeline —
+auth, profile resolution, templates — is included.
+"""
+
+import itertools
+import random
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import select
+
+from core.extensions import db
+from dashboard.recalculate import recalculate_weekly_update
+from models import StudentProfile, TeacherAssignment, TeacherProfile, User
+from services.academic_service import AcademicService
+from services.dashboard_service import DashboardService
+from services.session_service import SessionService
+
+CASES = {}
+
+
+def case(name):
+    """Register a case setup function under ``name``."""
+    def decorator(setup):
+        CASES[name] = setup
+        return setup
+    return decorator
+
+
+class BenchContext:
+    """The app plus the sampled users every case draws from."""
+
+    def __init__(self, app, sample_size=200, seed=42, password="password123"):
+        self.app = app
+        self.password = password
+        rng = random.Random(seed)
+        with app.app_context():
+            students = db.session.execute(
+                select(User.id, User.email, StudentProfile.id)
+                .join(StudentProfile, StudentProfile.user_id == User.id)
+                .order_by(StudentProfile.id)
+            ).all()
+            assignments = db.session.execute(
+                select(TeacherProfile.user_id, TeacherAssignment.student_id)
+                .join(TeacherAssignment, TeacherAssignment.teacher_id == TeacherProfile.id)
+                .order_by(TeacherAssignment.id)
+            ).all()
+            if not students or not assignments:
+                raise RuntimeError("benchmark database has no students or teacher assignments — seed it first")
+
+            # (user_id, email, student_profile_id)
+            self.students = [tuple(row) for row in rng.sample(students, min(sample_size, len(students)))]
+            # (teacher user_id, student_profile_id)
+            self.assignments = [tuple(row) for row in rng.sample(assignments, min(sample_size, len(assignments)))]
+            self.teachers = sorted({teacher for teacher, _ in self.assignments})
+            self.tokens = {}
+            for user_id, _, _ in self.students:
+                self.tokens[user_id] = create_access_token(identity=str(user_id), additional_claims={"role": "student"})
+            for user_id in self.teachers:
+                self.tokens[user_id] = create_access_token(identity=str(user_id), additional_claims={"role": "teacher"})
+
+    def client_as(self, client, user_id):
+        client.set_cookie("access_token_cookie", self.tokens[user_id])
+        return client
+
+
+def _expect(resp, status=200):
+    if resp.status_code != status:
+        raise RuntimeError(f"{resp.request.method} {resp.request.path} returned {resp.status_code}")
+    return resp
+
+
+# ── Service layer ─────────────────────────────────────────────
+
+@case("dashboard_snapshot")
+def dashboard_snapshot(ctx):
+    """DashboardService.get_dashboard_data — the usual snapshot read."""
+    for user_id, _, _ in ctx.students:  # materialise the snapshots first
+        with ctx.app.app_context():
+            DashboardService.get_dashboard_data(user_id)
+    students = itertools.cycle(ctx.students)
+
+    def op():
+        user_id, _, _ = next(students)
+        with ctx.app.app_context():
+            DashboardService.get_dashboard_data(user_id)
+    return op
+
+
+@case("dashboard_live")
+def dashboard_live(ctx):
+    """DashboardService.get_dashboard_data computed live (stale / missing snapshot)."""
+    students = itertools.cycle(ctx.students)
+
+    def op():
+        user_id, _, _ = next(students)
+        with ctx.app.app_context():
+            DashboardService.get_dashboard_data(user_id, use_snapshot=False)
+    return op
+
+
+@case("goals_grades")
+def goals_grades(ctx):
+    students = itertools.cycle(ctx.students)
+
+    def op():
+        user_id, _, _ = next(students)
+        with ctx.app.app_context():
+            AcademicService.get_goals_grades_data(user_id)
+    return op
+
+
+@case("routine")
+def routine(ctx):
+    students = itertools.cycle(ctx.students)
+
+    def op():
+        user_id, _, _ = next(students)
+        with ctx.app.app_context():
+            SessionService.get_routine_data(user_id)
+    return op
+
+
+@case("recalculate_weekly_update")
+def recalculate(ctx):
+    students = itertools.cycle(ctx.students)
+
+    def op():
+        _, _, student_id = next(students)
+        with ctx.app.app_context():
+            recalculate_weekly_update(student_id)
+    return op
+
+
+# ── HTTP ──────────────────────────────────────────────────────
+
+@case("teacher_dashboard")
+def teacher_dashboard(ctx):
+    client = ctx.app.test_client()
+    teachers = itertools.cycle(ctx.teachers)
+
+    def op():
+        _expect(ctx.client_as(client, next(teachers)).get("/teacher/dashboard"))
+    return op
+
+
+@case("teacher_student_detail")
+def teacher_student_detail(ctx):
+    client = ctx.app.test_client()
+    assignments = itertools.cycle(ctx.assignments)
+
+    def op():
+        teacher, student_id = next(assignments)
+        _expect(ctx.client_as(client, teacher).get(f"/teacher/student/{student_id}"))
+    return op
+
+
+@case("login")
+def login(ctx):
+    """POST /login — dominated by password hash verification."""
+    client = ctx.app.test_client()
+    students = itertools.cycle(ctx.students)
+
+    def op():
+        _, email, _ = next(students)
+        _expect(client.post("/login", data={"email": email, "password": ctx.password, "role": "student"}))
+    return op
@@ -0,0 +1,163 @@
+"""
+Timing loop, latency statistics and the JSON result format.
+
+A case is a zero-argument callable performing one operation. It is
+called ``warmup`` times untimed, then ``iterations`` times with each call
+timed individually and the SQL statements it executed counted.
+"""
+
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+RESULT_FORMAT = 1
+
+
+def percentile(values, q):
+    """Value at percentile ``q`` (0–100) of ``values``, linearly interpolated."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class CaseResult:
+    """Per-operation latencies (ms) and statement counts of one case."""
+
+    def __init__(self, name, latencies_ms, queries):
+        self.name = name
+        self.latencies_ms = latencies_ms
+        self.queries = queries
+
+    def percentile(self, q):
+        return percentile(self.latencies_ms, q)
+
+    def summary(self) -> dict:
+        total_s = sum(self.latencies_ms) / 1000
+        return {
+            "iterations": len(self.latencies_ms),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "mean_ms": round(statistics.fmean(self.latencies_ms), 3),
+            "min_ms": round(min(self.latencies_ms), 3),
+            "max_ms": round(max(self.latencies_ms), 3),
+            "ops_per_sec": round(len(self.latencies_ms) / total_s, 2) if total_s else None,
+            "queries_per_op": round(statistics.fmean(self.queries), 2),
+        }
+
+
+class StatementCounter:
+    """Counts statements on ``engine`` while attached (single-threaded runs)."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "after_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "after_cursor_execute", self._record)
+
+
+def measure(name, op, engine, iterations=200, warmup=10):
+    """Run ``op`` and return its CaseResult."""
+    for _ in range(warmup):
+        op()
+
+    latencies, queries = [], []
+    with StatementCounter(engine) as counter:
+        for _ in range(iterations):
+            before = counter.count
+            started = time.perf_counter()
+            op()
+            latencies.append((time.perf_counter() - started) * 1000)
+            queries.append(counter.count - before)
+    result = CaseResult(name, latencies, queries)
+    logger.info("%s: %s", name, result.summary())
+    return result
+
+
+# ── Result files ──────────────────────────────────────────────
+
+def git_revision():
+    """``(short sha, dirty)`` of the working tree, or ``(None, None)`` outside git."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return sha, dirty
+
+
+def build_report(results, environment) -> dict:
+    sha, dirty = git_revision()
+    return {
+        "format": RESULT_FORMAT,
+        "commit": sha,
+        "dirty": dirty,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "environment": environment,
+        "cases": {r.name: r.summary() for r in results},
+    }
+
+
+def write_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def load_report(path) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def format_table(report, baseline=None) -> str:
+    """Plain-text summary; with ``baseline``, p50 / p95 change against it."""
+    header = f"{'case':<28} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ops/s':>9} {'sql/op':>7}"
+    if baseline:
+        header += f" {'Δp50':>8} {'Δp95':>8}"
+    lines = [header, "-" * len(header)]
+    for name, row in report["cases"].items():
+        line = (f"{name:<28} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} "
+                f"{row['ops_per_sec'] or 0:>9.1f} {row['queries_per_op']:>7.1f}")
+        old = (baseline or {}).get("cases", {}).get(name)
+        if old:
+            line += f" {_change(old['p50_ms'], row['p50_ms']):>8} {_change(old['p95_ms'], row['p95_ms']):>8}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _change(old, new):
+    if not old:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
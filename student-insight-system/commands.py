@@ -0,0 +1,63 @@
+"""
+Flask CLI commands.
+
+Register in app factory:
+    from commands import register_commands
+    register_commands(app)
+
+Usage:
+    flask recalc-week
+    flask alerts-sweep
+    flask build-assets
+"""
+
+import time
+
+import click
+
+
+def register_commands(app):
+    """Attach the project's maintenance commands to ``app.cli``."""
+
+    @app.cli.command("recalc-week")
+    def recalc_week():
+        """Recompute this week's WeeklyUpdate for every student in one pass."""
+        from core.db_engine import statement_timeout
+        from dashboard.recalculate_batch import recalculate_all_weekly_updates
+
+        started = time.perf_counter()
+        with statement_timeout(0):  # whole-cohort statements outlast the request limit
+            summary = recalculate_all_weekly_updates()
+        elapsed = time.perf_counter() - started
+        click.echo(
+            f"Week of {summary['week_start']}: recalculated {summary['students']} students "
+            f"({summary['updated']} updated, {summary['inserted']} inserted) in {elapsed:.2f}s"
+        )
+
+    @app.cli.command("alerts-sweep")
+    def alerts_sweep():
+        """Evaluate the alert rules for every student and raise new alerts."""
+        from core.db_engine import statement_timeout
+        from services.alert_engine import alert_engine
+
+        started = time.perf_counter()
+        with statement_timeout(0):
+            created = alert_engine.evaluate()
+        elapsed = time.perf_counter() - started
+        click.echo(f"Raised {sum(created.values())} alerts in {elapsed:.2f}s")
+        for alert_type, count in sorted(created.items()):
+            click.echo(f"  {alert_type}: {count}")
+
+    @app.cli.command("build-assets")
+    def build_assets():
+        """Fingerprint and precompress static/ into the asset manifest directory."""
+        from core.static_assets import build_assets as build, static_assets
+
+        started = time.perf_counter()
+        manifest = build(app.static_folder, static_assets.directory)
+        elapsed = time.perf_counter() - started
+        compressed = manifest["encodings"]
+        click.echo(
+            f"Fingerprinted {len(manifest['assets'])} files into {static_assets.directory} "
+            f"({len(compressed)} precompressed) in {elapsed:.2f}s"
+        )
@@ -35,6 +35,26 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Read replica (see core/db_routing.py): @read_replica paths query it,
+    # except for a browser that wrote within DB_REPLICA_STICKY_SECONDS
+    DATABASE_REPLICA_URL = os.environ.get("DATABASE_REPLICA_URL", "")
+    SQLALCHEMY_BINDS = {"replica": DATABASE_REPLICA_URL} if DATABASE_REPLICA_URL else {}
+    DB_REPLICA_STICKY_SECONDS = float(os.environ.get("DB_REPLICA_STICKY_SECONDS", 10))
+
+    # Connection pool and timeouts (see core/db_engine.py). Per worker
+    # process: size + overflow connections, a request waits at most
+    # DB_POOL_TIMEOUT seconds for one before getting a 503.
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 10))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_POOL_WAIT_WARN_MS = float(os.environ.get("DB_POOL_WAIT_WARN_MS", 100))
+    DB_POOL_STATS_INTERVAL_SECONDS = float(os.environ.get("DB_POOL_STATS_INTERVAL_SECONDS", 60))
+    # PostgreSQL session limits in milliseconds (0 = server default)
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 0))
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS = int(os.environ.get("DB_IDLE_IN_TRANSACTION_TIMEOUT_MS", 0))
+
     # Gemini AI
     GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 
@@ -46,11 +66,77 @@ class Config:
     MAIL_DEFAULT_SENDER = os.environ.get("MAIL_DEFAULT_SENDER", "")
     MAIL_USE_TLS = True
 
+    # Background workers
+    WORKER_POOL_SIZE = int(os.environ.get("WORKER_POOL_SIZE", 4))
+    AI_WORKER_POOL_SIZE = int(os.environ.get("AI_WORKER_POOL_SIZE", 2))  # insight jobs; separate from recalc
+    RECALC_DEBOUNCE_SECONDS = float(os.environ.get("RECALC_DEBOUNCE_SECONDS", 2.0))
+    RECALC_POLL_SECONDS = float(os.environ.get("RECALC_POLL_SECONDS", 30.0))
+    INSIGHT_JOB_TIMEOUT_SECONDS = int(os.environ.get("INSIGHT_JOB_TIMEOUT_SECONDS", 300))
+
+    # Student search: auto | trigram | fts5 | memory | like (see services/student_search.py)
+    STUDENT_SEARCH_BACKEND = os.environ.get("STUDENT_SEARCH_BACKEND", "auto")
+    STUDENT_SEARCH_INDEX_TTL_SECONDS = float(os.environ.get("STUDENT_SEARCH_INDEX_TTL_SECONDS", 300))
+
+    # Student alert rules (see services/alert_engine.py)
+    ALERT_BURNOUT_THRESHOLD = float(os.environ.get("ALERT_BURNOUT_THRESHOLD", 0.7))
+    ALERT_INACTIVITY_DAYS = int(os.environ.get("ALERT_INACTIVITY_DAYS", 7))
+    ALERT_CGPA_DROP = float(os.environ.get("ALERT_CGPA_DROP", 0.2))
+    ALERT_FAILING_PERCENT = float(os.environ.get("ALERT_FAILING_PERCENT", 50))
+    ALERT_FAILING_MIN_COUNT = int(os.environ.get("ALERT_FAILING_MIN_COUNT", 2))
+    ALERT_ATTENDANCE_MIN_RATE = float(os.environ.get("ALERT_ATTENDANCE_MIN_RATE", 0.75))
+    ALERT_LOOKBACK_DAYS = int(os.environ.get("ALERT_LOOKBACK_DAYS", 30))
+    ALERT_COOLDOWN_DAYS = int(os.environ.get("ALERT_COOLDOWN_DAYS", 7))
+
+    # Import numpy / google-generativeai in the background after startup
+    # instead of on first use (see core/preload.py)
+    PRELOAD_HEAVY_MODULES = os.environ.get("PRELOAD_HEAVY_MODULES", "false").lower() == "true"
+
+    # Per-request SQL instrumentation (see core/query_stats.py): a statement
+    # fingerprint repeated this often in one request is logged as a likely N+1
+    QUERY_STATS_ENABLED = os.environ.get("QUERY_STATS_ENABLED", "true").lower() == "true"
+    QUERY_REPEAT_THRESHOLD = int(os.environ.get("QUERY_REPEAT_THRESHOLD", 5))
+    QUERY_SERVER_TIMING = os.environ.get("QUERY_SERVER_TIMING", "true").lower() == "true"
+
+    # Content-hashed static assets (see core/static_assets.py), built by
+    # `flask build-assets` into STATIC_ASSETS_DIR (default: static/dist)
+    STATIC_ASSETS_ENABLED = os.environ.get("STATIC_ASSETS_ENABLED", "true").lower() == "true"
+    STATIC_ASSETS_DIR = os.environ.get("STATIC_ASSETS_DIR", "")
+
+    # Career × skill matrix cache (rebuilt on local edits or after the TTL)
+    CAREER_MATRIX_TTL_SECONDS = float(os.environ.get("CAREER_MATRIX_TTL_SECONDS", 300))
+
+    # AI providers (see infrastructure/ai/registry.py)
+    AI_PROVIDER = os.environ.get("AI_PROVIDER", "gemini")
+    AI_MODEL_NAME = os.environ.get("AI_MODEL_NAME", "gemini-2.0-flash")
+    AI_MAX_CONCURRENCY = int(os.environ.get("AI_MAX_CONCURRENCY", 8))
+    AI_WARMUP = os.environ.get("AI_WARMUP", "false").lower() == "true"
+
+    # Stand-in provider for offline load tests (AI_PROVIDER=mock, see loadtest/)
+    AI_MOCK_LATENCY_MS = float(os.environ.get("AI_MOCK_LATENCY_MS", 0))
+    AI_MOCK_JITTER_MS = float(os.environ.get("AI_MOCK_JITTER_MS", 0))
+    AI_MOCK_FAILURE_RATE = float(os.environ.get("AI_MOCK_FAILURE_RATE", 0))
+
+    # AI resilience (see infrastructure/ai/resilience.py)
+    AI_TIMEOUT_SECONDS = float(os.environ.get("AI_TIMEOUT_SECONDS", 30))
+    AI_ACQUIRE_TIMEOUT_SECONDS = float(os.environ.get("AI_ACQUIRE_TIMEOUT_SECONDS", 5))
+    AI_RATE_PER_MINUTE = float(os.environ.get("AI_RATE_PER_MINUTE", 60))
+    AI_USER_RATE_PER_MINUTE = float(os.environ.get("AI_USER_RATE_PER_MINUTE", 6))
+    AI_BREAKER_FAILURES = int(os.environ.get("AI_BREAKER_FAILURES", 5))
+    AI_BREAKER_RESET_SECONDS = float(os.environ.get("AI_BREAKER_RESET_SECONDS", 30))
+
+    # AI response cache (see infrastructure/ai/cached_service.py)
+    AI_CACHE_ENABLED = os.environ.get("AI_CACHE_ENABLED", "true").lower() == "true"
+    AI_CACHE_TTL_SECONDS = float(os.environ.get("AI_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+    AI_CACHE_MAX_ENTRIES = int(os.environ.get("AI_CACHE_MAX_ENTRIES", 5000))
+    AI_CACHE_SWEEP_SECONDS = float(os.environ.get("AI_CACHE_SWEEP_SECONDS", 300))  # eviction cadence
+
 
 class DevelopmentConfig(Config):
     """Development overrides."""
     DEBUG = True
     SEND_FILE_MAX_AGE_DEFAULT = 0
+    # Serve static/ as edited; set to true to try a `flask build-assets` build
+    STATIC_ASSETS_ENABLED = os.environ.get("STATIC_ASSETS_ENABLED", "false").lower() == "true"
 
 
 class TestingConfig(Config):
@@ -58,6 +144,21 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)
+    WORKER_POOL_SIZE = 0  # run background work inline; recalc jobs wait for flush()
+    AI_WORKER_POOL_SIZE = 0
+    AI_RATE_PER_MINUTE = AI_USER_RATE_PER_MINUTE = 10_000  # user ids repeat across tests
+    STATIC_ASSETS_ENABLED = False  # tests load their own build
+
+
+class BenchmarkConfig(Config):
+    """Benchmark runs (see benchmarks/) — production settings on a scratch database."""
+    DEBUG = False
+    SQLALCHEMY_DATABASE_URI = os.environ.get("BENCHMARK_DATABASE_URL", "sqlite:///benchmark.db")
+    WORKER_POOL_SIZE = 0  # recalc runs inline so its cost is measured, not hidden in a thread
+    AI_WORKER_POOL_SIZE = 0
+    QUERY_SERVER_TIMING = False
+    AI_PROVIDER = "mock"
+    AI_RATE_PER_MINUTE = AI_USER_RATE_PER_MINUTE = 1_000_000
 
 
 class ProductionConfig(Config):
@@ -65,6 +166,9 @@ class ProductionConfig(Config):
     DEBUG = False
     JWT_COOKIE_SECURE = True
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
+    QUERY_SERVER_TIMING = False  # don't expose DB timings publicly
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 15_000))
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS = int(os.environ.get("DB_IDLE_IN_TRANSACTION_TIMEOUT_MS", 60_000))
 
     def __init__(self):
         # Fail fast if required env vars are missing in production
@@ -80,5 +184,6 @@ class ProductionConfig(Config):
 config_by_name = {
     "development": DevelopmentConfig,
     "testing": TestingConfig,
+    "benchmark": BenchmarkConfig,
     "production": ProductionConfig,
 }
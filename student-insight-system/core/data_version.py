@@ -0,0 +1,153 @@
+"""
+Per-student data version — cheap ETags for the student JSON APIs.
+
+``StudentProfile.data_version`` is a counter that goes up whenever
+anything belonging to that student is written:
+
+  * ORM writes are tracked automatically — flushing a new, changed or
+    deleted row with a ``student_id`` (or the StudentProfile itself)
+    bumps that student in the same transaction;
+  * bulk ``Query.update()`` / ``insert()`` / ``delete()`` statements
+    bypass the unit of work, so their callers call
+    ``bump_data_version(student_ids)``.
+
+Bookkeeping tables (dashboard snapshots, job queues) don't count: they
+are derived from the data, not part of it.
+
+Views decorated with ``@student_etag`` tag their response with the
+signed-in student's version. A request whose ``If-None-Match`` still
+matches is answered ``304 Not Modified`` before the view runs — the only
+query is the profile lookup that ``require_role(..., preload=True)``
+already makes (shared versions come from in-process caches).
+
+Usage:
+    @dashboard_bp.route("/api/skills/history")
+    @require_role("student", preload=True)
+    @student_etag
+    def api_get_skill_history(): ...
+
+Responses that also show shared catalog data (careers, skills) name a
+function returning the catalog's current version; it is part of the tag:
+
+    @student_etag(shared=[career_matrix.fingerprint])
+    def api_gg_state(): ...
+
+Bump ``ETAG_SCHEMA`` when the JSON shape of a tagged endpoint changes, so
+clients don't keep a cached body from the previous release.
+"""
+
+import functools
+import hashlib
+from datetime import date
+
+from flask import make_response, request
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from core.identity import current_student
+from models import InsightJob, RecalcJob, StudentDashboardSnapshot, StudentProfile
+
+ETAG_SCHEMA = 1
+
+# Derived or bookkeeping rows; writing them does not change what a student sees.
+UNVERSIONED = (StudentDashboardSnapshot, RecalcJob, InsightJob)
+
+_PENDING = "data_version_bumped"
+
+
+def _student_id_of(obj):
+    if isinstance(obj, StudentProfile):
+        return obj.id
+    if isinstance(obj, UNVERSIONED):
+        return None
+    return getattr(obj, "student_id", None)
+
+
+def _increment(connection, student_ids):
+    connection.execute(
+        update(StudentProfile.__table__)
+        .where(StudentProfile.__table__.c.id.in_(sorted(student_ids)))
+        .values(data_version=StudentProfile.__table__.c.data_version + 1)
+    )
+
+
+def bump_data_version(student_ids, session=None):
+    """Bump the version of every student in ``student_ids`` (after a bulk write)."""
+    from core.extensions import db
+
+    ids = {int(sid) for sid in student_ids if sid is not None}
+    if ids:
+        session = session or db.session()
+        _increment(session.connection(), ids)
+        _expire_versions(session, ids)
+
+
+def _expire_versions(session, student_ids):
+    """Reload ``data_version`` on next access for profiles already in the session."""
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, StudentProfile) and obj.id in student_ids:
+            session.expire(obj, ["data_version"])
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flushed_students(session, flush_context):
+    ids = set()
+    for obj in session.new | session.deleted:
+        ids.add(_student_id_of(obj))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            ids.add(_student_id_of(obj))
+    ids.discard(None)
+    if ids:
+        _increment(session.connection(), ids)
+        session.info.setdefault(_PENDING, set()).update(ids)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _expire_flushed_students(session, flush_context):
+    ids = session.info.pop(_PENDING, None)
+    if ids:
+        _expire_versions(session, ids)
+
+
+# ── Conditional GET ───────────────────────────────────────────
+
+def _etag(student, shared):
+    # The date bounds staleness of anything computed relative to "today".
+    scope = "|".join([str(ETAG_SCHEMA), request.full_path, date.today().isoformat(),
+                      *(str(version()) for version in shared)])
+    digest = hashlib.sha1(scope.encode()).hexdigest()[:12]
+    return f"s{student.id}-v{student.data_version or 0}-{digest}"
+
+
+def _tag(response, etag):
+    response.set_etag(etag, weak=True)
+    # Per-user data: browsers may keep it, but must revalidate every time.
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def student_etag(fn=None, *, shared=()):
+    """Answer ``If-None-Match`` with 304 while the student's data version is unchanged.
+
+    ``shared`` lists zero-argument callables returning the version of shared
+    (non-student) data the response includes.
+    """
+    if fn is None:
+        return lambda f: student_etag(f, shared=shared)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        student = current_student()
+        if student is None:
+            return fn(*args, **kwargs)
+
+        etag = _etag(student, shared)
+        if request.if_none_match.contains_weak(etag):
+            return _tag(make_response("", 304), etag)
+
+        response = make_response(fn(*args, **kwargs))
+        if response.status_code == 200:
+            _tag(response, etag)
+        return response
+    return wrapper
@@ -0,0 +1,204 @@
+"""
+Database engine tuning — connection pool, timeouts and pool metrics.
+
+Engine options come from the ``DB_*`` settings in config.py and are
+applied per environment before ``db.init_app``:
+
+    DB_POOL_SIZE / DB_MAX_OVERFLOW    persistent / burst connections per process
+    DB_POOL_TIMEOUT                   seconds a request waits for a free connection
+    DB_POOL_RECYCLE                   reconnect connections older than this (seconds)
+    DB_POOL_PRE_PING                  test a connection before handing it out
+    DB_STATEMENT_TIMEOUT_MS           PostgreSQL: cancel statements running longer
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS PostgreSQL: end sessions left idle in a transaction
+
+Anything in ``SQLALCHEMY_ENGINE_OPTIONS`` still wins. Pool settings apply
+to server databases only; SQLite keeps SQLAlchemy's defaults.
+
+Code that legitimately runs long statements (maintenance commands,
+reports) raises the limit for its own transactions:
+
+    from core.db_engine import statement_timeout
+    with statement_timeout(0):          # 0 = no limit
+        recalculate_all_weekly_updates()
+
+Pool checkouts are timed. A request that waited longer than
+``DB_POOL_WAIT_WARN_MS`` for a connection is logged with the pool state,
+the wait is added to the request's SQL summary and Server-Timing header
+(core/query_stats.py), and totals are logged every
+``DB_POOL_STATS_INTERVAL_SECONDS``. An exhausted pool or a cancelled
+statement is answered with 503 instead of an opaque 500.
+
+Register in app factory:
+    from core.db_engine import engine_options, register_db_engine
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
+    db.init_app(app)
+    register_db_engine(app)
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from core import query_stats
+
+logger = logging.getLogger(__name__)
+
+_statement_timeout_override = contextvars.ContextVar("statement_timeout_ms", default=None)
+
+# PostgreSQL SQLSTATE for "canceling statement due to statement timeout"
+QUERY_CANCELED = "57014"
+
+
+def engine_options(config) -> dict:
+    """``SQLALCHEMY_ENGINE_OPTIONS`` for ``config``'s database and DB_* settings."""
+    options = {}
+    backend = make_url(config["SQLALCHEMY_DATABASE_URI"]).get_backend_name()
+    if backend != "sqlite":
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=config.get("DB_POOL_SIZE", 10),
+            max_overflow=config.get("DB_MAX_OVERFLOW", 10),
+            pool_timeout=config.get("DB_POOL_TIMEOUT", 10),
+            pool_recycle=config.get("DB_POOL_RECYCLE", 1800),
+            pool_pre_ping=config.get("DB_POOL_PRE_PING", True),
+        )
+    if backend == "postgresql":
+        settings = {
+            "statement_timeout": config.get("DB_STATEMENT_TIMEOUT_MS", 0),
+            "idle_in_transaction_session_timeout": config.get("DB_IDLE_IN_TRANSACTION_TIMEOUT_MS", 0),
+        }
+        pg_options = " ".join(f"-c {name}={int(ms)}" for name, ms in settings.items() if ms)
+        if pg_options:
+            options["connect_args"] = {"options": pg_options}
+    options.update(config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    return options
+
+
+# ── Pool metrics ──────────────────────────────────────────────
+
+class PoolMetrics:
+    """Process-wide checkout counters for the instrumented pools."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.slow_wait_ms = 100.0
+        self.report_interval = 60.0
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.slow_checkouts = 0
+            self.timeouts = 0
+            self.wait_ms_total = 0.0
+            self.wait_ms_max = 0.0
+            self._last_report = time.monotonic()
+
+    def record(self, pool, waited_ms, timed_out=False):
+        with self._lock:
+            self.checkouts += not timed_out
+            self.timeouts += timed_out
+            self.slow_checkouts += waited_ms >= self.slow_wait_ms
+            self.wait_ms_total += waited_ms
+            self.wait_ms_max = max(self.wait_ms_max, waited_ms)
+            due = time.monotonic() - self._last_report >= self.report_interval
+            if due:
+                self._last_report = time.monotonic()
+
+        stats = query_stats.current()
+        if stats is not None:
+            stats.pool_wait_ms += waited_ms
+        if timed_out:
+            logger.warning("DB pool exhausted after %.0f ms waiting: %s", waited_ms, pool.status())
+        elif waited_ms >= self.slow_wait_ms:
+            logger.warning("Waited %.0f ms for a DB connection: %s", waited_ms, pool.status())
+        if due:
+            logger.info("db pool %s", " ".join(f"{k}={v}" for k, v in self.snapshot(pool).items()))
+
+    def snapshot(self, pool=None) -> dict:
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "slow_checkouts": self.slow_checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_ms_total / max(self.checkouts + self.timeouts, 1), 2),
+                "wait_ms_max": round(self.wait_ms_max, 1),
+            }
+        if isinstance(pool, QueuePool):
+            data.update(size=pool.size(), checked_out=pool.checkedout(), overflow=max(pool.overflow(), 0))
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times every checkout, including waits for a free connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record(self, (time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        pool_metrics.record(self, (time.perf_counter() - started) * 1000)
+        return entry
+
+
+# ── Statement timeout overrides ───────────────────────────────
+
+def _set_local_timeout(connection, ms):
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(ms)}")
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    ms = _statement_timeout_override.get()
+    if ms is not None:
+        _set_local_timeout(connection, ms)
+
+
+@contextmanager
+def statement_timeout(ms):
+    """Use ``ms`` (0 = unlimited) as the statement timeout for transactions in this block."""
+    from core.extensions import db
+
+    token = _statement_timeout_override.set(ms)
+    try:
+        session = db.session()
+        if session.in_transaction():
+            _set_local_timeout(session.connection(), ms)
+        yield
+    finally:
+        _statement_timeout_override.reset(token)
+
+
+def is_statement_timeout(error) -> bool:
+    """True for a DBAPI error raised because a statement exceeded its timeout."""
+    orig = getattr(error, "orig", None)
+    return getattr(orig, "pgcode", None) == QUERY_CANCELED or getattr(orig, "sqlstate", None) == QUERY_CANCELED
+
+
+# ── Registration ──────────────────────────────────────────────
+
+def register_db_engine(app):
+    """Apply the metrics settings and log the effective pool configuration."""
+    pool_metrics.slow_wait_ms = float(app.config.get("DB_POOL_WAIT_WARN_MS", 100))
+    pool_metrics.report_interval = float(app.config.get("DB_POOL_STATS_INTERVAL_SECONDS", 60))
+
+    options = app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {}
+    if "pool_size" in options:
+        logger.info(
+            "DB pool: size=%s overflow=%s timeout=%ss recycle=%ss pre_ping=%s",
+            options["pool_size"], options.get("max_overflow"), options.get("pool_timeout"),
+            options.get("pool_recycle"), options.get("pool_pre_ping"),
+        )
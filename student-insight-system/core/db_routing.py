@@ -0,0 +1,144 @@
+"""
+Read-replica routing — read-only paths query the replica, everything else the primary.
+
+With ``DATABASE_REPLICA_URL`` set, the replica is registered as the
+``replica`` bind and the session routes each statement:
+
+  * SELECTs issued inside a ``@read_replica`` function (or a
+    ``replica_reads()`` block) go to the replica;
+  * flushes, INSERT / UPDATE / DELETE and raw SQL always go to the primary;
+  * once the current request has written, the rest of it reads the primary.
+
+Read-your-writes: a successful POST / PUT / PATCH / DELETE that wrote to
+the database sets a short cookie (``DB_REPLICA_STICKY_SECONDS``), and
+that browser's requests read the primary until it expires, so users see
+their own changes while the replica lags. The cookie only chooses a
+database; it grants nothing.
+
+Without a replica configured every statement goes to the primary and the
+decorators are no-ops.
+
+Code inside a replica block that is about to write something derived
+from what it read (e.g. rebuilding a cache row) re-reads on the primary
+first, inside ``primary_reads()``: a lagging replica must not overwrite
+newer data.
+
+Usage:
+    from core.db_routing import read_replica
+
+    @read_replica
+    def get_dashboard_data(user_id): ...
+
+Register in app factory:
+    from core.db_routing import register_db_routing
+    register_db_routing(app)
+"""
+
+import contextvars
+import functools
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context, request
+from flask_sqlalchemy.session import Session as FlaskSession
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+REPLICA_BIND = "replica"
+STICKY_COOKIE = "db_primary_until"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_use_replica = contextvars.ContextVar("use_replica", default=False)
+
+
+@contextmanager
+def replica_reads():
+    """Send the SELECTs issued in this block to the replica (when allowed)."""
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Send every statement in this block to the primary, even inside ``replica_reads()``."""
+    token = _use_replica.set(False)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def reading_replica(session) -> bool:
+    """True if a SELECT issued here through ``session`` would go to the replica."""
+    return (_use_replica.get() and not _pinned_to_primary()
+            and REPLICA_BIND in session._db.engines)
+
+
+def read_replica(fn):
+    """Decorator form of ``replica_reads`` for read-only service methods and views."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with replica_reads():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def _pinned_to_primary():
+    return has_request_context() and (g.get("db_wrote") or g.get("db_sticky"))
+
+
+class RoutingSession(FlaskSession):
+    """Flask-SQLAlchemy session that may hand reads to the ``replica`` bind."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and not self._flushing and getattr(clause, "is_select", False)
+                and reading_replica(self)):
+            return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+# ── Write tracking ────────────────────────────────────────────
+
+def _mark_write():
+    if has_request_context():
+        g.db_wrote = True
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    _mark_write()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _after_bulk_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _mark_write()
+
+
+# ── Request hooks ─────────────────────────────────────────────
+
+def register_db_routing(app):
+    """Pin a browser to the primary for a short window after its writes."""
+    sticky_seconds = float(app.config.get("DB_REPLICA_STICKY_SECONDS", 10))
+
+    @app.before_request
+    def read_sticky_cookie():
+        g.db_wrote = False
+        try:
+            g.db_sticky = float(request.cookies.get(STICKY_COOKIE, 0)) > time.time()
+        except ValueError:
+            g.db_sticky = False
+
+    @app.after_request
+    def set_sticky_cookie(response):
+        if (g.get("db_wrote") and request.method not in SAFE_METHODS
+                and response.status_code < 400 and sticky_seconds > 0):
+            response.set_cookie(
+                STICKY_COOKIE, f"{time.time() + sticky_seconds:.0f}",
+                max_age=int(sticky_seconds) or 1, httponly=True, samesite="Lax",
+                secure=app.config.get("JWT_COOKIE_SECURE", False),
+            )
+        return response
@@ -12,6 +12,7 @@ Register in app factory:
 
 import logging
 from flask import jsonify, render_template, request
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,18 @@ class ConflictError(AppError):
     default_message = "Resource conflict"
 
 
+class RateLimitError(AppError):
+    """Raised when a caller exceeds a rate limit."""
+    status_code = 429
+    default_message = "Too many requests — please try again shortly"
+
+
+class ServiceUnavailableError(AppError):
+    """Raised when the server is temporarily overloaded (e.g. no DB connection free)."""
+    status_code = 503
+    default_message = "The server is busy — please try again shortly"
+
+
 # ── Helpers ───────────────────────────────────────────────────────
 
 def _wants_json():
@@ -90,6 +103,20 @@ def register_error_handlers(app):
         # Browser — render a generic error template if it exists
         return _render_error(error.status_code, error.message)
 
+    @app.errorhandler(PoolTimeoutError)
+    def handle_pool_timeout(error):
+        # Every DB connection stayed busy for DB_POOL_TIMEOUT (see core/db_engine.py)
+        resp, status = handle_app_error(ServiceUnavailableError())
+        return resp, status, {"Retry-After": "5"}
+
+    @app.errorhandler(OperationalError)
+    def handle_operational_error(error):
+        from core.db_engine import is_statement_timeout
+        if not is_statement_timeout(error):
+            raise error
+        logger.warning("Statement timeout on %s", request.path)
+        return handle_app_error(ServiceUnavailableError("The request took too long — please try again"))
+
     @app.errorhandler(404)
     def handle_404(error):
         if _wants_json():
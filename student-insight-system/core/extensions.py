@@ -5,7 +5,7 @@ Every extension is created here *without* an app, then bound later
 inside the application factory via ``init_app()``.
 
 Import from here — never instantiate extensions elsewhere:
-    from core.extensions import db, jwt, migrate, cors
+    from core.extensions import db, jwt, migrate, cors, worker_pool, ai_worker_pool
 """
 
 from flask_sqlalchemy import SQLAlchemy
@@ -13,7 +13,12 @@ from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 from flask_cors import CORS
 
-db = SQLAlchemy()
+from core.db_routing import RoutingSession
+from core.workers import WorkerPool
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 jwt = JWTManager()
 migrate = Migrate()
 cors = CORS()
+worker_pool = WorkerPool()
+ai_worker_pool = WorkerPool(name="ai_worker", size_setting="AI_WORKER_POOL_SIZE", default_size=2)
@@ -0,0 +1,100 @@
+"""
+Request-scoped identity resolution — the signed-in user's profile, loaded once.
+
+Most handlers turn the JWT identity into a StudentProfile / TeacherProfile,
+and the services they call used to do it again. The profile is now
+resolved at most once per request and kept on ``flask.g``; every later
+lookup for the same user is answered from there.
+
+Register in app factory:
+    from core.identity import register_identity
+    register_identity(app)
+
+Usage:
+    from core.identity import current_student, current_teacher
+    student = current_student()        # StudentProfile or None
+    teacher = current_teacher()        # TeacherProfile or None
+
+Services take either a user id or an already-resolved profile:
+    student = load_student(user_id_or_profile)
+
+Outside a request (workers, CLI) nothing is cached and each call queries.
+"""
+
+from flask import g, has_request_context
+from flask_jwt_extended import get_jwt_identity
+
+from models import StudentProfile, TeacherProfile
+
+_CACHE_ATTR = "_identity_profiles"
+
+
+def _cache():
+    if not has_request_context():
+        return None
+    cache = g.get(_CACHE_ATTR)
+    if cache is None:
+        cache = {}
+        setattr(g, _CACHE_ATTR, cache)
+    return cache
+
+
+def _load(model, user):
+    """``model`` row for ``user`` (a user id or an instance of ``model``), or None."""
+    if isinstance(user, model):
+        return user
+    try:
+        user_id = int(user)
+    except (ValueError, TypeError):
+        return None
+
+    cache = _cache()
+    key = (model.__name__, user_id)
+    if cache is not None and key in cache:
+        return cache[key]
+    profile = model.query.filter_by(user_id=user_id).first()
+    # Misses are not cached: a profile may be created later in the request.
+    if cache is not None and profile is not None:
+        cache[key] = profile
+    return profile
+
+
+def load_student(user):
+    """StudentProfile for a user id (or pass-through of a StudentProfile)."""
+    return _load(StudentProfile, user)
+
+
+def load_teacher(user):
+    """TeacherProfile for a user id (or pass-through of a TeacherProfile)."""
+    return _load(TeacherProfile, user)
+
+
+def current_student():
+    """StudentProfile of the JWT identity of this request, or None."""
+    return load_student(get_jwt_identity())
+
+
+def current_teacher():
+    """TeacherProfile of the JWT identity of this request, or None."""
+    return load_teacher(get_jwt_identity())
+
+
+def forget_profiles():
+    """Drop cached profiles (e.g. after the profile row is deleted)."""
+    if has_request_context():
+        g.pop(_CACHE_ATTR, None)
+
+
+PROFILE_LOADERS = {
+    "student": current_student,
+    "teacher": current_teacher,
+}
+
+
+def register_identity(app):
+    """Start every request with an empty profile cache.
+
+    ``g`` belongs to the app context, which an outer context (tests, CLI)
+    may keep alive across requests.
+    """
+    app.before_request(forget_profiles)
@@ -0,0 +1,114 @@
+"""
+Keyset (cursor) pagination helpers.
+
+OFFSET pagination re-scans every skipped row and shifts when rows are
+inserted or resolved mid-scroll. A keyset page instead continues
+*after* the last row the client saw — ``WHERE (created_at, id) < (:c, :i)``
+— which an index on the sort columns answers with a seek, so page 50
+costs the same as page 1 and concurrent changes never skip or repeat rows.
+
+Cursors are opaque to clients: URL-safe base64 of the last row's sort key.
+
+Usage:
+    page = keyset_page(
+        query, [StudentAlert.created_at, StudentAlert.id],
+        cursor=request.args.get("cursor"), limit=20,
+    )
+    page.items, page.next_cursor, page.has_next
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import func, literal, tuple_
+
+from core.errors import ValidationError
+
+MAX_PAGE_SIZE = 100
+
+
+class KeysetPage:
+    """One page of rows plus the cursor for the next one (None on the last page)."""
+
+    def __init__(self, items, next_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(values) -> str:
+    payload = [v.isoformat() if isinstance(v, (datetime, date)) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, columns) -> list:
+    """Decode a cursor back into typed values for ``columns``; ValidationError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise ValueError("wrong arity")
+        return [_parse(value, column) for value, column in zip(payload, columns)]
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise ValidationError("Invalid pagination cursor")
+
+
+def page_size(value, default=20) -> int:
+    """Clamp a client-supplied page size to 1..MAX_PAGE_SIZE."""
+    try:
+        size = int(value) if value not in (None, "") else default
+    except (TypeError, ValueError):
+        raise ValidationError("limit must be an integer")
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def keyset_page(query, columns, cursor=None, limit=20, descending=True,
+                row_key=None) -> KeysetPage:
+    """One page of ``query`` ordered by ``columns`` (all non-null, last one unique).
+
+    ``row_key(row)`` returns the sort values of a result row; by default
+    they are read as attributes named after the columns. ``limit=None``
+    returns every remaining row as a single, last page.
+    """
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        key = tuple_(*columns)
+        after = tuple_(*(literal(v, c.type) for v, c in zip(values, columns)))
+        query = query.filter(key < after if descending else key > after)
+    order = [c.desc() if descending else c.asc() for c in columns]
+    if limit is None:
+        return KeysetPage(query.order_by(*order).all())
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        values = row_key(last) if row_key else [getattr(last, c.key) for c in columns]
+        next_cursor = encode_cursor(values)
+    return KeysetPage(rows, next_cursor)
+
+
+def capped_count(query, cap) -> tuple[int, bool]:
+    """``(count, exact)`` — counts at most ``cap`` rows so large totals stay cheap."""
+    limited = query.order_by(None).limit(cap + 1).subquery()
+    count = query.session.query(func.count()).select_from(limited).scalar()
+    return min(count, cap), count <= cap
+
+
+def _parse(value, column):
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is float and isinstance(value, int):
+        return float(value)
+    if not isinstance(value, python_type):
+        raise TypeError("cursor value has the wrong type")
+    return value
@@ -0,0 +1,66 @@
+"""
+Optional background preload of heavy, lazily imported modules.
+
+numpy (career matrix, GPA forecasts) and google-generativeai (Gemini
+client) are imported on first use so that web workers boot quickly. With
+``PRELOAD_HEAVY_MODULES`` enabled, a daemon thread imports them right
+after startup instead — in every forked worker too — so the first request
+that needs them does not pay the import cost either.
+
+Register in app factory:
+    from core.preload import register_preload
+    register_preload(app)
+"""
+
+import importlib
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODULES = ("numpy", "ml.analytics_engine", "google.generativeai")
+
+_fork_hook_installed = False
+
+
+def preload_modules(modules) -> None:
+    """Import ``modules`` one by one; missing optional packages are skipped."""
+    for name in modules:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            logger.warning("Preload skipped: %s is not installed", name)
+            continue
+        except Exception:
+            logger.exception("Preload of %s failed", name)
+            continue
+        logger.debug("Preloaded %s in %.0f ms", name, (time.perf_counter() - started) * 1000)
+
+
+def start_preload(modules) -> threading.Thread:
+    thread = threading.Thread(
+        target=preload_modules, args=(modules,), name="module-preload", daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def register_preload(app) -> None:
+    """Start the preload now and again in each child after ``fork()``."""
+    global _fork_hook_installed
+
+    if not app.config.get("PRELOAD_HEAVY_MODULES"):
+        return
+    modules = tuple(app.config.get("PRELOAD_MODULES") or DEFAULT_MODULES)
+    if app.config.get("AI_PROVIDER", "gemini") != "gemini":
+        modules = tuple(m for m in modules if m != "google.generativeai")
+
+    # A pre-forking server (gunicorn --preload) may fork before the import
+    # thread finishes; threads do not survive fork, so children start over.
+    if not _fork_hook_installed and hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=lambda: start_preload(modules))
+        _fork_hook_installed = True
+    start_preload(modules)
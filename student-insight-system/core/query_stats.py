@@ -0,0 +1,195 @@
+"""
+Per-request SQL instrumentation — query count, DB time and N+1 detection.
+
+Every statement executed while a request (or an explicit ``collect()``
+block) is active is timed and fingerprinted: literals and bind markers
+are normalised and ``IN (?, ?, ...)`` lists collapsed, so a loop that
+loads one row per iteration shows up as the same fingerprint repeated.
+When a fingerprint reaches ``QUERY_REPEAT_THRESHOLD`` executions the
+request is flagged as a likely N+1, with the application frame that
+issued it.
+
+At the end of the request a summary goes to the log (tagged with the
+request id from ``core.logging_config``) and, outside production, to a
+``Server-Timing`` header so browser dev tools show it next to the
+request:
+
+    Server-Timing: db;dur=12.4;desc="9 queries"
+
+Register in app factory:
+    from core.query_stats import register_query_stats
+    register_query_stats(app)
+
+Usage outside a request (tests, CLI):
+    with collect() as stats:
+        DashboardService.get_dashboard_data(user_id)
+    stats.count, stats.total_ms, stats.repeated()
+"""
+
+import contextvars
+import logging
+import os
+import re
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEAT_THRESHOLD = 5
+
+_current = contextvars.ContextVar("query_stats", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def fingerprint(statement: str) -> str:
+    """Normalise ``statement`` so executions differing only in values compare equal."""
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING.sub("?", sql)
+    sql = _NAMED_PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    return _PARAM_LIST.sub("(?)", sql)
+
+
+def _call_site():
+    """``file:line in function`` of the innermost project frame outside this module."""
+    for frame in reversed(traceback.extract_stack()[:-2]):
+        path = os.path.abspath(frame.filename)
+        if (path.startswith(_PROJECT_ROOT) and path != os.path.abspath(__file__)
+                and "site-packages" not in path):
+            return f"{os.path.relpath(path, _PROJECT_ROOT)}:{frame.lineno} in {frame.name}"
+    return "?"
+
+
+class QueryStats:
+    """Counters for the statements of one request."""
+
+    def __init__(self, repeat_threshold=DEFAULT_REPEAT_THRESHOLD):
+        self.repeat_threshold = repeat_threshold
+        self.count = 0
+        self.total_ms = 0.0
+        self.pool_wait_ms = 0.0  # waiting for a pooled connection (core/db_engine.py)
+        self.fingerprints = Counter()
+        self.call_sites = {}
+
+    def record(self, statement, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        fp = fingerprint(statement)
+        self.fingerprints[fp] += 1
+        if self.fingerprints[fp] == self.repeat_threshold:
+            self.call_sites[fp] = _call_site()
+
+    def repeated(self):
+        """``[(fingerprint, count, call_site)]`` at or above the threshold, most frequent first."""
+        return [
+            (fp, n, self.call_sites.get(fp, "?"))
+            for fp, n in self.fingerprints.most_common()
+            if n >= self.repeat_threshold
+        ]
+
+    def server_timing(self) -> str:
+        value = f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+        if self.pool_wait_ms:
+            value += f", db-pool;dur={self.pool_wait_ms:.1f}"
+        return value
+
+
+@contextmanager
+def collect(repeat_threshold=DEFAULT_REPEAT_THRESHOLD):
+    """Record every statement executed in this context into a fresh QueryStats."""
+    stats = QueryStats(repeat_threshold)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def current():
+    """The QueryStats being recorded in this context, or None."""
+    return _current.get()
+
+
+# ── Engine events ─────────────────────────────────────────────
+# Registered on the Engine class so every engine (and bind) is covered;
+# statements outside a recording context cost one ContextVar lookup.
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_stats_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = conn.info.get("query_stats_started")
+    if stats is None or not started:
+        return
+    stats.record(statement, (time.perf_counter() - started.pop()) * 1000)
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_failed_statement(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_stats_started"):
+        connection.info["query_stats_started"].pop()
+
+
+# ── Request hooks ─────────────────────────────────────────────
+
+def register_query_stats(app):
+    """Record statements per request; log the summary and flag N+1 patterns."""
+    if not app.config.get("QUERY_STATS_ENABLED", True):
+        return
+    threshold = int(app.config.get("QUERY_REPEAT_THRESHOLD", DEFAULT_REPEAT_THRESHOLD))
+    server_timing = app.config.get("QUERY_SERVER_TIMING", False)
+
+    @app.before_request
+    def start_query_stats():
+        g.query_stats = QueryStats(threshold)
+        g.query_stats_token = _current.set(g.query_stats)
+
+    @app.after_request
+    def report_query_stats(response):
+        stats = g.get("query_stats")
+        if stats is None:
+            return response
+        repeated = stats.repeated()
+        for fp, n, site in repeated:
+            logger.warning(
+                "Possible N+1: %d× %s | at %s | request_id=%s path=%s",
+                n, fp[:200], site, g.get("request_id", "-"), request.path,
+            )
+        logger.info(
+            "sql queries=%d db_ms=%.1f pool_wait_ms=%.1f repeated=%d path=%s",
+            stats.count, stats.total_ms, stats.pool_wait_ms, len(repeated), request.path,
+        )
+        if server_timing:
+            existing = response.headers.get("Server-Timing")
+            value = stats.server_timing()
+            response.headers["Server-Timing"] = f"{existing}, {value}" if existing else value
+        return response
+
+    @app.teardown_request
+    def stop_query_stats(exc):
+        token = g.pop("query_stats_token", None)
+        if token is not None:
+            try:
+                _current.reset(token)
+            except ValueError:
+                # Token from another context (streamed response); just clear it.
+                _current.set(None)
@@ -10,6 +10,8 @@ from functools import wraps
 from flask import request, redirect, url_for, jsonify, abort
 from flask_jwt_extended import verify_jwt_in_request, get_jwt
 
+from core.identity import PROFILE_LOADERS
+
 
 # ── JWT Error Handlers ────────────────────────────────────────────
 
@@ -49,10 +51,14 @@ def register_jwt_handlers(jwt):
 
 # ── Role Enforcement Decorator ────────────────────────────────────
 
-def require_role(*allowed_roles):
+def require_role(*allowed_roles, preload=False):
     """
     Decorator that enforces JWT authentication AND role membership.
 
+    With ``preload=True`` the caller's profile (StudentProfile for students,
+    TeacherProfile for teachers) is resolved up front and cached for the
+    request — see ``core.identity``.
+
     Usage:
         @app.route("/student/dashboard")
         @require_role("student")
@@ -63,6 +69,10 @@ def require_role(*allowed_roles):
         @require_role("teacher", "admin")
         def admin_panel():
             ...
+
+        @require_role("student", preload=True)
+        def api_state():
+            student = current_student()     # no extra query
     """
     def decorator(fn):
         @wraps(fn)
@@ -74,6 +84,8 @@ def require_role(*allowed_roles):
                 if _is_browser_request():
                     abort(403)
                 return jsonify({"msg": "Access denied"}), 403
+            if preload and role in PROFILE_LOADERS:
+                PROFILE_LOADERS[role]()
             return fn(*args, **kwargs)
         return wrapper
     return decorator
@@ -0,0 +1,178 @@
+"""
+Fingerprinted static assets — content-hashed URLs, cached for a year.
+
+``flask build-assets`` copies every file under ``static/`` (except user
+uploads) to ``static/dist/`` under a name containing a hash of its
+content, e.g. ``css/ui_alerts.css`` → ``css/ui_alerts.3f9c1a7e52d0b4c8.css``,
+writes gzip and brotli copies of the text assets next to it, and records
+the mapping in ``static/dist/manifest.json``.
+
+At runtime the manifest is loaded once, and ``url_for('static', ...)``
+returns the fingerprinted URL — templates don't change. Since a URL only
+ever serves one content, fingerprinted files are sent with
+``Cache-Control: public, max-age=31536000, immutable``; a changed file
+gets a new URL with the next build. The precompressed copy matching the
+request's ``Accept-Encoding`` is served as is (no compression per
+request).
+
+Without a manifest (or with ``STATIC_ASSETS_ENABLED`` off, the
+development default) URLs and caching are unchanged, so edits to CSS and
+JS show up on reload.
+
+Old fingerprints are kept on rebuild: pages rendered by the previous
+release still load their assets during a rolling deploy.
+
+Register in app factory:
+    from core.static_assets import static_assets
+    static_assets.init_app(app)
+
+Build (part of the deploy, after installing requirements):
+    flask build-assets
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+
+from flask import request, send_from_directory
+
+try:
+    import brotli
+except ImportError:  # gzip only; brotli ships with requirements/prod.txt
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+URL_PREFIX = "dist/"
+MANIFEST_NAME = "manifest.json"
+ONE_YEAR = 365 * 24 * 3600
+HASH_LENGTH = 16
+
+# Never fingerprinted: user uploads change in place, dist/ is the output.
+EXCLUDED_DIRS = {"uploads", "dist"}
+COMPRESSIBLE = {".css", ".js", ".svg", ".json", ".map", ".txt", ".html", ".ico"}
+# Preferred first when the client accepts several.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _fingerprinted_name(path, digest):
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{digest[:HASH_LENGTH]}{ext}"
+
+
+def _compress(data):
+    yield "gzip", gzip.compress(data, compresslevel=9, mtime=0)
+    if brotli is not None:
+        yield "br", brotli.compress(data, quality=11)
+
+
+def build_assets(source_dir, output_dir) -> dict:
+    """Fingerprint and precompress ``source_dir`` into ``output_dir``; return the manifest."""
+    manifest = {"assets": {}, "encodings": {}}
+    for root, dirs, files in os.walk(source_dir):
+        if os.path.abspath(root) == os.path.abspath(source_dir):
+            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        dirs.sort()
+        for name in sorted(files):
+            if name.startswith("."):
+                continue
+            source = os.path.join(root, name)
+            logical = os.path.relpath(source, source_dir).replace(os.sep, "/")
+            with open(source, "rb") as fh:
+                data = fh.read()
+            hashed = _fingerprinted_name(logical, hashlib.sha256(data).hexdigest())
+            target = os.path.join(output_dir, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+            manifest["assets"][logical] = hashed
+
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE:
+                continue
+            encodings = []
+            for encoding, compressed in _compress(data):
+                if len(compressed) < len(data):
+                    suffix = dict(ENCODINGS)[encoding]
+                    with open(target + suffix, "wb") as fh:
+                        fh.write(compressed)
+                    encodings.append(encoding)
+            if encodings:
+                manifest["encodings"][hashed] = encodings
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w") as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+    return manifest
+
+
+class StaticAssets:
+    """Maps logical static paths to their fingerprinted files and serves those."""
+
+    def __init__(self, app=None):
+        self.directory = None
+        self.assets = {}
+        self.encodings = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.directory = app.config.get("STATIC_ASSETS_DIR") or os.path.join(app.static_folder, "dist")
+        app.url_defaults(self._fingerprint_url)
+        plain = app.view_functions["static"]
+        app.view_functions["static"] = lambda filename: self._serve(filename, plain)
+        app.extensions["static_assets"] = self
+
+        if app.config.get("STATIC_ASSETS_ENABLED", True):
+            if not self.load(self.directory):
+                logger.warning("No static asset manifest in %s; run `flask build-assets`", self.directory)
+
+    def load(self, directory) -> bool:
+        """Use the manifest in ``directory``; False (nothing fingerprinted) if there is none."""
+        path = os.path.join(directory, MANIFEST_NAME)
+        try:
+            with open(path) as fh:
+                manifest = json.load(fh)
+        except FileNotFoundError:
+            self.directory, self.assets, self.encodings = directory, {}, {}
+            return False
+        self.directory = directory
+        self.assets = manifest.get("assets", {})
+        self.encodings = manifest.get("encodings", {})
+        logger.info("Loaded %d fingerprinted static assets from %s", len(self.assets), path)
+        return True
+
+    def _fingerprint_url(self, endpoint, values):
+        if endpoint == "static":
+            hashed = self.assets.get(values.get("filename"))
+            if hashed:
+                values["filename"] = URL_PREFIX + hashed
+
+    def _serve(self, filename, plain):
+        if not filename.startswith(URL_PREFIX) or not self.directory:
+            return plain(filename=filename)
+
+        path = filename[len(URL_PREFIX):]
+        mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        encoding = self._negotiate(path)
+        suffix = dict(ENCODINGS)[encoding] if encoding else ""
+        response = send_from_directory(self.directory, path + suffix, mimetype=mimetype, max_age=ONE_YEAR)
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        if path in self.encodings:
+            response.vary.add("Accept-Encoding")
+        if encoding:
+            response.content_encoding = encoding
+        return response
+
+    def _negotiate(self, path):
+        available = self.encodings.get(path, ())
+        for encoding, _ in ENCODINGS:
+            if encoding in available and request.accept_encodings[encoding]:
+                return encoding
+        return None
+
+
+static_assets = StaticAssets()
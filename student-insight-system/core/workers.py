@@ -0,0 +1,100 @@
+"""
+In-process background worker pool.
+
+Runs callables on a thread pool inside a fresh application context, so
+background code can use ``db.session`` exactly like request code.
+
+Register in app factory:
+    from core.extensions import worker_pool
+    worker_pool.init_app(app)
+
+Submit work from anywhere inside an app context:
+    worker_pool.submit(recalculate_weekly_update, student_id)
+
+``WORKER_POOL_SIZE = 0`` runs every task inline in the caller's thread
+(used by the test config, where the in-memory SQLite database cannot be
+shared across threads).
+
+Slow AI calls run on a separate pool, ``ai_worker_pool``
+(``AI_WORKER_POOL_SIZE`` threads), so a burst of insight reports can't
+occupy every thread the recalculation queue needs.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPool:
+    """Thread pool bound to a Flask app; created lazily per process."""
+
+    def __init__(self, app=None, name="worker", size_setting="WORKER_POOL_SIZE", default_size=4):
+        self.name = name
+        self.size_setting = size_setting
+        self.default_size = default_size
+        self._app = None
+        self._size = 0
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self._app = app
+        self._size = int(app.config.get(self.size_setting, self.default_size))
+        app.extensions[f"{self.name}_pool"] = self
+
+    @property
+    def is_inline(self) -> bool:
+        """True when tasks run synchronously in the submitting thread."""
+        return self._size <= 0
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Schedule ``fn(*args, **kwargs)`` and return its Future."""
+        if self.is_inline:
+            future = Future()
+            try:
+                if has_app_context():
+                    future.set_result(fn(*args, **kwargs))
+                else:
+                    with self._app.app_context():
+                        future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                logger.exception("Inline task %s failed", getattr(fn, "__name__", fn))
+                future.set_exception(e)
+            return future
+
+        return self._get_executor().submit(self._run_in_context, fn, args, kwargs)
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+    # ── internals ──
+
+    def _get_executor(self):
+        # Executors do not survive fork(): rebuild one per worker process.
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._size, thread_name_prefix=f"sis-{self.name}"
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _run_in_context(self, fn, args, kwargs):
+        app = self._app or current_app._get_current_object()
+        with app.app_context():
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                logger.exception("Background task %s failed", getattr(fn, "__name__", fn))
+                raise
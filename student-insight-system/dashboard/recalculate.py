@@ -1,6 +1,8 @@
 """
 Recalculation engine: rebuilds the current week's WeeklyUpdate from live data.
-Called after every save (study session, check-in, grade input, goal change).
+Runs after every save (study session, check-in, grade input, goal change),
+via the coalescing background queue in services/recalc_queue.py.
+Also refreshes the student's materialised dashboard snapshot.
 
 Improvements integrated:
   1. Skill Match & Proficiency – primary-goal skill overlap weighted by proficiency
@@ -144,6 +146,9 @@ def recalculate_weekly_update(student_id):
         update.status_label = 'At Risk'
 
     db.session.commit()
+
+    from services.dashboard_service import DashboardService
+    DashboardService.refresh_snapshot(student)
     return update
 
 
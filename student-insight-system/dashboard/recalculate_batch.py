@@ -0,0 +1,288 @@
+"""
+Cohort-wide weekly recalculation — the vectorised twin of
+dashboard.recalculate.recalculate_weekly_update().
+
+Instead of ~8 queries per student, the whole cohort is loaded with a
+handful of set-based queries, every formula is evaluated over NumPy
+arrays, and the results are written back with one bulk UPDATE (existing
+rows for this week) plus one bulk INSERT (students without a row yet).
+
+Any change to the per-student formulas MUST be mirrored here;
+tests/test_recalculate_batch.py checks that both paths agree.
+
+Usage:
+    flask recalc-week
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import func, insert, update
+
+from core.data_version import bump_data_version
+from models import (
+    db, StudentProfile, StudySession, WeeklyUpdate, StudentGoal,
+    StudentSkill, CareerRequiredSkill, StudentAcademicRecord, CourseCatalog,
+    Skill, StudentDashboardSnapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+DIFFICULTY_FACTORS = {'Easy': 0.02, 'Medium': 0.10, 'Hard': 0.20}
+COURSE_TYPE_MULTIPLIERS = {'Core': 1.5, 'Elective': 0.8, 'GED': 1.0}
+
+
+def recalculate_all_weekly_updates(today=None) -> dict:
+    """
+    Recompute the current week's WeeklyUpdate for every student.
+
+    Returns a summary dict: {"students", "updated", "inserted", "week_start"}.
+    """
+    today = today or datetime.utcnow().date()
+    week_start = today - timedelta(days=today.weekday())  # Monday
+    week_end = week_start + timedelta(days=6)
+    four_week_start = today - timedelta(days=28)
+
+    # ── Students ──
+    students = (
+        db.session.query(
+            StudentProfile.id, StudentProfile.target_cgpa, StudentProfile.current_cgpa,
+        )
+        .order_by(StudentProfile.id)
+        .all()
+    )
+    n = len(students)
+    if n == 0:
+        return {"students": 0, "updated": 0, "inserted": 0, "week_start": week_start}
+
+    ids = np.array([s.id for s in students], dtype=np.int64)
+    index = {sid: i for i, sid in enumerate(ids.tolist())}
+    target = np.array([s.target_cgpa or 3.5 for s in students], dtype=float)
+    fallback_cgpa = np.array([s.current_cgpa or 0 for s in students], dtype=float)
+
+    # ── Existing rows for this week (user-submitted fields are preserved) ──
+    existing = (
+        db.session.query(
+            WeeklyUpdate.id, WeeklyUpdate.student_id, WeeklyUpdate.productivity_rating,
+            WeeklyUpdate.mood_score, WeeklyUpdate.difficulty_rating,
+        )
+        .filter(WeeklyUpdate.week_start_date == week_start)
+        .order_by(WeeklyUpdate.id)
+        .all()
+    )
+    update_id = [None] * n
+    productivity = np.full(n, 3.0)
+    mood = np.full(n, 3.0)
+    diff_factor = np.full(n, DIFFICULTY_FACTORS['Medium'])
+    for row in existing:
+        i = index.get(row.student_id)
+        if i is None or update_id[i] is not None:
+            continue  # keep the first row, like .first() does
+        update_id[i] = row.id
+        productivity[i] = row.productivity_rating or 3
+        mood[i] = row.mood_score or 3
+        diff_factor[i] = DIFFICULTY_FACTORS.get(row.difficulty_rating or 'Medium', 0.10)
+
+    # ── Study sessions: one row per (student, day) ──
+    day_rows = (
+        db.session.query(
+            StudySession.student_id,
+            StudySession.date,
+            func.sum(StudySession.duration_minutes).label("minutes"),
+        )
+        .filter(
+            StudySession.date >= min(four_week_start, week_start),
+            StudySession.date <= max(today, week_end),
+        )
+        .group_by(StudySession.student_id, StudySession.date)
+        .all()
+    )
+    sess_idx = np.array([index.get(r.student_id, -1) for r in day_rows], dtype=np.int64)
+    sess_ord = np.array([r.date.toordinal() for r in day_rows], dtype=np.int64)
+    sess_min = np.array([int(r.minutes or 0) for r in day_rows], dtype=np.int64)
+    known = sess_idx >= 0
+    sess_idx, sess_ord, sess_min = sess_idx[known], sess_ord[known], sess_min[known]
+
+    in_week = (sess_ord >= week_start.toordinal()) & (sess_ord <= week_end.toordinal())
+    in_28 = (sess_ord >= four_week_start.toordinal()) & (sess_ord <= today.toordinal())
+
+    week_minutes = np.bincount(sess_idx[in_week], weights=sess_min[in_week], minlength=n)
+    week_days = np.bincount(sess_idx[in_week], minlength=n)
+    minutes_28 = np.bincount(sess_idx[in_28], weights=sess_min[in_28], minlength=n)
+    days_28 = np.bincount(sess_idx[in_28], minlength=n)
+
+    # ── Signal A inputs: weighted CGPA ──
+    adjusted_cgpa = _weighted_cgpa(index, n, fallback_cgpa)
+
+    # ── Signal E inputs: skill proficiency vs primary goal ──
+    skill_signal = _skill_signals(index, n)
+
+    # ══ Formulas (mirror recalculate_weekly_update) ══
+    hours = np.array([round(float(m) / 60, 1) for m in week_minutes])
+    consistency_score = week_days / 7
+
+    hours_factor = np.minimum(hours / 30, 1.0) * 0.35
+    prod_factor = (1 - (productivity - 1) / 4) * 0.25
+    mood_factor = (1 - (mood - 1) / 4) * 0.2
+    burnout = np.minimum(hours_factor + prod_factor + diff_factor + mood_factor, 1.0)
+
+    safe_target = np.where(target > 0, target, 1.0)
+    cgpa_signal = np.where(target > 0, np.minimum(adjusted_cgpa / safe_target, 1.0), 0.5)
+    avg_weekly_hours = minutes_28 / 60 / 4
+    effort_signal = np.where(avg_weekly_hours > 0, np.minimum(avg_weekly_hours / 25, 1.0), 0)
+    perf_signal = ((productivity - 1) / 4 + (mood - 1) / 4) / 2
+    consistency_signal = np.array([round(float(d) / 28, 2) for d in days_28])
+
+    raw_prob = (
+        cgpa_signal       * 0.20 +
+        effort_signal     * 0.20 +
+        perf_signal       * 0.25 +
+        consistency_signal * 0.15 +
+        skill_signal      * 0.20
+    )
+    goal_prob = np.minimum(np.maximum(raw_prob - burnout * 0.15, 0.05), 1.0)
+
+    weekly_perf = (
+        (productivity - 1) / 4 * 0.35 +
+        (mood - 1) / 4 * 0.20 +
+        (1 - diff_factor) * 0.15 +
+        consistency_signal * 0.15 +
+        np.minimum(hours / 20, 1.0) * 0.15
+    )
+    health_score = goal_prob * 0.40 + weekly_perf * 0.60
+    status = np.where(
+        health_score >= 0.55, 'On Track',
+        np.where(health_score >= 0.35, 'Needs Attention', 'At Risk'),
+    )
+
+    # ── Bulk write ──
+    updates, inserts = [], []
+    for i in range(n):
+        values = {
+            "total_hours_studied": float(hours[i]),
+            "consistency_score": round(float(consistency_score[i]), 2),
+            "burnout_risk_score": round(float(burnout[i]), 2),
+            "goal_achievability_prob": round(float(goal_prob[i]), 2),
+            "status_label": str(status[i]),
+        }
+        if update_id[i] is not None:
+            updates.append({"id": update_id[i], **values})
+        else:
+            inserts.append({
+                "student_id": int(ids[i]),
+                "week_start_date": week_start,
+                "created_at": datetime.utcnow(),
+                **values,
+            })
+
+    if updates:
+        db.session.execute(update(WeeklyUpdate), updates)
+    if inserts:
+        db.session.execute(insert(WeeklyUpdate), inserts)
+    bump_data_version(ids.tolist())
+    # Every dashboard depends on the latest WeeklyUpdate — rebuild lazily.
+    StudentDashboardSnapshot.query.update({"is_stale": True}, synchronize_session=False)
+    db.session.commit()
+
+    logger.info(
+        "Cohort recalculation for week %s: %d students (%d updated, %d inserted)",
+        week_start, n, len(updates), len(inserts),
+    )
+    return {
+        "students": n,
+        "updated": len(updates),
+        "inserted": len(inserts),
+        "week_start": week_start,
+    }
+
+
+def _weighted_cgpa(index, n, fallback_cgpa):
+    """Vectorised _calc_weighted_cgpa() for every student."""
+    rows = (
+        db.session.query(
+            StudentAcademicRecord.student_id,
+            StudentAcademicRecord.grade_point,
+            CourseCatalog.credit_value,
+            CourseCatalog.course_type,
+        )
+        .join(CourseCatalog, StudentAcademicRecord.course_id == CourseCatalog.id)
+        .filter(StudentAcademicRecord.grade_point.isnot(None))
+        .order_by(StudentAcademicRecord.id)
+        .all()
+    )
+    rec_idx = np.array([index.get(r.student_id, -1) for r in rows], dtype=np.int64)
+    grade_point = np.array([r.grade_point for r in rows], dtype=float)
+    credits = np.array([r.credit_value or 3 for r in rows], dtype=float)
+    mult = np.array([COURSE_TYPE_MULTIPLIERS.get(r.course_type, 1.0) for r in rows], dtype=float)
+    known = rec_idx >= 0
+
+    weighted_points = np.bincount(
+        rec_idx[known], weights=(grade_point * credits * mult)[known], minlength=n
+    )
+    weighted_credits = np.bincount(
+        rec_idx[known], weights=(credits * mult)[known], minlength=n
+    )
+    has_credits = weighted_credits != 0
+    ratio = np.divide(
+        weighted_points, weighted_credits,
+        out=np.zeros(n), where=has_credits,
+    )
+    rounded = np.array([round(float(x), 2) for x in ratio])
+    return np.where(has_credits, rounded, fallback_cgpa)
+
+
+def _skill_signals(index, n):
+    """Vectorised _calc_skill_signal() for every student (0.5 when undefined)."""
+    signal = np.full(n, 0.5)
+
+    primary_rows = (
+        db.session.query(StudentGoal.student_id, func.min(StudentGoal.id))
+        .filter(StudentGoal.is_primary == True)  # noqa: E712
+        .group_by(StudentGoal.student_id)
+        .all()
+    )
+    if not primary_rows:
+        return signal
+    goal_ids = [goal_id for _, goal_id in primary_rows]
+    career_by_student = {
+        sid: career_id
+        for sid, career_id in (
+            db.session.query(StudentGoal.student_id, StudentGoal.career_id)
+            .filter(StudentGoal.id.in_(goal_ids))
+            .all()
+        )
+        if career_id
+    }
+    if not career_by_student:
+        return signal
+
+    required = defaultdict(set)
+    for career_id, skill_name in (
+        db.session.query(CareerRequiredSkill.career_id, Skill.skill_name)
+        .join(Skill, CareerRequiredSkill.skill_id == Skill.id)
+        .filter(CareerRequiredSkill.career_id.in_(set(career_by_student.values())))
+        .all()
+    ):
+        required[career_id].add(skill_name.lower().strip())
+
+    matched = defaultdict(int)
+    for student_id, skill_name, proficiency in (
+        db.session.query(
+            StudentSkill.student_id, StudentSkill.skill_name, StudentSkill.proficiency_score,
+        )
+        .filter(StudentSkill.student_id.in_(list(career_by_student.keys())))
+        .all()
+    ):
+        names = required.get(career_by_student[student_id])
+        if names and skill_name.lower().strip() in names:
+            matched[student_id] += proficiency or 0
+
+    for student_id, career_id in career_by_student.items():
+        i = index.get(student_id)
+        names = required.get(career_id)
+        if i is None or not names:
+            continue
+        signal[i] = min(matched[student_id] / (len(names) * 100), 1.0)
+    return signal
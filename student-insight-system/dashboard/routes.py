@@ -5,14 +5,17 @@ All business logic has been extracted into the services/ package.
 Each handler: validates input → calls service → returns response.
 """
 
+import json
 import os
 from flask import (
     Blueprint, render_template, jsonify, request,
-    redirect, url_for, current_app,
+    redirect, url_for, current_app, Response, stream_with_context,
 )
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+from core.data_version import bump_data_version, student_etag
+from core.identity import current_student
 from core.security import require_role
-from core.errors import NotFoundError
+from core.errors import AppError, NotFoundError
 
 from services.dashboard_service import DashboardService
 from services.session_service import SessionService
@@ -21,6 +24,8 @@ from services.skill_service import SkillService
 from services.checkin_service import CheckinService
 from services.profile_service import ProfileService
 from services.analytics_service import AnalyticsService
+from infrastructure.ai.registry import ai_registry
+from services.career_matrix import career_matrix
 
 dashboard_bp = Blueprint("dashboard", __name__)
 
@@ -549,27 +554,77 @@ def create_profile():
 # AI INSIGHT REPORT
 # =============================================================
 
+def _insight_ai_service():
+    """AI service for insight reports, behind the response cache."""
+    ai_service = ai_registry.get(user_id=get_jwt_identity())
+
+    # Identical form inputs are answered from the response cache;
+    # a truthy "refresh" field forces a fresh generation.
+    from infrastructure.ai.cached_service import CachedAIService
+    refresh = request.values.get("refresh", "").lower() in ("1", "true", "yes")
+    return CachedAIService.from_config(ai_service, current_app.config, bypass=refresh)
+
+
 @dashboard_bp.route("/student/insight-report", methods=["GET", "POST"])
 @require_role("student")
 def student_insight_report():
     if request.method == "POST":
         user_id = get_jwt_identity()
 
-        # Get AI service from app config or create one
-        ai_service = current_app.config.get("AI_SERVICE")
-        if not ai_service:
-            from infrastructure.ai.gemini_service import GeminiAIService
-            api_key = current_app.config.get("GEMINI_API_KEY")
-            ai_service = GeminiAIService(api_key)
-
-        report_html = AnalyticsService.generate_insight_report(
-            user_id, dict(request.form), ai_service
+        # Generation runs on the worker pool; the browser polls the job.
+        job = AnalyticsService.enqueue_insight_report(
+            user_id, dict(request.form), _insight_ai_service()
         )
-        return jsonify({"success": True, "report": report_html})
+        job["status_url"] = url_for("dashboard.api_insight_job", job_id=job["job_id"])
+        return jsonify({"success": True, **job}), 202
 
     return render_template("student_insight_form.html")
 
 
+@dashboard_bp.route("/student/insight-report/stream", methods=["GET"])
+@require_role("student")
+def student_insight_report_stream():
+    """
+    Server-Sent Events: forwards report chunks as the AI produces them.
+    Form fields arrive as query parameters (EventSource can only GET).
+
+    Events:  message {"chunk": "..."} · done {"insight_id": N} · failed {"error": "..."}
+    """
+    user_id = get_jwt_identity()
+    form_data = request.args.to_dict()
+    ai_service = _insight_ai_service()
+
+    def _event(data, event=None):
+        prefix = f"event: {event}\n" if event else ""
+        return f"{prefix}data: {json.dumps(data)}\n\n"
+
+    def generate():
+        try:
+            for item in AnalyticsService.stream_insight_report(user_id, form_data, ai_service):
+                if isinstance(item, str):
+                    yield _event({"chunk": item})
+                else:
+                    yield _event({"insight_id": item.id if item else None}, "done")
+        except AppError as e:
+            yield _event({"error": e.message}, "failed")
+        except Exception:
+            current_app.logger.exception("Insight report stream failed")
+            yield _event({"error": "Failed to generate report"}, "failed")
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@dashboard_bp.route("/api/insight-jobs/<job_id>", methods=["GET"])
+@require_role("student")
+def api_insight_job(job_id):
+    user_id = get_jwt_identity()
+    return jsonify(AnalyticsService.get_insight_job(user_id, job_id))
+
+
 # =============================================================
 # SKILL TRACKING & ACTION PLAN API
 # =============================================================
@@ -590,7 +645,8 @@ def api_update_skill():
 
 
 @dashboard_bp.route("/api/skills/history", methods=["GET"])
-@require_role("student")
+@require_role("student", preload=True)
+@student_etag
 def api_get_skill_history():
     user_id = get_jwt_identity()
     data = SkillService.get_skill_history(user_id)
@@ -598,7 +654,8 @@ def api_get_skill_history():
 
 
 @dashboard_bp.route("/api/action-plans", methods=["GET"])
-@require_role("student")
+@require_role("student", preload=True)
+@student_etag
 def api_get_action_plans():
     user_id = get_jwt_identity()
     plans = SkillService.get_action_plans(user_id)
@@ -610,15 +667,10 @@ def api_get_action_plans():
 def api_generate_action_plan():
     user_id = get_jwt_identity()
 
-    ai_service = current_app.config.get("AI_SERVICE")
-    if not ai_service:
-        from infrastructure.ai.gemini_service import GeminiAIService
-        api_key = current_app.config.get("GEMINI_API_KEY")
-        if not api_key:
-            return jsonify({"success": False, "msg": "GEMINI_API_KEY not configured"}), 500
-        ai_service = GeminiAIService(api_key)
+    if not ai_registry.is_configured():
+        return jsonify({"success": False, "msg": "GEMINI_API_KEY not configured"}), 500
 
-    result = SkillService.generate_action_plan(user_id, ai_service)
+    result = SkillService.generate_action_plan(user_id, ai_registry.get(user_id=user_id))
     return jsonify(result)
 
 
@@ -756,6 +808,7 @@ def update_progress():
                     student_id=student.id, skill_name=s_name, proficiency_score=50,
                 ))
 
+    DashboardService.invalidate_snapshot(student.id)
     db.session.commit()
     return redirect(url_for('dashboard.student_dashboard'))
 
@@ -793,12 +846,11 @@ def change_password():
 
 
 @dashboard_bp.route("/api/student/settings/preferences", methods=["POST"])
-@require_role("student")
+@require_role("student", preload=True)
 def update_preferences():
-    from models import StudentSettings, StudentProfile
+    from models import StudentSettings
     from core.extensions import db
-    user_id = get_jwt_identity()
-    student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+    student = current_student()
     
     if not student.settings:
         student.settings = StudentSettings(student_id=student.id)
@@ -1010,16 +1062,15 @@ def delete_grade(record_id):
 # =============================================================
 
 @dashboard_bp.route("/api/gg/skill/add", methods=["POST"])
-@require_role("student")
+@require_role("student", preload=True)
 def api_gg_add_skill():
-    user_id = get_jwt_identity()
+    student = current_student()
     data = request.get_json(silent=True) or {}
     name = data.get("skill_name", "").strip()
     if not name:
         return jsonify({"ok": False, "msg": "Skill name required"}), 400
-    AcademicService.add_skill(user_id, name)
-    from models import StudentSkill, StudentProfile
-    student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+    AcademicService.add_skill(student, name)
+    from models import StudentSkill
     skills = StudentSkill.query.filter_by(student_id=student.id).all()
     return jsonify({
         "ok": True,
@@ -1028,12 +1079,11 @@ def api_gg_add_skill():
 
 
 @dashboard_bp.route("/api/gg/skill/<int:skill_id>/delete", methods=["POST"])
-@require_role("student")
+@require_role("student", preload=True)
 def api_gg_delete_skill(skill_id):
-    user_id = get_jwt_identity()
-    AcademicService.remove_skill(user_id, skill_id)
-    from models import StudentSkill, StudentProfile
-    student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+    student = current_student()
+    AcademicService.remove_skill(student, skill_id)
+    from models import StudentSkill
     skills = StudentSkill.query.filter_by(student_id=student.id).all()
     return jsonify({
         "ok": True,
@@ -1097,10 +1147,10 @@ def api_gg_save_target_cgpa():
 
 
 @dashboard_bp.route("/api/gg/grade/add", methods=["POST"])
-@require_role("student")
+@require_role("student", preload=True)
 def api_gg_add_grade():
     from schemas.academic import GradeInput
-    user_id = get_jwt_identity()
+    student = current_student()
     data = request.get_json(silent=True) or {}
     try:
         payload = GradeInput(
@@ -1112,28 +1162,24 @@ def api_gg_add_grade():
         )
     except Exception as e:
         return jsonify({"ok": False, "msg": str(e)}), 400
-    AcademicService.add_grade(user_id, payload)
-    from models import StudentProfile
-    student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+    AcademicService.add_grade(student, payload)
     return jsonify({"ok": True, "new_cgpa": student.current_cgpa})
 
 
 @dashboard_bp.route("/api/gg/grade/<int:record_id>/delete", methods=["POST"])
-@require_role("student")
+@require_role("student", preload=True)
 def api_gg_delete_grade(record_id):
-    user_id = get_jwt_identity()
-    AcademicService.delete_grade(user_id, record_id)
-    from models import StudentProfile
-    student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+    student = current_student()
+    AcademicService.delete_grade(student, record_id)
     return jsonify({"ok": True, "new_cgpa": student.current_cgpa})
 
 
 @dashboard_bp.route("/api/gg/state", methods=["GET"])
-@require_role("student")
+@require_role("student", preload=True)
+@student_etag(shared=[career_matrix.fingerprint])
 def api_gg_state():
     """Return full current state for Goals & Grades page (for re-render after actions)."""
-    user_id = get_jwt_identity()
-    data = AcademicService.get_goals_grades_data(user_id)
+    data = AcademicService.get_goals_grades_data(current_student())
     student = data["student"]
     return jsonify({
         "ok": True,
@@ -1162,13 +1208,12 @@ def api_gg_state():
 # =============================================================
 
 @dashboard_bp.route("/student/notifications")
-@require_role("student")
+@require_role("student", preload=True)
 def student_notifications():
     """Page: show all teacher notes received in the last 1 year."""
     from datetime import timedelta
-    from models import StudentNote, StudentProfile
-    user_id = get_jwt_identity()
-    student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+    from models import StudentNote
+    student = current_student()
     one_year_ago = __import__('datetime').datetime.utcnow() - timedelta(days=365)
     notes = (
         StudentNote.query
@@ -1184,13 +1229,13 @@ def student_notifications():
 
 
 @dashboard_bp.route("/api/student/notifications")
-@require_role("student")
+@require_role("student", preload=True)
+@student_etag
 def api_student_notifications():
     """JSON: return count and list of recent notes for the bell badge."""
     from datetime import timedelta
-    from models import StudentNote, StudentProfile
-    user_id = get_jwt_identity()
-    student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+    from models import StudentNote
+    student = current_student()
     one_year_ago = __import__('datetime').datetime.utcnow() - timedelta(days=365)
     notes = (
         StudentNote.query
@@ -1220,13 +1265,12 @@ def api_student_notifications():
 
 
 @dashboard_bp.route("/api/student/notifications/mark-read", methods=["POST"])
-@require_role("student")
+@require_role("student", preload=True)
 def api_mark_notes_read():
     """Mark specific notes as read for the current student."""
-    from models import StudentNote, StudentProfile
+    from models import StudentNote
     from core.extensions import db
-    user_id = get_jwt_identity()
-    student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+    student = current_student()
     body = request.get_json(silent=True) or {}
     note_ids = body.get("note_ids", [])
     if not note_ids:
@@ -1239,5 +1283,7 @@ def api_mark_notes_read():
         )
         .update({"is_read": True}, synchronize_session=False)
     )
+    if updated:
+        bump_data_version([student.id])
     db.session.commit()
     return jsonify({"updated": updated})
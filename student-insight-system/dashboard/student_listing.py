@@ -0,0 +1,132 @@
+"""
+Paged, sorted, sparse projections of a teacher's students.
+
+Backs ``GET /api/teacher/students``. Everything is evaluated in SQL and
+only the requested columns are selected — no ORM objects are built:
+
+    ?fields=id,name,cgpa         columns to return (id is always included)
+    ?sort=-cgpa                  cgpa | name | last_active | burnout, "-" = descending
+    ?limit=50&cursor=...         keyset pages; the next cursor is in X-Next-Cursor
+                                 (neither given: every row, unpaged, as before paging)
+    ?search=joh                  indexed search (ranked unless a sort is given)
+    ?class=..&section=..&status=..
+
+Rows without a value for the sort key (no CGPA, never active, no weekly
+update) always come last.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from core.errors import ValidationError
+from core.extensions import db
+from core.pagination import keyset_page, page_size
+from models import StudentProfile, TeacherAssignment, WeeklyUpdate
+from services.student_search import student_search
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def _latest_burnout():
+    return (
+        select(WeeklyUpdate.burnout_risk_score)
+        .where(WeeklyUpdate.student_id == StudentProfile.id)
+        .order_by(WeeklyUpdate.week_start_date.desc(), WeeklyUpdate.id.desc())
+        .limit(1)
+        .correlate(StudentProfile)
+        .scalar_subquery()
+    )
+
+
+FIELDS = {
+    "id":           lambda: StudentProfile.id,
+    "name":         lambda: StudentProfile.full_name,
+    "student_code": lambda: StudentProfile.student_code,
+    "department":   lambda: StudentProfile.department,
+    "class_level":  lambda: StudentProfile.class_level,
+    "section":      lambda: StudentProfile.section,
+    "cgpa":         lambda: StudentProfile.current_cgpa,
+    "status":       lambda: StudentProfile.performance_status,
+    "last_active":  lambda: StudentProfile.last_activity,
+    "burnout":      _latest_burnout,
+}
+DEFAULT_FIELDS = ("id", "name", "student_code", "class_level", "section", "cgpa", "status", "last_active")
+
+# sort name → (expression, value standing in for NULL when ascending, when descending)
+SORTS = {
+    "name":        (lambda: func.lower(StudentProfile.full_name), None, None),
+    "cgpa":        (lambda: StudentProfile.current_cgpa, 1e9, -1e9),
+    "last_active": (lambda: StudentProfile.last_activity, datetime.max, datetime.min),
+    "burnout":     (_latest_burnout, 1e9, -1e9),
+}
+
+
+def parse_fields(value):
+    if not value:
+        return list(DEFAULT_FIELDS)
+    fields = [f.strip() for f in value.split(",") if f.strip()]
+    unknown = sorted(set(fields) - set(FIELDS))
+    if unknown:
+        raise ValidationError(f"Unknown field(s): {', '.join(unknown)}")
+    return ["id"] + [f for f in dict.fromkeys(fields) if f != "id"]
+
+
+def sort_key(value):
+    """``(labelled sort expression, descending)`` for a ``sort`` parameter."""
+    name = value.lstrip("-")
+    if name not in SORTS:
+        raise ValidationError(f"sort must be one of: {', '.join(SORTS)}")
+    descending = value.startswith("-")
+    expression, null_asc, null_desc = SORTS[name]
+    key = expression()
+    null_value = null_desc if descending else null_asc
+    if null_value is not None:
+        key = func.coalesce(key, null_value)
+    return key.label("sort_key"), descending
+
+
+def list_students(teacher_id, args):
+    """``(rows, next_cursor)`` for the query-string ``args`` of a teacher."""
+    fields = parse_fields(args.get("fields"))
+    query = (
+        db.session.query(*(FIELDS[f]().label(f) for f in fields))
+        .select_from(StudentProfile)
+        .join(TeacherAssignment, TeacherAssignment.student_id == StudentProfile.id)
+        .filter(TeacherAssignment.teacher_id == teacher_id)
+    )
+    if args.get("class"):
+        query = query.filter(StudentProfile.class_level == args["class"])
+    if args.get("section"):
+        query = query.filter(StudentProfile.section == args["section"])
+    if args.get("status"):
+        query = query.filter(StudentProfile.performance_status == args["status"])
+
+    cursor = args.get("cursor")
+    # Callers that don't page get the whole roster, as they always have.
+    paged = args.get("limit") not in (None, "") or cursor
+    limit = page_size(args.get("limit"), default=DEFAULT_PAGE_SIZE) if paged else None
+    search = (args.get("search") or "").strip()
+    sort = args.get("sort")
+
+    if search and not sort:
+        page = student_search.search(query, search, cursor=cursor, limit=limit)
+    else:
+        if search:
+            query = query.filter(student_search.match(search, student_search.backend()))
+        key, descending = sort_key(sort or "name")
+        page = keyset_page(
+            query.add_columns(key),
+            [key, StudentProfile.id],
+            cursor=cursor,
+            limit=limit,
+            descending=descending,
+            row_key=lambda row: (row.sort_key, row.id),
+        )
+
+    rows = [{f: _jsonable(getattr(row, f)) for f in fields} for row in page.items]
+    return rows, page.next_cursor
+
+
+def _jsonable(value):
+    return value.isoformat() if isinstance(value, datetime) else value
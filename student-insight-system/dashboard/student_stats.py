@@ -77,20 +77,24 @@ def calculate_assignment_stats(student_id):
 
 def calculate_assessment_stats(student_id):
     """Calculate quiz and exam averages"""
-    from models import AssessmentResult, Assessment
+    from models import AssessmentResult, Assessment, db
     
-    results = AssessmentResult.query.filter_by(student_id=student_id).all()
+    # One join instead of an Assessment lookup per result
+    results = (
+        db.session.query(AssessmentResult.score, AssessmentResult.percentage, Assessment.type)
+        .join(Assessment, AssessmentResult.assessment_id == Assessment.id)
+        .filter(AssessmentResult.student_id == student_id)
+        .all()
+    )
     
     quiz_scores = []
     exam_scores = []
     
-    for result in results:
-        assessment = Assessment.query.get(result.assessment_id)
-        if assessment:
-            if assessment.type == 'quiz':
-                quiz_scores.append(result.percentage if result.percentage else result.score)
-            elif assessment.type == 'exam':
-                exam_scores.append(result.percentage if result.percentage else result.score)
+    for score, percentage, assessment_type in results:
+        if assessment_type == 'quiz':
+            quiz_scores.append(percentage if percentage else score)
+        elif assessment_type == 'exam':
+            exam_scores.append(percentage if percentage else score)
     
     quiz_avg = round(sum(quiz_scores) / len(quiz_scores), 1) if quiz_scores else 0
     exam_avg = round(sum(exam_scores) / len(exam_scores), 1) if exam_scores else 0
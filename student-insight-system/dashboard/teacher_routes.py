@@ -21,6 +21,11 @@ from sqlalchemy import func, case
 from sqlalchemy.orm import selectinload
 from collections import defaultdict
 from services.dashboard_service import DashboardService
+from core.data_version import bump_data_version
+from core.db_routing import read_replica
+from core.identity import load_teacher
+from core.pagination import capped_count, keyset_page, page_size
+from dashboard.student_listing import list_students
 from datetime import datetime
 import re
 import os
@@ -30,6 +35,8 @@ from werkzeug.utils import secure_filename
 teacher_bp = Blueprint("teacher", __name__)
 analytics_engine = AnalyticsEngine()
 
+ALERTS_TOTAL_CAP = 1000  # badge shows "1000+" beyond this
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Auth helper
@@ -44,7 +51,7 @@ def _get_teacher_or_403():
         user_id = int(get_jwt_identity())
     except (ValueError, TypeError):
         return None, (jsonify({"msg": "Invalid user identity"}), 400)
-    teacher = TeacherProfile.query.filter_by(user_id=user_id).first()
+    teacher = load_teacher(user_id)
     if not teacher:
         return None, (jsonify({"msg": "Teacher profile not found"}), 404)
     return teacher, None
@@ -64,6 +71,7 @@ def get_global_transfer_requests(teacher):
 
 @teacher_bp.route("/teacher/dashboard")
 @jwt_required()
+@read_replica
 def teacher_dashboard():
     claims = get_jwt()
     if claims.get("role") != "teacher":
@@ -73,7 +81,7 @@ def teacher_dashboard():
     except (ValueError, TypeError):
         return jsonify({"msg": "Invalid user identity"}), 400
 
-    teacher = TeacherProfile.query.filter_by(user_id=user_id).first()
+    teacher = load_teacher(user_id)
     if not teacher:
         return jsonify({"msg": "Teacher profile not found"}), 404
 
@@ -421,32 +429,32 @@ def teacher_alerts_page():
     if err:
         return err
 
-    student_ids = [
-        a.student_id for a in
-        TeacherAssignment.query.filter_by(teacher_id=teacher.id).all()
-    ]
-
-    # Get page number from request args, default to 1
-    page = request.args.get("page", 1, type=int)
-
-    alerts_pagination = None
-    if student_ids:
-        alerts_pagination = (
-            StudentAlert.query
-            .filter(
-                StudentAlert.student_id.in_(student_ids),
-                StudentAlert.is_resolved == False,
-            )
-            .options(selectinload(StudentAlert.student))
-            .order_by(StudentAlert.created_at.desc())
-            .paginate(page=page, per_page=20, error_out=False)
+    # Keyset pagination on (created_at, id): every page is an index seek
+    # past the previous page's last alert, so resolving alerts mid-scroll
+    # never skips or repeats rows.
+    open_alerts = (
+        StudentAlert.query
+        .filter(
+            StudentAlert.student_id.in_(
+                db.select(TeacherAssignment.student_id)
+                .where(TeacherAssignment.teacher_id == teacher.id)
+            ),
+            StudentAlert.is_resolved == False,
         )
-    
-    alerts = alerts_pagination.items if alerts_pagination else []
-    
-    # Calculate total alerts for sidebar badge
-    total_alerts_count = alerts_pagination.total if alerts_pagination else 0
-    has_next = alerts_pagination.has_next if alerts_pagination else False
+    )
+    cursor = request.args.get("cursor")
+    page = keyset_page(
+        open_alerts.options(selectinload(StudentAlert.student)),
+        [StudentAlert.created_at, StudentAlert.id],
+        cursor=cursor,
+        limit=page_size(request.args.get("limit"), default=20),
+    )
+    alerts = page.items
+
+    # Total for the sidebar badge — capped, and only on the first page or on request
+    total_alerts_count, total_exact = None, True
+    if not cursor or request.args.get("total") == "true":
+        total_alerts_count, total_exact = capped_count(open_alerts, ALERTS_TOTAL_CAP)
 
     # IF the request is an AJAX/fetch call for infinite scroll, return JSON
     if request.headers.get("Accept") == "application/json" or request.args.get("json") == "true":
@@ -462,9 +470,10 @@ def teacher_alerts_page():
                     "is_resolved": a.is_resolved
                 } for a in alerts
             ],
-            "has_next": has_next,
-            "next_page": page + 1 if has_next else None,
-            "total_alerts": total_alerts_count
+            "has_next": page.has_next,
+            "next_cursor": page.next_cursor,
+            "total_alerts": total_alerts_count,
+            "total_is_exact": total_exact,
         })
 
     from models.teacher import AssignmentTransferRequest
@@ -483,8 +492,9 @@ def teacher_alerts_page():
         alerts=alerts,
         incoming_requests=incoming_requests,
         total_alerts=total_alerts_count,
-        has_next=has_next,
-        next_page=page + 1 if has_next else None,
+        total_is_exact=total_exact,
+        has_next=page.has_next,
+        next_cursor=page.next_cursor,
         now_date=datetime.now().strftime("%d %B, %Y"),
         global_transfer_requests=get_global_transfer_requests(teacher),
     )
@@ -501,7 +511,7 @@ def teacher_student_detail(student_id):
     except (ValueError, TypeError):
         return jsonify({"msg": "Invalid user identity"}), 400
 
-    teacher = TeacherProfile.query.filter_by(user_id=user_id).first()
+    teacher = load_teacher(user_id)
     if not teacher:
         return jsonify({"msg": "Teacher profile not found"}), 404
 
@@ -515,6 +525,13 @@ def teacher_student_detail(student_id):
     if not student:
         return jsonify({"msg": "Student not found"}), 404
 
+    # G) Full Dashboard Data (for rendering interactive charts)
+    # Loaded first: refreshing the snapshot commits, which would expire
+    # every row loaded below and reload each one from the template.
+    # NOTE: get_dashboard_data() resolves via StudentProfile.user_id,
+    # so we must pass the student's user_id, NOT the StudentProfile.id.
+    dashboard_data = DashboardService.get_dashboard_data(student.user_id)
+
     notes = StudentNote.query.filter_by(
         student_id=student_id, teacher_id=teacher.id
     ).order_by(StudentNote.created_at.desc()).all()
@@ -637,11 +654,6 @@ def teacher_student_detail(student_id):
             "insight_id":   latest_insight.id,
         }
 
-    # G) Full Dashboard Data (for rendering interactive charts)
-    # NOTE: get_dashboard_data() resolves via StudentProfile.user_id,
-    # so we must pass the student's user_id, NOT the StudentProfile.id.
-    dashboard_data = DashboardService.get_dashboard_data(student.user_id)
-
     return render_template(
         "student_detail.html",
         teacher=teacher,
@@ -675,45 +687,11 @@ def api_teacher_students():
     if err:
         return err
 
-    class_filter   = request.args.get("class")
-    section_filter = request.args.get("section")
-    status_filter  = request.args.get("status")
-    search_query   = (request.args.get("search") or "").strip()
-
-    query = (
-        db.session.query(StudentProfile)
-        .join(TeacherAssignment)
-        .filter(TeacherAssignment.teacher_id == teacher.id)
-    )
-    if class_filter:
-        query = query.filter(StudentProfile.class_level == class_filter)
-    if section_filter:
-        query = query.filter(StudentProfile.section == section_filter)
-    if search_query:
-        like_term = f"%{search_query}%"
-        query = query.filter(
-            db.or_(
-                StudentProfile.student_code.ilike(like_term),
-                StudentProfile.full_name.ilike(like_term),
-            )
-        )
-
-    students = query.distinct().all()
-    result = []
-    for s in students:
-        if status_filter and s.performance_status != status_filter:
-            continue
-        result.append({
-            "id":           s.id,
-            "name":         s.full_name,
-            "student_code": s.student_code,
-            "class_level":  s.class_level,
-            "section":      s.section,
-            "cgpa":         s.current_cgpa,
-            "status":       s.performance_status,
-            "last_active":  s.last_active.isoformat() if hasattr(s, "last_active") and s.last_active else None,
-        })
-    return jsonify(result)
+    # Sparse, sorted, keyset-paged projection (see dashboard/student_listing.py);
+    # the body stays a plain list and the next cursor travels in a header.
+    rows, next_cursor = list_students(teacher.id, request.args)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    return jsonify(rows), 200, headers
 
 
 
@@ -797,6 +775,7 @@ def api_resolve_alerts_batch():
 
 @teacher_bp.route("/api/teacher/alerts/summary", methods=["GET"])
 @jwt_required()
+@read_replica
 def api_teacher_alerts_summary():
     """
     Returns a JSON count of unresolved alerts grouped by severity 
@@ -834,6 +813,7 @@ def api_teacher_alerts_summary():
 
 @teacher_bp.route("/api/teacher/class-skills", methods=["GET"])
 @jwt_required()
+@read_replica
 def api_teacher_class_skills():
     teacher, err = _get_teacher_or_403()
     if err:
@@ -1260,7 +1240,9 @@ def api_delete_teacher_profile():
             )
         ).delete(synchronize_session='fetch')
 
-        # 3. Delete teacher notes
+        # 3. Delete teacher notes (their students' notification lists change)
+        noted = StudentNote.query.with_entities(StudentNote.student_id).filter_by(teacher_id=teacher.id).distinct()
+        bump_data_version([student_id for (student_id,) in noted])
         StudentNote.query.filter_by(teacher_id=teacher.id).delete()
 
         # 4. Remove profile picture file
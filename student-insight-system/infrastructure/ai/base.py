@@ -6,7 +6,7 @@ Services depend on this abstraction, never on a concrete provider.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator
 
 
 class AIServiceInterface(ABC):
@@ -21,3 +21,12 @@ class AIServiceInterface(ABC):
     def generate_json(self, prompt: str) -> list[dict[str, Any]]:
         """Generate structured JSON from a prompt."""
         ...
+
+    def generate_text_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate free-form text as an iterator of chunks.
+
+        Providers that support streaming override this; the default
+        yields the whole ``generate_text`` result as a single chunk.
+        """
+        yield self.generate_text(prompt)
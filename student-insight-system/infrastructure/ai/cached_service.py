@@ -0,0 +1,203 @@
+"""
+Caching decorator for any AIServiceInterface implementation.
+
+Responses are stored in the ``ai_response_cache`` table under
+sha256(model name + call kind + normalised prompt), so identical
+requests — from any process — are answered from the database instead of
+the provider. Entries expire after ``AI_CACHE_TTL_SECONDS``; once the
+table grows past ``AI_CACHE_MAX_ENTRIES`` the least recently used rows
+are evicted by a sweep that runs at most every ``AI_CACHE_SWEEP_SECONDS``
+per process.
+
+Cache reads and writes use their own connection and transaction, never
+the caller's session: a hit does not commit (or a failure roll back)
+whatever the request has pending.
+
+Usage:
+    ai_service = CachedAIService.from_config(GeminiAIService(api_key), app.config)
+    ai_service.generate_text(prompt)          # cached
+    CachedAIService.from_config(inner, app.config, bypass=True)  # always hits the provider,
+                                                                 # then refreshes the entry
+    CachedAIService.stats()                   # {"hits": .., "misses": .., "bypassed": ..}
+
+Cache failures are logged and never break the AI call itself.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from core.extensions import db
+from infrastructure.ai.base import AIServiceInterface
+from models import AIResponseCache
+
+logger = logging.getLogger(__name__)
+
+_stats = {"hits": 0, "misses": 0, "bypassed": 0}
+_stats_lock = threading.Lock()
+
+_cache = AIResponseCache.__table__
+_sweep_lock = threading.Lock()
+_last_sweep = None  # time.monotonic() of this process's last eviction sweep
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def normalise_prompt(prompt: str) -> str:
+    """Collapse whitespace so re-indented but identical prompts share a key."""
+    return " ".join(prompt.split())
+
+
+class CachedAIService(AIServiceInterface):
+    """Read-through, DB-backed cache in front of another AI service."""
+
+    def __init__(self, inner: AIServiceInterface, ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 5000, bypass: bool = False, sweep_seconds: float = 300):
+        self.inner = inner
+        self.model_name = getattr(inner, "model_name", type(inner).__name__)
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self.bypass = bypass
+        self.sweep_seconds = sweep_seconds
+
+    @classmethod
+    def from_config(cls, inner, config, bypass=False) -> AIServiceInterface:
+        """Wrap ``inner`` per app config; returns it unwrapped when caching is off."""
+        if not config.get("AI_CACHE_ENABLED", True):
+            return inner
+        return cls(
+            inner,
+            ttl_seconds=float(config.get("AI_CACHE_TTL_SECONDS", 7 * 24 * 3600)),
+            max_entries=int(config.get("AI_CACHE_MAX_ENTRIES", 5000)),
+            bypass=bypass,
+            sweep_seconds=float(config.get("AI_CACHE_SWEEP_SECONDS", 300)),
+        )
+
+    @staticmethod
+    def stats() -> dict:
+        """Process-wide hit/miss counters."""
+        with _stats_lock:
+            return dict(_stats)
+
+    def cache_key(self, kind: str, prompt: str) -> str:
+        material = "\x00".join((self.model_name, kind, normalise_prompt(prompt)))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    # ── AIServiceInterface ────────────────────────────────────
+
+    def generate_text(self, prompt: str) -> str:
+        return self._cached("text", prompt, self.inner.generate_text, str, str)
+
+    def generate_text_stream(self, prompt: str):
+        """Replay a cached response as one chunk, or stream and cache the result."""
+        key = self.cache_key("text", prompt)
+        if self.bypass:
+            _count("bypassed")
+        else:
+            cached = self._read(key)
+            if cached is not None:
+                _count("hits")
+                yield cached
+                return
+            _count("misses")
+
+        chunks = []
+        for chunk in self.inner.generate_text_stream(prompt):
+            chunks.append(chunk)
+            yield chunk
+        # Only complete responses are cached (a dropped client stops the generator early).
+        self._write(key, "text", "".join(chunks))
+
+    def generate_json(self, prompt: str) -> list[dict]:
+        return self._cached("json", prompt, self.inner.generate_json, json.dumps, json.loads)
+
+    # ── internals ──
+
+    def _cached(self, kind, prompt, call, dump, load):
+        key = self.cache_key(kind, prompt)
+
+        if self.bypass:
+            _count("bypassed")
+        else:
+            cached = self._read(key)
+            if cached is not None:
+                _count("hits")
+                logger.info("AI cache hit (model=%s, kind=%s)", self.model_name, kind)
+                return load(cached)
+            _count("misses")
+
+        result = call(prompt)
+        self._write(key, kind, dump(result))
+        return result
+
+    def _read(self, key):
+        try:
+            now = datetime.utcnow()
+            with db.engine.begin() as conn:
+                response = conn.execute(
+                    select(_cache.c.response)
+                    .where(_cache.c.cache_key == key, _cache.c.expires_at > now)
+                ).scalar()
+                if response is not None:
+                    conn.execute(
+                        update(_cache).where(_cache.c.cache_key == key)
+                        .values(last_accessed_at=now, hit_count=_cache.c.hit_count + 1)
+                    )
+            return response
+        except Exception:
+            logger.exception("AI cache read failed")
+            return None
+
+    def _write(self, key, kind, response):
+        now = datetime.utcnow()
+        values = dict(
+            model_name=self.model_name, kind=kind, response=response, created_at=now,
+            expires_at=now + self.ttl, last_accessed_at=now, hit_count=0,
+        )
+        try:
+            with db.engine.begin() as conn:
+                updated = conn.execute(update(_cache).where(_cache.c.cache_key == key).values(**values))
+                if not updated.rowcount:
+                    conn.execute(insert(_cache).values(cache_key=key, **values))
+        except IntegrityError:
+            pass  # another process cached the same prompt first
+        except Exception:
+            logger.exception("AI cache write failed")
+        self._maybe_sweep(now)
+
+    def _maybe_sweep(self, now):
+        global _last_sweep
+        if _last_sweep is not None and time.monotonic() - _last_sweep < self.sweep_seconds:
+            return
+        if not _sweep_lock.acquire(blocking=False):
+            return  # another thread is sweeping
+        try:
+            _last_sweep = time.monotonic()
+            self._evict(now)
+        except Exception:
+            logger.exception("AI cache eviction failed")
+        finally:
+            _sweep_lock.release()
+
+    def _evict(self, now):
+        """Drop expired rows, then the least recently used beyond max_entries."""
+        with db.engine.begin() as conn:
+            conn.execute(delete(_cache).where(_cache.c.expires_at <= now))
+            excess = conn.execute(select(func.count()).select_from(_cache)).scalar() - self.max_entries
+            if excess > 0:
+                oldest = (
+                    select(_cache.c.cache_key)
+                    .order_by(_cache.c.last_accessed_at)
+                    .limit(excess)
+                    .subquery()
+                )
+                conn.execute(delete(_cache).where(_cache.c.cache_key.in_(select(oldest.c.cache_key))))
@@ -23,9 +23,14 @@ class GeminiAIService(AIServiceInterface):
         if not api_key:
             raise ValueError("GEMINI_API_KEY is required")
         genai.configure(api_key=api_key)
+        self.model_name = model_name
         self._model = genai.GenerativeModel(model_name)
         logger.info("GeminiAIService initialised with model=%s", model_name)
 
+    def warm_up(self) -> None:
+        """Open the API connection ahead of the first real request."""
+        self._model.count_tokens("warm-up")
+
     def generate_text(self, prompt: str) -> str:
         """Generate free-form text from a prompt."""
         try:
@@ -36,6 +41,17 @@ class GeminiAIService(AIServiceInterface):
             logger.error("Gemini API failed: %s", e)
             raise ExternalServiceError(f"AI service unavailable: {e}")
 
+    def generate_text_stream(self, prompt: str):
+        """Yield text chunks as Gemini produces them."""
+        try:
+            logger.info("Gemini streaming request (prompt_length=%d)", len(prompt))
+            for chunk in self._model.generate_content(prompt, stream=True):
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            logger.error("Gemini streaming failed: %s", e)
+            raise ExternalServiceError(f"AI service unavailable: {e}")
+
     def generate_json(self, prompt: str) -> list[dict]:
         """Generate structured JSON from a prompt."""
         raw = self.generate_text(prompt)
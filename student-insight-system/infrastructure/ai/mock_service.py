@@ -2,21 +2,71 @@
 Deterministic mock AI service for testing.
 
 Returns predictable responses — never makes external calls.
+
+For load tests it can also stand in for a real provider: every call
+waits ``latency_ms`` (plus up to ``jitter_ms`` more) and fails with
+probability ``failure_rate``, raising ExternalServiceError like the
+Gemini client does. Configured through ``AI_MOCK_LATENCY_MS``,
+``AI_MOCK_JITTER_MS`` and ``AI_MOCK_FAILURE_RATE`` when ``AI_PROVIDER``
+is ``mock``; all default to 0, which keeps the mock instant and reliable.
 """
 
+import random
+import re
+import time
+
+from core.errors import ExternalServiceError
 from infrastructure.ai.base import AIServiceInterface
 
 
 class MockAIService(AIServiceInterface):
     """Deterministic mock for testing — no external calls."""
 
+    model_name = "mock"
+    latency_ms = 0.0
+    jitter_ms = 0.0
+    failure_rate = 0.0
+    _rng = random
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, failure_rate=0.0, seed=None):
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0 and 1")
+        self.latency_ms = float(latency_ms)
+        self.jitter_ms = float(jitter_ms)
+        self.failure_rate = float(failure_rate)
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            latency_ms=config.get("AI_MOCK_LATENCY_MS", 0.0),
+            jitter_ms=config.get("AI_MOCK_JITTER_MS", 0.0),
+            failure_rate=config.get("AI_MOCK_FAILURE_RATE", 0.0),
+        )
+
+    def _simulate_call(self):
+        """Sleep for the configured latency, then fail if the dice say so."""
+        delay_ms = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+        if self.failure_rate and self._rng.random() < self.failure_rate:
+            raise ExternalServiceError("AI service unavailable: injected mock failure")
+
     def generate_text(self, prompt: str) -> str:
+        self._simulate_call()
         return (
             "<h3>Mock Insight Report</h3>"
             "<p>This is a deterministic test report.</p>"
         )
 
+    def generate_text_stream(self, prompt: str):
+        # Deterministic chunking: split before every closing tag
+        for part in re.split(r"(?=</)", self.generate_text(prompt)):
+            if part:
+                yield part
+
     def generate_json(self, prompt: str) -> list[dict]:
+        self._simulate_call()
         return [
             {"title": "Mock Task 1", "description": "Test task", "days_to_complete": 5},
             {"title": "Mock Task 2", "description": "Test task", "days_to_complete": 3},
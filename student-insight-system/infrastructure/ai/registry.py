@@ -0,0 +1,133 @@
+"""
+Process-wide AI provider registry.
+
+Provider clients are built once per process (``genai.configure`` and the
+``GenerativeModel`` are reused by every request) and handed out behind
+the provider's shared ResiliencePolicy — concurrency limit, rate limits,
+timeouts and circuit breaker (see infrastructure/ai/resilience.py).
+
+Register in app factory:
+    from infrastructure.ai.registry import ai_registry
+    ai_registry.init_app(app)
+
+Use from routes / workers:
+    ai_service = ai_registry.get(user_id=user_id)   # default provider (AI_PROVIDER)
+    ai_service = ai_registry.get("mock")
+
+``app.config["AI_SERVICE"]`` (used by tests) still takes precedence over
+the configured provider.
+"""
+
+import logging
+import os
+import threading
+
+from flask import current_app
+
+from infrastructure.ai.base import AIServiceInterface
+from infrastructure.ai.resilience import ResiliencePolicy, ResilientAIService
+
+logger = logging.getLogger(__name__)
+
+
+def _gemini_factory(config):
+    from infrastructure.ai.gemini_service import GeminiAIService
+    return GeminiAIService(
+        config.get("GEMINI_API_KEY"),
+        model_name=config.get("AI_MODEL_NAME", "gemini-2.0-flash"),
+    )
+
+
+def _mock_factory(config):
+    from infrastructure.ai.mock_service import MockAIService
+    return MockAIService.from_config(config)
+
+
+class AIProviderRegistry:
+    """Lazily built, reusable AI clients keyed by provider name."""
+
+    def __init__(self, app=None):
+        self._app = None
+        self._factories = {"gemini": _gemini_factory, "mock": _mock_factory}
+        self._clients = {}
+        self._policies = {}
+        self._pid = None
+        self._lock = threading.Lock()
+        self.default_provider = "gemini"
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self._app = app
+        self.default_provider = app.config.get("AI_PROVIDER", "gemini")
+        self._clients = {}
+        self._policies = {}
+        app.extensions["ai_registry"] = self
+
+    def register(self, name: str, factory) -> None:
+        """Add a provider: ``factory(config) -> AIServiceInterface``."""
+        with self._lock:
+            self._factories[name] = factory
+            self._clients.pop(name, None)
+
+    def is_configured(self, name: str = None) -> bool:
+        """False when the provider would fail to build (e.g. missing API key)."""
+        config = self._config()
+        if config.get("AI_SERVICE"):
+            return True
+        name = name or self.default_provider
+        return name != "gemini" or bool(config.get("GEMINI_API_KEY"))
+
+    def get(self, name: str = None, user_id=None) -> AIServiceInterface:
+        """Shared client for ``name`` (default provider), behind its resilience policy."""
+        name = name or self.default_provider
+        override = self._config().get("AI_SERVICE")
+        client = override or self._client(name)
+        return ResilientAIService(client, self.policy(name), user_id=user_id)
+
+    def policy(self, name: str = None) -> ResiliencePolicy:
+        """The limits shared by every caller of provider ``name``."""
+        name = name or self.default_provider
+        with self._lock:
+            self._check_pid()
+            policy = self._policies.get(name)
+            if policy is None:
+                policy = ResiliencePolicy.from_config(self._config())
+                self._policies[name] = policy
+            return policy
+
+    def warm_up(self, name: str = None) -> None:
+        """Build the client ahead of the first request and let it open connections."""
+        try:
+            client = self._client(name or self.default_provider)
+            if hasattr(client, "warm_up"):
+                client.warm_up()
+            logger.info("AI provider %s warmed up", name or self.default_provider)
+        except Exception:
+            logger.exception("AI provider warm-up failed")
+
+    # ── internals ──
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            self._clients = {}
+            self._policies = {}
+            self._pid = os.getpid()
+
+    def _config(self):
+        return (self._app or current_app).config
+
+    def _client(self, name):
+        # gRPC channels and thread pools do not survive fork(): rebuild per process.
+        with self._lock:
+            self._check_pid()
+            client = self._clients.get(name)
+            if client is None:
+                if name not in self._factories:
+                    raise ValueError(f"Unknown AI provider: {name}")
+                client = self._factories[name](self._config())
+                self._clients[name] = client
+            return client
+
+
+ai_registry = AIProviderRegistry()
@@ -0,0 +1,245 @@
+"""
+Resilience wrapper for AI providers.
+
+Every provider call made through ``ResilientAIService`` passes, in order:
+
+  1. token buckets — one per user, one global (RateLimitError, 429);
+  2. a circuit breaker — after ``AI_BREAKER_FAILURES`` consecutive
+     failures calls fail fast with ExternalServiceError; after
+     ``AI_BREAKER_RESET_SECONDS`` a single probe call is let through and
+     closes the breaker again if it succeeds;
+  3. a bounded semaphore on in-flight calls — waits at most
+     ``AI_ACQUIRE_TIMEOUT_SECONDS`` for a slot;
+  4. a per-call timeout (``AI_TIMEOUT_SECONDS``) — the call runs on a
+     dedicated thread and the caller stops waiting when it expires.
+
+A timed-out call keeps its semaphore slot until the provider actually
+returns, so a slow provider saturates the AI slots (and then fails fast)
+instead of the web workers.
+
+Shared state lives in one ``ResiliencePolicy`` per provider; wrappers are
+cheap and created per caller:
+    policy = ResiliencePolicy.from_config(app.config)
+    ai_service = ResilientAIService(client, policy, user_id=user_id)
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from core.errors import ExternalServiceError, RateLimitError
+from infrastructure.ai.base import AIServiceInterface
+
+logger = logging.getLogger(__name__)
+
+_STREAM_DONE = object()
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+
+class CircuitBreaker:
+    """Closed → open after N consecutive failures → half-open probe → closed."""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raise ExternalServiceError unless a call may go through now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN  # this caller is the probe
+                logger.info("AI circuit breaker half-open: probing provider")
+                return
+        raise ExternalServiceError("AI service temporarily unavailable — please try again later")
+
+    def abort_probe(self) -> None:
+        """The probe never reached the provider — let the next caller probe."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("AI circuit breaker closed")
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("AI circuit breaker opened after %d failures", self._failures)
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class ResiliencePolicy:
+    """Limits shared by every wrapper around one provider client."""
+
+    MAX_TRACKED_USERS = 10_000
+
+    def __init__(self, max_concurrency=8, acquire_timeout=5.0, call_timeout=30.0,
+                 global_rate_per_minute=60, user_rate_per_minute=6,
+                 breaker_failures=5, breaker_reset_seconds=30.0):
+        self.max_concurrency = max_concurrency
+        self.acquire_timeout = acquire_timeout
+        self.call_timeout = call_timeout
+        self.user_rate_per_minute = user_rate_per_minute
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.global_bucket = TokenBucket(global_rate_per_minute / 60.0, global_rate_per_minute)
+        self.breaker = CircuitBreaker(breaker_failures, breaker_reset_seconds)
+        self._user_buckets = OrderedDict()
+        self._users_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="ai-call")
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            max_concurrency=int(config.get("AI_MAX_CONCURRENCY", 8)),
+            acquire_timeout=float(config.get("AI_ACQUIRE_TIMEOUT_SECONDS", 5)),
+            call_timeout=float(config.get("AI_TIMEOUT_SECONDS", 30)),
+            global_rate_per_minute=float(config.get("AI_RATE_PER_MINUTE", 60)),
+            user_rate_per_minute=float(config.get("AI_USER_RATE_PER_MINUTE", 6)),
+            breaker_failures=int(config.get("AI_BREAKER_FAILURES", 5)),
+            breaker_reset_seconds=float(config.get("AI_BREAKER_RESET_SECONDS", 30)),
+        )
+
+    def user_bucket(self, user_id) -> TokenBucket:
+        with self._users_lock:
+            bucket = self._user_buckets.get(user_id)
+            if bucket is None:
+                rate = self.user_rate_per_minute
+                bucket = TokenBucket(rate / 60.0, rate)
+                self._user_buckets[user_id] = bucket
+                if len(self._user_buckets) > self.MAX_TRACKED_USERS:
+                    self._user_buckets.popitem(last=False)
+            else:
+                self._user_buckets.move_to_end(user_id)
+            return bucket
+
+    def admit(self, user_id=None) -> None:
+        """Rate limits + breaker + a concurrency slot; caller must release the slot."""
+        if user_id is not None and not self.user_bucket(user_id).try_acquire():
+            raise RateLimitError("You're generating AI reports too quickly — please wait a minute")
+        if not self.global_bucket.try_acquire():
+            raise RateLimitError("The AI service is busy — please try again shortly")
+        self.breaker.before_call()
+        if not self.semaphore.acquire(timeout=self.acquire_timeout):
+            self.breaker.abort_probe()
+            raise ExternalServiceError("The AI service is at capacity — please try again shortly")
+
+
+class ResilientAIService(AIServiceInterface):
+    """Wraps a provider client with a shared ResiliencePolicy."""
+
+    def __init__(self, inner: AIServiceInterface, policy: ResiliencePolicy, user_id=None):
+        self.inner = inner
+        self.model_name = getattr(inner, "model_name", type(inner).__name__)
+        self.policy = policy
+        self.user_id = user_id
+
+    def generate_text(self, prompt: str) -> str:
+        return self._call(self.inner.generate_text, prompt)
+
+    def generate_json(self, prompt: str) -> list[dict]:
+        return self._call(self.inner.generate_json, prompt)
+
+    def generate_text_stream(self, prompt: str):
+        """Chunks are produced on a worker thread; each must arrive within the timeout."""
+        policy = self.policy
+        policy.admit(self.user_id)
+        chunks = queue.Queue()
+        cancelled = threading.Event()
+
+        def produce():
+            received = False
+            try:
+                for chunk in self.inner.generate_text_stream(prompt):
+                    received = True
+                    chunks.put(chunk)
+                    if cancelled.is_set():
+                        break
+                # A stream the reader abandoned still settles a half-open probe.
+                if received or not cancelled.is_set():
+                    policy.breaker.record_success()
+                else:
+                    policy.breaker.abort_probe()
+                chunks.put(_STREAM_DONE)
+            except Exception as e:
+                policy.breaker.record_failure()
+                chunks.put(e)
+            finally:
+                policy.semaphore.release()
+
+        policy._executor.submit(produce)
+        try:
+            while True:
+                try:
+                    item = chunks.get(timeout=policy.call_timeout)
+                except queue.Empty:
+                    policy.breaker.record_failure()
+                    raise ExternalServiceError("AI service timed out")
+                if item is _STREAM_DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+
+    # ── internals ──
+
+    def _call(self, fn, prompt):
+        policy = self.policy
+        policy.admit(self.user_id)
+        try:
+            future = policy._executor.submit(fn, prompt)
+        except Exception:
+            policy.semaphore.release()
+            raise
+        # The slot is held until the provider returns, even if we stop waiting.
+        future.add_done_callback(lambda _: policy.semaphore.release())
+        try:
+            result = future.result(timeout=policy.call_timeout)
+        except FutureTimeout:
+            policy.breaker.record_failure()
+            logger.warning("AI call timed out after %.1fs", policy.call_timeout)
+            raise ExternalServiceError("AI service timed out")
+        except Exception:
+            policy.breaker.record_failure()
+            raise
+        policy.breaker.record_success()
+        return result
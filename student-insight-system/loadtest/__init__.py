@@ -0,0 +1,22 @@
+"""
+Load generator: concurrent virtual students and teachers against a running app.
+
+Seed a database (``python seed.py --all``), start the app the way it runs
+in production — the number of worker processes is what is being measured —
+with the stand-in AI provider so AI endpoints need no network:
+
+    AI_PROVIDER=mock AI_MOCK_LATENCY_MS=1500 AI_MOCK_JITTER_MS=1000 AI_MOCK_FAILURE_RATE=0.02 \\
+    AI_RATE_PER_MINUTE=100000 AI_USER_RATE_PER_MINUTE=100000 \\
+        gunicorn -w 4 --threads 4 -b 127.0.0.1:8000 "app:create_app()"
+
+then step the number of virtual users up until throughput stops growing:
+
+    python -m loadtest --url http://127.0.0.1:8000 --stages 10:60,25:60,50:60,100:60,200:60 \\
+        --student-ids 1-1000 --teacher-ids 1-25 --label "gunicorn -w 4 --threads 4"
+
+Each stage reports requests/s, error rate and p50/p95/p99 overall and per
+action; the run ends with the peak stage and the first saturated one
+(throughput gained < 10% for more users, or > 1% errors). Repeat with
+another worker count and compare the JSON files written to
+``loadtest/results/``. Mixes: see ``loadtest.scenarios.MIXES``.
+"""
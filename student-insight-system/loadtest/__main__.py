@@ -0,0 +1,90 @@
+"""Command line entry point: ``python -m loadtest --help``."""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+from loadtest.runner import Accounts, LoadRunner, parse_ids, parse_stages
+from loadtest.scenarios import MIXES
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Replay student / teacher traffic.")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="base URL of the running app")
+    parser.add_argument("--mix", default="semester", choices=sorted(MIXES))
+    parser.add_argument("--stages", type=parse_stages, default=parse_stages("10:30,25:30,50:30,100:30"),
+                        help="users:seconds,... (default 10:30,25:30,50:30,100:30)")
+    parser.add_argument("--ramp", type=float, default=10.0, help="seconds over which a stage adds its users")
+    parser.add_argument("--think", type=float, default=1.0, help="mean pause between a user's actions (0 = none)")
+    parser.add_argument("--student-ids", type=parse_ids, default=parse_ids("1-1000"), help="e.g. 1-1000")
+    parser.add_argument("--teacher-ids", type=parse_ids, default=parse_ids("1-25"), help="e.g. 1-25")
+    parser.add_argument("--student-email", default="student{id}@seed.example.edu")
+    parser.add_argument("--teacher-email", default="teacher{id}@seed.example.edu")
+    parser.add_argument("--password", default="password123")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout (seconds)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--label", default="", help="server configuration under test, e.g. 'gunicorn -w 4'")
+    parser.add_argument("--output", default=None, help="result file (default: loadtest/results/<label>-<time>.json)")
+    return parser
+
+
+def _print_stage(index, row):
+    print(f"stage {index + 1}: {row['users']:>4} users  {row['rps']:>8.1f} req/s  "
+          f"p50 {row['p50_ms'] or 0:>7.1f} ms  p95 {row['p95_ms'] or 0:>7.1f} ms  "
+          f"p99 {row['p99_ms'] or 0:>7.1f} ms  errors {row['error_rate']:.2%}", flush=True)
+
+
+def _print_endpoints(report):
+    last = report["stages"][-1]["endpoints"] if report["stages"] else {}
+    print(f"\n{'action (last stage)':<26} {'requests':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, row in last.items():
+        print(f"{name:<26} {row['requests']:>9} {row['p50_ms'] or 0:>9.1f} {row['p95_ms'] or 0:>9.1f} "
+              f"{row['p99_ms'] or 0:>9.1f} {row['errors']:>7}")
+
+
+def _print_saturation(report):
+    saturation, stages = report["saturation"], report["stages"]
+    if saturation["peak"] is not None:
+        peak = stages[saturation["peak"]]
+        print(f"\nPeak: {peak['rps']:.1f} req/s with {peak['users']} users (p95 {peak['p95_ms'] or 0:.1f} ms)")
+    if saturation["saturated"]:
+        s = saturation["saturated"]
+        print(f"Saturated at {s['users']} users ({s['reason']})")
+    else:
+        print("Not saturated — add a stage with more users")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    accounts = Accounts(
+        [args.student_email.format(id=i) for i in args.student_ids],
+        [args.teacher_email.format(id=i) for i in args.teacher_ids],
+        args.password,
+    )
+    runner = LoadRunner(args.url, args.mix, args.stages, accounts, ramp_seconds=args.ramp,
+                        think_seconds=args.think, seed=args.seed, timeout=args.timeout)
+    print(f"{args.mix} mix against {args.url}: {', '.join(f'{s.users}:{s.seconds:g}' for s in args.stages)}",
+          flush=True)
+    report = runner.run(progress=_print_stage)
+    report["label"] = args.label
+
+    _print_endpoints(report)
+    _print_saturation(report)
+
+    slug = re.sub(r"[^\w.-]+", "-", args.label).strip("-") or "run"
+    output = args.output or os.path.join(RESULTS_DIR, f"{slug}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+        fh.write("\n")
+    print(f"\nWrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Minimal keep-alive HTTP client for virtual users (standard library only).
+
+Each virtual user owns one HttpSession: a persistent connection to the
+app and its cookie jar (the JWT cookie set by ``POST /login``).
+Redirects are not followed — a form post answered with 302 is a
+success, and a page redirecting to the login form is reported as such.
+"""
+
+import http.client
+import json
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlsplit
+
+
+class HttpSession:
+    """One virtual user's connection and cookies."""
+
+    def __init__(self, base_url, timeout=30.0):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._connect = lambda: connection_class(parts.hostname, parts.port, timeout=timeout)
+        self._prefix = parts.path.rstrip("/")
+        self._conn = None
+        self.cookies = {}
+
+    def request(self, method, path, form=None, json_body=None):
+        """Send one request; return ``(status, headers, body bytes, elapsed ms)``."""
+        headers = {}
+        body = None
+        if form is not None:
+            body = urlencode(form)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        elif json_body is not None:
+            body = json.dumps(json_body)
+            headers["Content-Type"] = "application/json"
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+
+        started = time.perf_counter()
+        try:
+            response = self._send(method, self._prefix + path, body, headers)
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        for header in response.headers.get_all("Set-Cookie") or ():
+            for name, morsel in SimpleCookie(header).items():
+                if morsel.value:
+                    self.cookies[name] = morsel.value
+                else:
+                    self.cookies.pop(name, None)
+        if response.will_close:
+            self.close()
+        return response.status, response.headers, data, elapsed_ms
+
+    def _send(self, method, path, body, headers):
+        for attempt in (1, 2):
+            if self._conn is None:
+                self._conn = self._connect()
+            try:
+                self._conn.request(method, path, body=body, headers=headers)
+                return self._conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # The server closed an idle keep-alive connection; reconnect once.
+                self.close()
+                if attempt == 2:
+                    raise
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
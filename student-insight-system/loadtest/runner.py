@@ -0,0 +1,210 @@
+"""
+Stages, ramp-up and the result report.
+
+A run is a list of stages, each holding a number of concurrent virtual
+users for some seconds. When a stage needs more users than the previous
+one, the new users are started evenly over ``ramp_seconds`` (capped at
+the stage length); when it needs fewer, the surplus users are stopped.
+Results are kept per stage, so one run with increasing stages shows
+where throughput stops growing while latency keeps climbing — the
+saturation point of the server configuration under test.
+"""
+
+import itertools
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+
+from benchmarks.harness import percentile
+from loadtest.client import HttpSession
+from loadtest.scenarios import MIXES, PROFILES, VirtualUser
+
+# A stage that adds users but raises throughput by less than this is saturated.
+SATURATION_GAIN = 0.10
+# ... as is one whose error rate exceeds this.
+SATURATION_ERROR_RATE = 0.01
+
+
+class Stage:
+    """Hold ``users`` virtual users for ``seconds``."""
+
+    def __init__(self, users, seconds):
+        if users < 0 or seconds <= 0:
+            raise ValueError("a stage needs users >= 0 and seconds > 0")
+        self.users = users
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"Stage({self.users} users, {self.seconds}s)"
+
+
+def parse_stages(text):
+    """``"10:30,50:60"`` → [Stage(10, 30), Stage(50, 60)] (users:seconds)."""
+    stages = []
+    for part in text.split(","):
+        users, _, seconds = part.strip().partition(":")
+        stages.append(Stage(int(users), float(seconds)))
+    return stages
+
+
+def parse_ids(text):
+    """``"1-100,250"`` → [1, ..., 100, 250]."""
+    ids = []
+    for part in text.split(","):
+        low, _, high = part.strip().partition("-")
+        ids.extend(range(int(low), int(high or low) + 1))
+    return ids
+
+
+class Accounts:
+    """Round-robin hand-out of seeded accounts to virtual users."""
+
+    def __init__(self, student_emails, teacher_emails, password):
+        self.password = password
+        self._cycles = {"student": itertools.cycle(student_emails), "teacher": itertools.cycle(teacher_emails)}
+        self._lock = threading.Lock()
+
+    def next(self, role):
+        with self._lock:
+            return next(self._cycles[role]), self.password
+
+
+class Recorder:
+    """Thread-safe latencies, errors and status codes per stage and action."""
+
+    def __init__(self):
+        self.stage = 0
+        self._latencies = defaultdict(list)
+        self._errors = Counter()
+        self._statuses = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed_ms, ok, status):
+        with self._lock:
+            key = (self.stage, name)
+            if ok:
+                self._latencies[key].append(elapsed_ms)
+            else:
+                self._errors[key] += 1
+            self._statuses[key][str(status)] += 1
+
+    def stage_summary(self, stage):
+        with self._lock:
+            names = sorted({name for s, name in list(self._latencies) + list(self._errors) if s == stage})
+            endpoints = {name: _summary(self._latencies[(stage, name)], self._errors[(stage, name)],
+                                        self._statuses[(stage, name)]) for name in names}
+            latencies = [ms for (s, _), values in self._latencies.items() if s == stage for ms in values]
+            errors = sum(n for (s, _), n in self._errors.items() if s == stage)
+        return _summary(latencies, errors), endpoints
+
+
+def _summary(latencies, errors, statuses=None):
+    requests = len(latencies) + errors
+    row = {
+        "requests": requests,
+        "errors": errors,
+        "error_rate": round(errors / requests, 4) if requests else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 1) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95), 1) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99), 1) if latencies else None,
+    }
+    if statuses is not None:
+        row["statuses"] = dict(statuses)
+    return row
+
+
+class LoadRunner:
+    """Drive virtual users against ``base_url`` through ``stages``."""
+
+    def __init__(self, base_url, mix, stages, accounts, ramp_seconds=10.0, think_seconds=1.0,
+                 seed=42, timeout=30.0):
+        if mix not in MIXES:
+            raise ValueError(f"unknown mix {mix!r}: choose from {', '.join(MIXES)}")
+        self.base_url = base_url
+        self.mix = mix
+        self.stages = stages
+        self.accounts = accounts
+        self.ramp_seconds = ramp_seconds
+        self.think_seconds = think_seconds
+        self.seed = seed
+        self.timeout = timeout
+        self.recorder = Recorder()
+        self._rng = random.Random(seed)
+        self._users = []
+        self._started = 0
+
+    def _spawn(self):
+        profiles, weights = zip(*MIXES[self.mix].items())
+        profile = self._rng.choices(profiles, weights=weights)[0]
+        role = PROFILES[profile][0]
+        user = VirtualUser(
+            self._started, profile, self.accounts.next(role), HttpSession(self.base_url, self.timeout),
+            self.recorder, random.Random(self._rng.random()), self.think_seconds,
+        )
+        self._started += 1
+        user.start()
+        self._users.append(user)
+
+    def _resize(self, users, deadline):
+        missing = users - len(self._users)
+        if missing < 0:
+            for user in self._users[users:]:
+                user.stop()
+            del self._users[users:]
+            return
+        interval = min(self.ramp_seconds, max(deadline - time.monotonic(), 0)) / max(missing, 1)
+        for _ in range(missing):
+            self._spawn()
+            time.sleep(interval)
+
+    def run(self, progress=None):
+        """Run every stage and return the report dict."""
+        stage_rows = []
+        try:
+            for index, stage in enumerate(self.stages):
+                self.recorder.stage = index
+                started = time.monotonic()
+                deadline = started + stage.seconds
+                self._resize(stage.users, deadline)
+                time.sleep(max(deadline - time.monotonic(), 0))
+                elapsed = time.monotonic() - started
+
+                totals, endpoints = self.recorder.stage_summary(index)
+                row = {"users": stage.users, "seconds": round(elapsed, 2), **totals,
+                       "rps": round(totals["requests"] / elapsed, 2), "endpoints": endpoints}
+                stage_rows.append(row)
+                if progress:
+                    progress(index, row)
+        finally:
+            for user in self._users:
+                user.stop()
+            for user in self._users:
+                user.join(timeout=self.timeout)
+            self._users = []
+
+        return {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "base_url": self.base_url,
+            "mix": self.mix,
+            "ramp_seconds": self.ramp_seconds,
+            "think_seconds": self.think_seconds,
+            "seed": self.seed,
+            "stages": stage_rows,
+            "saturation": find_saturation(stage_rows),
+        }
+
+
+def find_saturation(stages):
+    """The last stage that still scaled, and the first that did not (None if all did)."""
+    peak = None
+    for index, row in enumerate(stages):
+        if row["error_rate"] > SATURATION_ERROR_RATE and row["requests"]:
+            return {"peak": peak, "saturated": {"stage": index, "users": row["users"], "reason": "errors"}}
+        if peak is not None and row["users"] > stages[peak]["users"]:
+            if row["rps"] < stages[peak]["rps"] * (1 + SATURATION_GAIN):
+                return {"peak": peak, "saturated": {"stage": index, "users": row["users"], "reason": "throughput"}}
+        if peak is None or row["rps"] >= stages[peak]["rps"]:
+            peak = index
+    return {"peak": peak, "saturated": None}
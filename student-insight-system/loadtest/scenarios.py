@@ -0,0 +1,215 @@
+"""
+Virtual users and the traffic they generate.
+
+A virtual user signs in once as a seeded account, then repeatedly picks
+an action by weight, performs it and "thinks" for an exponentially
+distributed pause before the next one. Every HTTP call is recorded under
+the action's name; a call counts as an error when its status is not the
+one a browser would get on success (or the connection failed).
+
+Profiles (the weighted actions of one kind of user):
+
+    student      dashboard, goals & grades page and its AJAX calls,
+                 notifications, weekly routine, study session adds,
+                 weekly check-ins and the occasional AI request
+    student_ai   mostly insight reports and action plans
+    teacher      teacher dashboard, roster API, student detail pages,
+                 alert summary
+
+Mixes say which share of virtual users follows which profile.
+"""
+
+import json
+import threading
+from datetime import date
+
+INSIGHT_POLL_SECONDS = 0.5
+INSIGHT_MAX_POLLS = 60
+
+
+class VirtualUser(threading.Thread):
+    """One simulated browser: an account, a session and a loop of actions."""
+
+    def __init__(self, index, profile, account, session, recorder, rng, think_seconds):
+        super().__init__(name=f"vu-{index}", daemon=True)
+        self.profile = profile
+        self.role, self.actions = PROFILES[profile]
+        self.email, self.password = account
+        self.session = session
+        self.recorder = recorder
+        self.rng = rng
+        self.think_seconds = think_seconds
+        self.stopping = threading.Event()
+        self.logged_in = False
+        self.state = {}
+
+    def run(self):
+        weights = [w for w, _ in self.actions]
+        try:
+            while not self.stopping.is_set():
+                if not self.logged_in:
+                    self.logged_in = login(self)
+                    if not self.logged_in:
+                        self.pause(max(self.think_seconds, 1.0))
+                        continue
+                action = self.rng.choices(self.actions, weights=weights)[0][1]
+                action(self)
+                self.pause(self.think_seconds)
+        finally:
+            self.session.close()
+
+    def stop(self):
+        self.stopping.set()
+
+    def pause(self, mean_seconds):
+        if mean_seconds > 0:
+            self.stopping.wait(self.rng.expovariate(1 / mean_seconds))
+
+    def call(self, name, method, path, expect=200, **kwargs):
+        """Perform and record one request; the response body (bytes) on success, else None."""
+        try:
+            status, _, body, elapsed_ms = self.session.request(method, path, **kwargs)
+        except Exception as exc:
+            self.recorder.record(name, 0.0, ok=False, status=type(exc).__name__)
+            return None
+        ok = status == expect
+        self.recorder.record(name, elapsed_ms, ok=ok, status=status)
+        if status == 401:
+            self.logged_in = False
+        return body if ok else None
+
+    def call_json(self, name, method, path, expect=200, **kwargs):
+        body = self.call(name, method, path, expect=expect, **kwargs)
+        if body is None:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+
+# ── Actions ───────────────────────────────────────────────────
+
+def login(vu):
+    form = {"email": vu.email, "password": vu.password, "role": vu.role}
+    return vu.call("login", "POST", "/login", form=form) is not None
+
+
+def student_dashboard(vu):
+    vu.call("student_dashboard", "GET", "/student/dashboard")
+
+
+def goals_grades_page(vu):
+    vu.call("goals_grades_page", "GET", "/student/goals-grades")
+
+
+def goals_grades_state(vu):
+    vu.call("gg_state", "GET", "/api/gg/state")
+
+
+def set_target_cgpa(vu):
+    target = round(vu.rng.uniform(3.0, 4.0), 2)
+    vu.call("gg_target_cgpa", "POST", "/api/gg/target-cgpa", json_body={"target_cgpa": target})
+
+
+def notifications(vu):
+    vu.call("notifications", "GET", "/api/student/notifications")
+
+
+def weekly_routine(vu):
+    vu.call("weekly_routine", "GET", "/student/weekly-routine")
+
+
+def add_study_session(vu):
+    form = {
+        "date": date.today().isoformat(),
+        "duration_minutes": str(vu.rng.choice((25, 30, 45, 60, 90, 120))),
+        "topic_studied": vu.rng.choice(("Lecture review", "Problem set", "Exam prep", "Reading")),
+    }
+    vu.call("add_study_session", "POST", "/student/add-study-session", expect=302, form=form)
+
+
+def weekly_checkin(vu):
+    form = {
+        "productivity_rating": str(vu.rng.randint(1, 5)),
+        "mood_score": str(vu.rng.randint(1, 5)),
+        "difficulty_rating": vu.rng.choice(("Easy", "Medium", "Hard")),
+    }
+    vu.call("weekly_checkin", "POST", "/student/weekly-checkin", expect=302, form=form)
+
+
+def insight_report(vu):
+    """Queue an insight report (bypassing the response cache) and poll until it finishes."""
+    form = {"department": "CSE", "refresh": "1"}
+    job = vu.call_json("insight_report", "POST", "/student/insight-report", expect=202, form=form)
+    if not job:
+        return
+    for _ in range(INSIGHT_MAX_POLLS):
+        status = vu.call_json("insight_job_status", "GET", f"/api/insight-jobs/{job['job_id']}")
+        if not status or status.get("status") in ("succeeded", "failed"):
+            if status and status["status"] == "failed":
+                vu.recorder.record("insight_job_failed", 0.0, ok=False, status="failed")
+            return
+        vu.pause(INSIGHT_POLL_SECONDS)
+
+
+def action_plan(vu):
+    vu.call("action_plan", "POST", "/api/action-plans/generate")
+
+
+def teacher_dashboard(vu):
+    vu.call("teacher_dashboard", "GET", "/teacher/dashboard")
+
+
+def teacher_roster(vu):
+    rows = vu.call_json("teacher_students", "GET", "/api/teacher/students?fields=id&limit=50")
+    if rows:
+        vu.state["student_ids"] = [row["id"] for row in rows]
+
+
+def teacher_student_detail(vu):
+    if not vu.state.get("student_ids"):
+        teacher_roster(vu)
+    if vu.state.get("student_ids"):
+        student_id = vu.rng.choice(vu.state["student_ids"])
+        vu.call("teacher_student_detail", "GET", f"/teacher/student/{student_id}")
+
+
+def teacher_alerts_summary(vu):
+    vu.call("teacher_alerts_summary", "GET", "/api/teacher/alerts/summary")
+
+
+# (role, [(weight, action)])
+PROFILES = {
+    "student": ("student", [
+        (30, student_dashboard),
+        (15, goals_grades_state),
+        (5, goals_grades_page),
+        (5, set_target_cgpa),
+        (10, notifications),
+        (10, weekly_routine),
+        (10, add_study_session),
+        (5, weekly_checkin),
+        (1, insight_report),
+        (1, action_plan),
+    ]),
+    "student_ai": ("student", [
+        (4, insight_report),
+        (4, action_plan),
+        (2, student_dashboard),
+    ]),
+    "teacher": ("teacher", [
+        (40, teacher_dashboard),
+        (20, teacher_roster),
+        (30, teacher_student_detail),
+        (10, teacher_alerts_summary),
+    ]),
+}
+
+# Share of virtual users per profile
+MIXES = {
+    "semester": {"student": 9, "teacher": 1},
+    "students": {"student": 1},
+    "teachers": {"teacher": 1},
+    "ai": {"student_ai": 1},
+}
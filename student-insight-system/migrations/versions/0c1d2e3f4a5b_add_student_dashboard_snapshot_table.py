@@ -0,0 +1,33 @@
+"""add student_dashboard_snapshot table
+
+Revision ID: 0c1d2e3f4a5b
+Revises: a99cca2aaed1
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0c1d2e3f4a5b'
+down_revision = 'a99cca2aaed1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('student_dashboard_snapshot',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('schema_version', sa.Integer(), nullable=False),
+    sa.Column('is_stale', sa.Boolean(), nullable=False, server_default='false'),
+    sa.Column('built_for_date', sa.Date(), nullable=False),
+    sa.Column('built_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['student_profile.id'], ),
+    sa.PrimaryKeyConstraint('student_id')
+    )
+
+
+def downgrade():
+    op.drop_table('student_dashboard_snapshot')
@@ -0,0 +1,32 @@
+"""add recalc_job table
+
+Revision ID: 1d2e3f4a5b6c
+Revises: 0c1d2e3f4a5b
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1d2e3f4a5b6c'
+down_revision = '0c1d2e3f4a5b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('recalc_job',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('requested_at', sa.DateTime(), nullable=False),
+    sa.Column('claimed_at', sa.DateTime(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['student_profile.id'], ),
+    sa.PrimaryKeyConstraint('student_id')
+    )
+
+
+def downgrade():
+    op.drop_table('recalc_job')
@@ -0,0 +1,41 @@
+"""add ai_response_cache table
+
+Revision ID: 2e3f4a5b6c7d
+Revises: 1d2e3f4a5b6c
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2e3f4a5b6c7d'
+down_revision = '1d2e3f4a5b6c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ai_response_cache',
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('model_name', sa.String(length=100), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('response', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('last_accessed_at', sa.DateTime(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.PrimaryKeyConstraint('cache_key')
+    )
+    with op.batch_alter_table('ai_response_cache', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_ai_response_cache_expires_at'), ['expires_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_ai_response_cache_last_accessed_at'), ['last_accessed_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ai_response_cache', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_ai_response_cache_last_accessed_at'))
+        batch_op.drop_index(batch_op.f('ix_ai_response_cache_expires_at'))
+
+    op.drop_table('ai_response_cache')
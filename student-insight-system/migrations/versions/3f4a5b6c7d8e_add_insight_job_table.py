@@ -0,0 +1,42 @@
+"""add insight_job table
+
+Revision ID: 3f4a5b6c7d8e
+Revises: 2e3f4a5b6c7d
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f4a5b6c7d8e'
+down_revision = '2e3f4a5b6c7d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('insight_job',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('form_data', sa.Text(), nullable=False),
+    sa.Column('insight_id', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['insight_id'], ['student_insight.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['student_profile.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('insight_job', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_insight_job_student_id'), ['student_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('insight_job', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_insight_job_student_id'))
+
+    op.drop_table('insight_job')
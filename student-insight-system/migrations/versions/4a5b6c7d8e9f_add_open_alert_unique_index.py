@@ -0,0 +1,46 @@
+"""add partial unique index on open student alerts
+
+Revision ID: 4a5b6c7d8e9f
+Revises: 3f4a5b6c7d8e
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4a5b6c7d8e9f'
+down_revision = '3f4a5b6c7d8e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Resolve duplicate open alerts first, keeping the newest of each (student, type).
+    epoch = datetime(1970, 1, 1)
+    op.get_bind().execute(
+        sa.text(
+            "UPDATE student_alert SET is_resolved = :resolved "
+            "WHERE NOT is_resolved AND EXISTS ("
+            "  SELECT 1 FROM student_alert newer"
+            "  WHERE newer.student_id = student_alert.student_id"
+            "    AND newer.type = student_alert.type"
+            "    AND NOT newer.is_resolved"
+            "    AND (COALESCE(newer.created_at, :epoch) > COALESCE(student_alert.created_at, :epoch)"
+            "         OR (COALESCE(newer.created_at, :epoch) = COALESCE(student_alert.created_at, :epoch)"
+            "             AND newer.id > student_alert.id)))"
+        ).bindparams(sa.bindparam("epoch", epoch, type_=sa.DateTime()), resolved=True)
+    )
+
+    with op.batch_alter_table('student_alert', schema=None) as batch_op:
+        batch_op.create_index('uq_student_alert_open_type', ['student_id', 'type'], unique=True,
+                              postgresql_where=sa.text('NOT is_resolved'),
+                              sqlite_where=sa.text('NOT is_resolved'))
+
+
+def downgrade():
+    with op.batch_alter_table('student_alert', schema=None) as batch_op:
+        batch_op.drop_index('uq_student_alert_open_type')
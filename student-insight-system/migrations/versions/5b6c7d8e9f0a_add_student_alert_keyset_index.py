@@ -0,0 +1,27 @@
+"""add (is_resolved, created_at, id) index for alert keyset pagination
+
+Revision ID: 5b6c7d8e9f0a
+Revises: 4a5b6c7d8e9f
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b6c7d8e9f0a'
+down_revision = '4a5b6c7d8e9f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('student_alert', schema=None) as batch_op:
+        batch_op.create_index('ix_student_alert_resolved_created_id',
+                              ['is_resolved', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('student_alert', schema=None) as batch_op:
+        batch_op.drop_index('ix_student_alert_resolved_created_id')
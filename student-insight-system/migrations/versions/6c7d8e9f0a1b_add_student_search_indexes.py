@@ -0,0 +1,66 @@
+"""add student search indexes (pg_trgm on PostgreSQL, FTS5 on SQLite)
+
+Revision ID: 6c7d8e9f0a1b
+Revises: 5b6c7d8e9f0a
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6c7d8e9f0a1b'
+down_revision = '5b6c7d8e9f0a'
+branch_labels = None
+depends_on = None
+
+# Schema as of this revision; the app keeps its own copy in services/student_search.py.
+FTS_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS student_search_fts_ai AFTER INSERT ON student_profile BEGIN
+        INSERT INTO student_search_fts(rowid, full_name, student_code)
+        VALUES (new.id, new.full_name, new.student_code);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS student_search_fts_ad AFTER DELETE ON student_profile BEGIN
+        INSERT INTO student_search_fts(student_search_fts, rowid, full_name, student_code)
+        VALUES ('delete', old.id, old.full_name, old.student_code);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS student_search_fts_au
+        AFTER UPDATE OF full_name, student_code ON student_profile BEGIN
+        INSERT INTO student_search_fts(student_search_fts, rowid, full_name, student_code)
+        VALUES ('delete', old.id, old.full_name, old.student_code);
+        INSERT INTO student_search_fts(rowid, full_name, student_code)
+        VALUES (new.id, new.full_name, new.student_code);
+    END""",
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.execute('CREATE INDEX IF NOT EXISTS ix_student_profile_full_name_trgm '
+                   'ON student_profile USING gin (full_name gin_trgm_ops)')
+        op.execute('CREATE INDEX IF NOT EXISTS ix_student_profile_student_code_trgm '
+                   'ON student_profile USING gin (student_code gin_trgm_ops)')
+    elif bind.dialect.name == 'sqlite':
+        try:
+            op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS student_search_fts USING fts5("
+                       "full_name, student_code, content='student_profile', content_rowid='id', "
+                       "tokenize='trigram')")
+        except sa.exc.OperationalError:
+            return  # no FTS5 in this SQLite build; search falls back to the in-memory index
+        for statement in FTS_TRIGGERS:
+            op.execute(statement)
+        op.execute("INSERT INTO student_search_fts(student_search_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_student_profile_student_code_trgm')
+        op.execute('DROP INDEX IF EXISTS ix_student_profile_full_name_trgm')
+    elif bind.dialect.name == 'sqlite':
+        for name in ('student_search_fts_ai', 'student_search_fts_ad', 'student_search_fts_au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {name}')
+        op.execute('DROP TABLE IF EXISTS student_search_fts')
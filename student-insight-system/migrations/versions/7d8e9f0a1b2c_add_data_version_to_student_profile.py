@@ -0,0 +1,26 @@
+"""add data_version to student_profile (ETags for student JSON APIs)
+
+Revision ID: 7d8e9f0a1b2c
+Revises: 6c7d8e9f0a1b
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d8e9f0a1b2c'
+down_revision = '6c7d8e9f0a1b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('student_profile', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('student_profile', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
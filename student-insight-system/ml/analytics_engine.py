@@ -1,8 +1,40 @@
-import numpy as np
 import json
-from sklearn.linear_model import LinearRegression
+from functools import lru_cache
 from models import db, StudentProfile, AcademicMetric, StudentSkill, StudentCourse, CareerInterest, AnalyticsResult
 
+
+def forecast_next_gpas(series):
+    """
+    Ordinary least-squares fit of GPA against semester index for many
+    students at once; returns the clamped, rounded next-semester value
+    for each series (each needs >= 2 points).
+
+    Same least-squares line as LinearRegression().fit(range(n), gpas):
+    the ragged series are padded into one matrix and masked. The two
+    agree to float precision; only an exact x.xx5 tie can round apart.
+    """
+    import numpy as np  # deferred: keeps numpy out of web worker startup
+
+    lengths = np.array([len(s) for s in series])
+    mask = np.arange(lengths.max()) < lengths[:, None]
+    y = np.zeros(mask.shape)
+    y[mask] = np.concatenate([np.asarray(s, dtype=float) for s in series])
+
+    n = lengths.astype(float)
+    x_mean = (n - 1) / 2
+    y_mean = np.where(mask, y, 0.0).sum(axis=1) / n
+    dx = np.where(mask, np.arange(mask.shape[1]) - x_mean[:, None], 0.0)
+    slope = (dx * (y - y_mean[:, None])).sum(axis=1) / (dx * dx).sum(axis=1)
+    intercept = y_mean - x_mean * slope
+    predictions = slope * n + intercept
+    return [round(min(max(p, 0.0), 4.0), 2) for p in predictions]
+
+
+@lru_cache(maxsize=4096)
+def _forecast_one(gpas):
+    return forecast_next_gpas([gpas])[0]
+
+
 class AnalyticsEngine:
     def __init__(self):
         self.career_keywords = {
@@ -16,27 +48,45 @@ class AnalyticsEngine:
         }
 
     def predict_next_gpa(self, student_id):
-        """Predict next semester GPA using Linear Regression on past grades"""
-        metric = AcademicMetric.query.filter_by(student_id=student_id).first()
-        if not metric or not metric.semester_gpas:
-            return 0.0
-            
-        gpas = metric.get_gpas()
+        """Predict next semester GPA from the linear trend of past semester GPAs"""
+        gpas = self._load_gpa_series([student_id]).get(student_id, [])
         if len(gpas) < 2:
             return gpas[0] if gpas else 0.0
-            
-        X = np.array(range(len(gpas))).reshape(-1, 1)
-        y = np.array(gpas)
-        
-        model = LinearRegression()
-        model.fit(X, y)
-        
-        next_semester_index = np.array([[len(gpas)]])
-        prediction = model.predict(next_semester_index)[0]
-        return round(min(max(prediction, 0.0), 4.0), 2)
+        # Forecasts depend only on the GPA series, so identical series are memoised.
+        return _forecast_one(tuple(gpas))
+
+    def predict_next_gpa_many(self, student_ids):
+        """Predict next semester GPA for many students with one query and one fit: {student_id: gpa}"""
+        series = self._load_gpa_series(student_ids)
+        predictions = {}
+        trends = {}
+        for student_id in student_ids:
+            gpas = series.get(student_id, [])
+            if len(gpas) < 2:
+                predictions[student_id] = gpas[0] if gpas else 0.0
+            else:
+                trends[student_id] = gpas
+        if trends:
+            predictions.update(zip(trends, forecast_next_gpas(list(trends.values()))))
+        return predictions
+
+    def _load_gpa_series(self, student_ids):
+        rows = (
+            db.session.query(AcademicMetric.student_id, AcademicMetric.semester_gpas)
+            .filter(AcademicMetric.student_id.in_(list(student_ids)))
+            .order_by(AcademicMetric.id)
+            .all()
+        )
+        series = {}
+        for student_id, raw in rows:
+            if student_id not in series:  # first metric row per student
+                series[student_id] = json.loads(raw) if raw else []
+        return series
 
     def analyze_career_interests(self, student_id):
         """AI-driven scoring of career interests based on skills and course performance"""
+        import numpy as np  # deferred: keeps numpy out of web worker startup
+
         skills = StudentSkill.query.filter_by(student_id=student_id).all()
         courses = StudentCourse.query.filter_by(student_id=student_id).all()
         
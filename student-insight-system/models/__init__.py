@@ -59,4 +59,11 @@ from models.analytics import (  # noqa: F401
     AnalyticsResult,
     StudentInsight,
     ChatHistory,
+    AIResponseCache,
 )
+
+# ── Read Models ──
+from models.snapshots import StudentDashboardSnapshot  # noqa: F401
+
+# ── Background Jobs ──
+from models.jobs import RecalcJob, InsightJob  # noqa: F401
@@ -39,6 +39,12 @@ class StudentAlert(db.Model):
     __table_args__ = (
         db.Index('ix_student_alert_student_resolved', 'student_id', 'is_resolved'),
         db.Index('ix_student_alert_created_at', 'created_at'),
+        # Keyset pagination of open alerts: ORDER BY created_at DESC, id DESC
+        db.Index('ix_student_alert_resolved_created_id', 'is_resolved', 'created_at', 'id'),
+        # At most one open alert of each type per student (see services/alert_engine.py)
+        db.Index('uq_student_alert_open_type', 'student_id', 'type', unique=True,
+                 postgresql_where=db.text('NOT is_resolved'),
+                 sqlite_where=db.text('NOT is_resolved')),
     )
 
     student = db.relationship('StudentProfile', backref='alerts')
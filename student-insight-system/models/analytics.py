@@ -42,3 +42,20 @@ class ChatHistory(db.Model):
 
     context_data_snapshot = db.Column(db.Text)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class AIResponseCache(db.Model):
+    """
+    Cached AI provider responses, keyed by a hash of the normalised
+    prompt plus the model name. Shared by every process.
+    """
+    __tablename__ = 'ai_response_cache'
+
+    cache_key = db.Column(db.String(64), primary_key=True)
+    model_name = db.Column(db.String(100), nullable=False)
+    kind = db.Column(db.String(10), nullable=False)  # 'text' or 'json'
+    response = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    last_accessed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    hit_count = db.Column(db.Integer, default=0, nullable=False)
@@ -0,0 +1,51 @@
+"""Persisted background job state."""
+
+from datetime import datetime
+from core.extensions import db
+
+
+class RecalcJob(db.Model):
+    """
+    A pending weekly-update recalculation for one student.
+    One row per student: repeated edits only bump ``requested_at``,
+    so a burst of saves coalesces into a single recalculation.
+    """
+    __tablename__ = 'recalc_job'
+
+    student_id = db.Column(db.Integer, db.ForeignKey('student_profile.id'), primary_key=True)
+    requested_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+
+    student = db.relationship(
+        'StudentProfile',
+        backref=db.backref('recalc_job', uselist=False, cascade="all, delete-orphan"),
+    )
+
+
+class InsightJob(db.Model):
+    """
+    An AI insight report generated in the background.
+    The POST handler creates the row and returns its id straight away;
+    the browser polls the row's status until the report is ready.
+    """
+    __tablename__ = 'insight_job'
+
+    QUEUED, RUNNING, SUCCEEDED, FAILED = 'queued', 'running', 'succeeded', 'failed'
+
+    id = db.Column(db.String(32), primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('student_profile.id'), nullable=False, index=True)
+    status = db.Column(db.String(20), nullable=False, default=QUEUED)
+    form_data = db.Column(db.Text, nullable=False)
+    insight_id = db.Column(db.Integer, db.ForeignKey('student_insight.id'), nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    student = db.relationship(
+        'StudentProfile',
+        backref=db.backref('insight_jobs', cascade="all, delete-orphan"),
+    )
+    insight = db.relationship('StudentInsight')
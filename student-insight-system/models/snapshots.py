@@ -0,0 +1,27 @@
+"""Materialised read models (pre-computed page payloads)."""
+
+from datetime import datetime
+from core.extensions import db
+
+
+class StudentDashboardSnapshot(db.Model):
+    """
+    One row per student holding the serialised /student/dashboard payload.
+    Rebuilt on write by the recalculation engine; read with a single
+    primary-key lookup. A row is only served while ``is_stale`` is False,
+    ``schema_version`` matches the current payload shape and it was built
+    for today's date (the weekly chart is a rolling 7-day window).
+    """
+    __tablename__ = 'student_dashboard_snapshot'
+
+    student_id = db.Column(db.Integer, db.ForeignKey('student_profile.id'), primary_key=True)
+    payload = db.Column(db.Text, nullable=False)
+    schema_version = db.Column(db.Integer, nullable=False, default=1)
+    is_stale = db.Column(db.Boolean, nullable=False, default=False)
+    built_for_date = db.Column(db.Date, nullable=False)
+    built_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    student = db.relationship(
+        'StudentProfile',
+        backref=db.backref('dashboard_snapshot', uselist=False, cascade="all, delete-orphan"),
+    )
@@ -1,6 +1,9 @@
 """Student profile and academic metrics."""
 
 import json
+
+from sqlalchemy.ext.hybrid import hybrid_property
+
 from core.extensions import db
 
 
@@ -32,6 +35,9 @@ class StudentProfile(db.Model):
     completed_credits = db.Column(db.Integer)
     target_cgpa = db.Column(db.Float)
 
+    # Bumped on every write to this student's data (core/data_version.py)
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
     # Relationships
     academic_metrics = db.relationship(
         'AcademicMetric', backref='student', uselist=False, cascade="all, delete-orphan"
@@ -60,7 +66,7 @@ class StudentProfile(db.Model):
             'current_cgpa': self.current_cgpa
         }
 
-    @property
+    @hybrid_property
     def performance_status(self):
         """Return performance status: good, average, or at-risk"""
         if not self.current_cgpa:
@@ -72,6 +78,17 @@ class StudentProfile(db.Model):
         else:
             return 'at-risk'
 
+    @performance_status.expression
+    def performance_status(cls):
+        """SQL twin of the property, so status filters run in the database."""
+        cgpa = cls.current_cgpa
+        return db.case(
+            (db.or_(cgpa.is_(None), cgpa == 0), 'unknown'),
+            (cgpa >= 3.5, 'good'),
+            (cgpa >= 2.5, 'average'),
+            else_='at-risk',
+        )
+
 
 class AcademicMetric(db.Model):
     id = db.Column(db.Integer, primary_key=True)
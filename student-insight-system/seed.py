@@ -0,0 +1,563 @@
+"""
+Synthetic data generator for development, benchmarks and load tests.
+
+    python seed.py --students --teacher --skills-catalog        # make seed (1,000 students)
+    python seed.py --all --num-students 100000 --seed 7         # benchmark scale
+    python seed.py --students --num-students 5000 --weeks 26 --sessions-per-student 60
+
+What is generated:
+
+  --skills-catalog  skills, career paths with required skills, the course
+                    catalog and quizzes / exams, from the department data
+                    used by the profile forms
+  --students        users + student profiles, graded courses (with the
+                    CGPA they imply), skills with weekly progress history,
+                    career goals, study sessions, weekly check-ins,
+                    attendance, assessment results and open / resolved alerts
+  --teacher         teachers, each assigned a block of students, with notes
+
+Rows are written in batches straight through the table (``executemany``),
+or with ``COPY ... FROM STDIN`` on PostgreSQL; primary keys are allocated
+here, so nothing is read back and memory stays flat at any scale. All
+randomness comes from ``--seed``, with a separate stream per student (and
+for the catalog and teachers), so the same seed, scale and ``--today``
+always give the same rows.
+
+Every seeded account uses the password given by ``--password``
+(default ``password123``).
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, select, text
+from werkzeug.security import generate_password_hash
+
+logger = logging.getLogger("seed")
+
+FIRST_NAMES = [
+    "Amir", "Beatriz", "Chen", "Dmitri", "Esther", "Farah", "Goran", "Hana", "Imran", "Julia",
+    "Kofi", "Lena", "Mateo", "Nadia", "Omar", "Priya", "Quentin", "Rania", "Sami", "Tanvir",
+    "Uma", "Victor", "Wen", "Ximena", "Yusuf", "Zara", "Arif", "Bushra", "Daniel", "Elif",
+    "Fahim", "Grace", "Hasan", "Ines", "Jamal", "Kavya", "Lucas", "Maya", "Nabil", "Olga",
+]
+LAST_NAMES = [
+    "Ahmed", "Okafor", "Lindqvist", "Tanaka", "Moreau", "Haddad", "Novak", "Silva", "Kowalski",
+    "Rahman", "Chowdhury", "Garcia", "Hossain", "Ivanova", "Jensen", "Khan", "Lopez", "Mensah",
+    "Nguyen", "Osei", "Petrov", "Quispe", "Rossi", "Sato", "Torres", "Islam", "Varga", "Weber",
+    "Yilmaz", "Zhang",
+]
+SECTIONS = ["A", "B", "C", "D"]
+GRADES = [  # (grade, grade point, weight)
+    ("A+", 4.0, 8), ("A", 4.0, 12), ("A-", 3.7, 14), ("B+", 3.3, 16), ("B", 3.0, 15),
+    ("B-", 2.7, 11), ("C+", 2.3, 9), ("C", 2.0, 7), ("D", 1.0, 5), ("F", 0.0, 3),
+]
+ALERT_TYPES = [  # (type, severity, message) — mirrors services/alert_engine.py
+    ("burnout_risk", "high", "Burnout risk has been high for two weeks"),
+    ("inactivity", "warning", "No activity in the last 7 days"),
+    ("cgpa_drop", "medium", "CGPA dropped since last semester"),
+    ("failing_assessments", "high", "Failing several recent assessments"),
+    ("low_attendance", "warning", "Attendance below 75% this month"),
+]
+NOTES = [
+    "Great progress this week — keep it up.",
+    "Please review the last quiz before Friday.",
+    "Let's discuss your project plan in office hours.",
+    "Your attendance has slipped; reach out if something is wrong.",
+    "Consider the data structures elective next semester.",
+]
+TOPICS = ["Lecture review", "Problem set", "Lab report", "Exam prep", "Reading", "Project work"]
+
+
+class BulkWriter:
+    """Batched inserts into one connection: COPY on PostgreSQL, executemany elsewhere."""
+
+    def __init__(self, connection, batch_size=5000):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.counts = {}
+        self._copy = connection.dialect.name == "postgresql" and self._copy_supported()
+
+    def _copy_supported(self):
+        cursor = self.connection.connection.driver_connection.cursor()
+        try:
+            return hasattr(cursor, "copy_expert") or hasattr(cursor, "copy")
+        finally:
+            cursor.close()
+
+    def write(self, table, rows):
+        """Insert an iterable of dicts (all with the same keys) into ``table``."""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._flush(table, batch)
+                batch = []
+        if batch:
+            self._flush(table, batch)
+
+    def _flush(self, table, batch):
+        if self._copy:
+            self._copy_rows(table, batch)
+        else:
+            self.connection.execute(table.insert(), batch)
+        self.counts[table.name] = self.counts.get(table.name, 0) + len(batch)
+
+    def _copy_rows(self, table, batch):
+        columns = list(batch[0])
+        buffer = io.StringIO()
+        out = csv.writer(buffer)
+        for row in batch:
+            out.writerow([r"\N" if row[c] is None else row[c] for c in columns])
+        buffer.seek(0)
+
+        prep = self.connection.dialect.identifier_preparer
+        sql = (
+            f"COPY {prep.format_table(table)} ({', '.join(prep.quote(c) for c in columns)}) "
+            r"FROM STDIN WITH (FORMAT csv, NULL '\N')"
+        )
+        cursor = self.connection.connection.driver_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):       # psycopg2
+                cursor.copy_expert(sql, buffer)
+            else:                                   # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+        finally:
+            cursor.close()
+
+    def reset_sequences(self, tables):
+        """Move PostgreSQL id sequences past the ids allocated here."""
+        if self.connection.dialect.name != "postgresql":
+            return
+        prep = self.connection.dialect.identifier_preparer
+        for table in tables:
+            if table.name not in self.counts:
+                continue
+            name = prep.format_table(table)
+            self.connection.execute(text(
+                f"SELECT setval(pg_get_serial_sequence(:table, 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {name}))"
+            ), {"table": name})
+
+
+class Seeder:
+    """Generates one dataset; each ``seed_*`` step commits in batches."""
+
+    def __init__(self, connection, seed=42, today=None, batch_size=5000,
+                 password="password123", weeks=12, sessions_per_student=20):
+        self.connection = connection
+        self.seed = seed
+        self.today = today or date.today()
+        self.week_start = self.today - timedelta(days=self.today.weekday())
+        self.weeks = weeks
+        self.sessions_per_student = sessions_per_student
+        self.writer = BulkWriter(connection, batch_size)
+        self.password_hash = generate_password_hash(password)
+        self._next_ids = {}
+
+    # ── helpers ───────────────────────────────────────────────
+
+    def rng(self, name):
+        """Independent, reproducible stream for one student / step."""
+        return random.Random(f"{self.seed}:{name}")
+
+    def allocate(self, table, n):
+        """Reserve ``n`` consecutive primary keys in ``table``."""
+        if table.name not in self._next_ids:
+            current = self.connection.execute(select(func.max(table.c.id))).scalar() or 0
+            self._next_ids[table.name] = current + 1
+        start = self._next_ids[table.name]
+        self._next_ids[table.name] = start + n
+        return range(start, start + n)
+
+    def _tables(self):
+        from models import (
+            Assessment, AssessmentResult, Attendance, AcademicMetric, CareerPath,
+            CareerRequiredSkill, CourseCatalog, Skill, StudentAcademicRecord, StudentAlert,
+            StudentGoal, StudentNote, StudentProfile, StudentSkill, StudentSkillProgress,
+            StudySession, TeacherAssignment, TeacherProfile, User, WeeklyUpdate,
+        )
+        models = (
+            User, StudentProfile, TeacherProfile, TeacherAssignment, Skill, CareerPath,
+            CareerRequiredSkill, CourseCatalog, Assessment, StudentAcademicRecord, AcademicMetric,
+            StudentSkill, StudentSkillProgress, StudentGoal, StudySession, WeeklyUpdate,
+            Attendance, AssessmentResult, StudentAlert, StudentNote,
+        )
+        return {m.__name__: m.__table__ for m in models}
+
+    def _catalog(self):
+        t = self._tables()
+        ids = lambda table: [r[0] for r in self.connection.execute(select(table.c.id).order_by(table.c.id))]
+        skills = self.connection.execute(select(t["Skill"].c.id, t["Skill"].c.skill_name)).all()
+        return {
+            "skills": {name: sid for sid, name in skills},
+            "careers": ids(t["CareerPath"]),
+            "courses": self.connection.execute(
+                select(t["CourseCatalog"].c.id, t["CourseCatalog"].c.credit_value)
+            ).all(),
+            "assessments": ids(t["Assessment"]),
+        }
+
+    # ── catalog ───────────────────────────────────────────────
+
+    def seed_catalog(self):
+        """Skills, careers (+ required skills), courses and assessments."""
+        from dashboard.routes import DEPT_CAREERS_SKILLS
+
+        t = self._tables()
+        if self.connection.execute(select(func.count()).select_from(t["Skill"])).scalar():
+            logger.info("Catalog already present — skipped")
+            return
+        rng = self.rng("catalog")
+
+        skill_dept = {}
+        for dept, data in DEPT_CAREERS_SKILLS.items():
+            for name in data["skills"]:
+                skill_dept.setdefault(name, dept)
+        skill_ids = dict(zip(skill_dept, self.allocate(t["Skill"], len(skill_dept))))
+        self.writer.write(t["Skill"], (
+            {"id": skill_ids[name], "skill_name": name, "department": dept}
+            for name, dept in skill_dept.items()
+        ))
+
+        careers = {}
+        for dept, data in DEPT_CAREERS_SKILLS.items():
+            for title in data["careers"]:
+                careers.setdefault(title, (dept, data["skills"]))
+        career_ids = dict(zip(careers, self.allocate(t["CareerPath"], len(careers))))
+        self.writer.write(t["CareerPath"], (
+            {"id": career_ids[title], "title": title, "field_category": dept,
+             "description": f"{title} ({dept})"}
+            for title, (dept, _) in careers.items()
+        ))
+        required = []
+        for title, (_, dept_skills) in careers.items():
+            for name in rng.sample(dept_skills, min(len(dept_skills), rng.randint(4, 6))):
+                required.append({"career_id": career_ids[title], "skill_id": skill_ids[name],
+                                 "importance_level": rng.choice(["High", "Medium", "Low"])})
+        required_ids = self.allocate(t["CareerRequiredSkill"], len(required))
+        self.writer.write(t["CareerRequiredSkill"], (dict(r, id=i) for i, r in zip(required_ids, required)))
+
+        courses = []
+        for dept in DEPT_CAREERS_SKILLS:
+            short = dept.split("(")[-1].rstrip(")") if "(" in dept else dept.split()[0]
+            for n in range(1, 9):
+                courses.append({"course_name": f"{short} {100 * ((n + 1) // 2) + n}",
+                                "department": dept, "course_type": "Core", "credit_value": 3})
+            courses.append({"course_name": f"{short} Elective", "department": dept,
+                            "course_type": "Elective", "credit_value": 3})
+        for n, name in enumerate(["English Composition", "Bangla Language", "History",
+                                  "Statistics", "Economics", "Ethics"]):
+            courses.append({"course_name": name, "department": "General", "course_type": "GED",
+                            "credit_value": 2 + n % 2})
+        course_ids = self.allocate(t["CourseCatalog"], len(courses))
+        self.writer.write(t["CourseCatalog"], (dict(c, id=i) for i, c in zip(course_ids, courses)))
+
+        assessment_ids = self.allocate(t["Assessment"], 60)
+        self.writer.write(t["Assessment"], (
+            {"id": aid, "title": f"{('Quiz', 'Midterm', 'Final')[n % 3]} {n + 1}",
+             "type": "quiz" if n % 3 == 0 else "exam", "subject": rng.choice(list(skill_dept)),
+             "total_points": 20.0 if n % 3 == 0 else 100.0,
+             "date": self.today - timedelta(days=3 * (60 - n)),
+             "created_at": datetime.combine(self.today - timedelta(days=3 * (60 - n)), datetime.min.time())}
+            for n, aid in enumerate(assessment_ids)
+        ))
+        self.connection.commit()
+        logger.info("Catalog: %d skills, %d careers, %d courses", len(skill_ids), len(career_ids), len(courses))
+
+    # ── students ──────────────────────────────────────────────
+
+    def seed_students(self, count, chunk=2000):
+        """``count`` students with their full history, written ``chunk`` students at a time."""
+        catalog = self._catalog()
+        if not catalog["skills"] or not catalog["courses"]:
+            raise SystemExit("No catalog in the database — run with --skills-catalog first")
+        t = self._tables()
+        user_ids = self.allocate(t["User"], count)
+        student_ids = self.allocate(t["StudentProfile"], count)
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            self._student_chunk(
+                list(zip(user_ids[start:stop], student_ids[start:stop])), catalog, t,
+            )
+            self.connection.commit()
+            logger.info("Students: %d / %d", stop, count)
+        return list(student_ids)
+
+    def _student_chunk(self, pairs, catalog, t):
+        from dashboard.routes import DEPT_CAREERS_SKILLS
+
+        departments = list(DEPT_CAREERS_SKILLS)
+        skill_names = list(catalog["skills"])
+        now = datetime.combine(self.today, datetime.min.time()) + timedelta(hours=12)
+        users, profiles, metrics, records = [], [], [], []
+        skills, progress, goals, sessions, updates = [], [], [], [], []
+        attendance, results, alerts = [], [], []
+
+        for user_id, student_id in pairs:
+            rng = self.rng(f"student:{student_id}")
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            dept = rng.choice(departments)
+            year = rng.randint(1, 4)
+            semesters = 2 * (year - 1) + rng.randint(0, 1)
+            ability = rng.gauss(0, 1)  # drives grades, proficiency and burnout together
+
+            # graded courses → CGPA
+            semester_gpas, points, credits = [], 0.0, 0
+            taken = rng.sample(catalog["courses"], min(len(catalog["courses"]), 5 * semesters))
+            for sem in range(1, semesters + 1):
+                sem_points = sem_credits = 0
+                for course_id, credit in taken[5 * (sem - 1):5 * sem]:
+                    grade, gp = _grade(rng, ability)
+                    records.append({"student_id": student_id, "course_id": course_id, "grade": grade,
+                                    "grade_point": gp, "confidence_score": rng.randint(40, 100),
+                                    "semester_taken": sem})
+                    sem_points += gp * (credit or 3)
+                    sem_credits += credit or 3
+                semester_gpas.append(round(sem_points / sem_credits, 2) if sem_credits else 0)
+                points, credits = points + sem_points, credits + sem_credits
+            cgpa = round(points / credits, 2) if credits else None
+
+            active = rng.random() > 0.08
+            users.append({"id": user_id, "email": f"student{student_id}@seed.example.edu",
+                          "password_hash": self.password_hash, "role": "student"})
+            profiles.append({
+                "id": student_id, "user_id": user_id, "full_name": f"{first} {last}",
+                "student_code": f"S{student_id:07d}", "department": dept,
+                "class_level": str(year), "section": rng.choice(SECTIONS),
+                "current_cgpa": cgpa, "target_cgpa": min(4.0, round((cgpa or 3.0) + rng.uniform(0.1, 0.5), 2)),
+                "completed_credits": credits, "current_semester": semesters + 1,
+                "university": "Seed University", "current_year": str(year),
+                "last_activity": now - timedelta(days=rng.randint(0, 3) if active else rng.randint(8, 40),
+                                                 minutes=rng.randint(0, 600)),
+            })
+            metrics.append({"student_id": student_id, "semester_gpas": json.dumps(semester_gpas),
+                            "total_credits": credits})
+
+            # skills with weekly progress
+            for name in rng.sample(skill_names, rng.randint(3, 8)):
+                proficiency = max(5, min(100, int(55 + 15 * ability + rng.gauss(0, 12))))
+                risk = round(max(0.0, min(1.0, 0.5 - ability * 0.15 + rng.gauss(0, 0.15))), 2)
+                skills.append({"student_id": student_id, "skill_id": catalog["skills"][name],
+                               "skill_name": name, "proficiency_score": proficiency,
+                               "risk_score": risk, "last_updated": now})
+                level = max(0, proficiency - 4 * self.weeks)
+                for week in range(self.weeks, 0, -1):
+                    level = min(proficiency, level + rng.randint(0, 8))
+                    progress.append({"skill_index": len(skills) - 1,
+                                     "date": self.week_start - timedelta(weeks=week - 1),
+                                     "proficiency_score": level, "risk_score": risk})
+
+            # goals
+            for n, career_id in enumerate(rng.sample(catalog["careers"], rng.randint(1, 3))):
+                goals.append({"student_id": student_id, "career_id": career_id,
+                              "goal_type": rng.choice(["Long Term", "Short Term"]),
+                              "reason": rng.choice(["Interest", "Salary", "Family", "Impact"]),
+                              "is_primary": n == 0})
+
+            # study sessions over the last ``weeks`` weeks (active students only this week)
+            horizon = 7 * self.weeks
+            for _ in range(self.sessions_per_student if active else self.sessions_per_student // 3):
+                days_ago = rng.randint(0 if active else 8, horizon)
+                sessions.append({"student_id": student_id, "date": self.today - timedelta(days=days_ago),
+                                 "duration_minutes": rng.choice([25, 30, 45, 60, 90, 120]),
+                                 "topic_studied": rng.choice(TOPICS),
+                                 "related_skill": rng.choice(skill_names)})
+
+            # weekly check-ins
+            burnout = max(0.0, min(1.0, 0.35 - 0.1 * ability + rng.gauss(0, 0.1)))
+            for week in range(self.weeks, 0, -1):
+                burnout = max(0.0, min(1.0, burnout + rng.gauss(0, 0.08)))
+                updates.append({
+                    "student_id": student_id, "week_start_date": self.week_start - timedelta(weeks=week),
+                    "total_hours_studied": round(max(0.0, rng.gauss(8 + 2 * ability, 3)), 1),
+                    "productivity_rating": rng.randint(1, 5),
+                    "difficulty_rating": rng.choice(["Easy", "Medium", "Hard"]),
+                    "consistency_score": round(rng.uniform(0.1, 1.0), 2),
+                    "burnout_risk_score": round(burnout, 2),
+                    "goal_achievability_prob": round(max(0.0, min(1.0, 0.6 + 0.15 * ability)), 2),
+                    "status_label": "On Track" if burnout < 0.6 else "At Risk",
+                    "mood_score": rng.randint(1, 5), "goals_achieved": None,
+                    "created_at": datetime.combine(self.week_start - timedelta(weeks=week - 1),
+                                                   datetime.min.time()),
+                })
+
+            # attendance for the last four weeks of weekdays
+            present_rate = max(0.3, min(0.99, 0.88 + 0.06 * ability))
+            for days_ago in range(1, 29):
+                day = self.today - timedelta(days=days_ago)
+                if day.weekday() < 5:
+                    attendance.append({"student_id": student_id, "date": day,
+                                       "status": "present" if rng.random() < present_rate else "absent",
+                                       "created_at": now})
+
+            for assessment_id in rng.sample(catalog["assessments"], rng.randint(6, 12)):
+                pct = round(max(0.0, min(100.0, rng.gauss(70 + 12 * ability, 12))), 1)
+                results.append({"student_id": student_id, "assessment_id": assessment_id,
+                                "score": pct, "percentage": pct})
+
+            if rng.random() < 0.12:
+                for alert_type, severity, message in rng.sample(ALERT_TYPES, rng.randint(1, 2)):
+                    resolved = rng.random() < 0.4
+                    alerts.append({"student_id": student_id, "type": alert_type, "severity": severity,
+                                   "message": message, "is_resolved": resolved,
+                                   "created_at": now - timedelta(days=rng.randint(0, 30), minutes=rng.randint(0, 900))})
+
+        self.writer.write(t["User"], users)
+        self.writer.write(t["StudentProfile"], profiles)
+        self._write_with_ids(t["AcademicMetric"], metrics)
+        self._write_with_ids(t["StudentAcademicRecord"], records)
+        skill_ids = self._write_with_ids(t["StudentSkill"], skills)
+        self._write_with_ids(t["StudentSkillProgress"], (
+            {"student_skill_id": skill_ids[p.pop("skill_index")], **p} for p in progress
+        ), len(progress))
+        self._write_with_ids(t["StudentGoal"], goals)
+        self._write_with_ids(t["StudySession"], sessions)
+        self._write_with_ids(t["WeeklyUpdate"], updates)
+        self._write_with_ids(t["Attendance"], attendance)
+        self._write_with_ids(t["AssessmentResult"], results)
+        self._write_with_ids(t["StudentAlert"], alerts)
+
+    def _write_with_ids(self, table, rows, count=None):
+        rows = rows if count is not None else list(rows)
+        ids = self.allocate(table, count if count is not None else len(rows))
+        self.writer.write(table, ({"id": i, **r} for i, r in zip(ids, rows)))
+        return ids
+
+    # ── teachers ──────────────────────────────────────────────
+
+    def seed_teachers(self, count=None, students_per_teacher=40):
+        """Teachers, each owning a block of not-yet-assigned students, with a few notes."""
+        t = self._tables()
+        assigned = select(t["TeacherAssignment"].c.student_id)
+        unassigned = [row[0] for row in self.connection.execute(
+            select(t["StudentProfile"].c.id)
+            .where(t["StudentProfile"].c.id.not_in(assigned))
+            .order_by(t["StudentProfile"].c.id)
+        )]
+        if count is None:
+            count = max(1, -(-len(unassigned) // students_per_teacher))
+        rng = self.rng("teachers")
+
+        user_ids = self.allocate(t["User"], count)
+        teacher_ids = self.allocate(t["TeacherProfile"], count)
+        self.writer.write(t["User"], (
+            {"id": uid, "email": f"teacher{tid}@seed.example.edu",
+             "password_hash": self.password_hash, "role": "teacher"}
+            for uid, tid in zip(user_ids, teacher_ids)
+        ))
+        self.writer.write(t["TeacherProfile"], (
+            {"id": tid, "user_id": uid,
+             "full_name": f"{('Dr.', 'Prof.', 'Mr.', 'Ms.')[tid % 4]} {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+             "department": "Seed Faculty", "designation": rng.choice(["Lecturer", "Assistant Professor"]),
+             "email": f"teacher{tid}@seed.example.edu"}
+            for uid, tid in zip(user_ids, teacher_ids)
+        ))
+
+        created = datetime.combine(self.today, datetime.min.time())
+        assignments, notes = [], []
+        for n, student_id in enumerate(unassigned):
+            teacher_id = teacher_ids[n * count // len(unassigned)]
+            assignments.append({"teacher_id": teacher_id, "student_id": student_id,
+                                "subject": "Advising", "assignment_type": "advisor",
+                                "created_at": created})
+            for _ in range(rng.choice((0, 0, 1, 2, 3))):
+                when = created - timedelta(days=rng.randint(0, 120), minutes=rng.randint(0, 600))
+                notes.append({"student_id": student_id, "teacher_id": teacher_id,
+                              "content": rng.choice(NOTES), "is_private": rng.random() < 0.3,
+                              "is_read": rng.random() < 0.5, "created_at": when, "updated_at": when})
+        self._write_with_ids(t["TeacherAssignment"], assignments)
+        self._write_with_ids(t["StudentNote"], notes)
+        self.connection.commit()
+        logger.info("Teachers: %d, assignments: %d, notes: %d", count, len(assignments), len(notes))
+        return list(teacher_ids)
+
+    def finish(self):
+        self.writer.reset_sequences(self._tables().values())
+        self.connection.commit()
+
+
+def _grade(rng, ability):
+    """A letter grade skewed by ``ability`` (≈ N(0, 1))."""
+    weights = [w * 1.6 ** (ability * (gp - 2.0)) for _, gp, w in GRADES]
+    grade, gp, _ = rng.choices(GRADES, weights=weights)[0]
+    return grade, gp
+
+
+# ── CLI ───────────────────────────────────────────────────────
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--skills-catalog", action="store_true", help="skills, careers, courses, assessments")
+    parser.add_argument("--students", action="store_true", help="students and their activity")
+    parser.add_argument("--teacher", action="store_true", help="teachers, assignments and notes")
+    parser.add_argument("--all", action="store_true", help="all of the above")
+    parser.add_argument("--num-students", type=int, default=1000)
+    parser.add_argument("--num-teachers", type=int, default=None,
+                        help="default: one per --students-per-teacher students")
+    parser.add_argument("--students-per-teacher", type=int, default=40)
+    parser.add_argument("--weeks", type=int, default=12, help="weeks of history per student")
+    parser.add_argument("--sessions-per-student", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed (same seed → same data)")
+    parser.add_argument("--today", type=date.fromisoformat, default=None, help="YYYY-MM-DD anchor date")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--password", default="password123")
+    parser.add_argument("--config", default=None, help="config name (default: FLASK_ENV)")
+    parser.add_argument("--create-tables", action="store_true", help="db.create_all() first")
+    return parser
+
+
+def run(args, connection):
+    """Seed through an open connection according to parsed ``args``."""
+    seeder = Seeder(
+        connection, seed=args.seed, today=args.today, batch_size=args.batch_size,
+        password=args.password, weeks=args.weeks, sessions_per_student=args.sessions_per_student,
+    )
+    if args.all or args.skills_catalog:
+        seeder.seed_catalog()
+    if args.all or args.students:
+        seeder.seed_students(args.num_students)
+    if args.all or args.teacher:
+        seeder.seed_teachers(args.num_teachers, args.students_per_teacher)
+    seeder.finish()
+    return seeder.writer.counts
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not (args.all or args.skills_catalog or args.students or args.teacher):
+        build_parser().error("nothing to do: pass --skills-catalog, --students, --teacher or --all")
+
+    from app import create_app
+    from core.extensions import db
+
+    app = create_app(args.config)
+    logging.getLogger("seed").setLevel(logging.INFO)
+    with app.app_context():
+        if args.create_tables:
+            db.create_all()
+        started = time.perf_counter()
+        with db.engine.connect() as connection:
+            counts = run(args, connection)
+        elapsed = time.perf_counter() - started
+
+    total = sum(counts.values())
+    print(f"Inserted {total:,} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+    for table, n in sorted(counts.items()):
+        print(f"  {table:<28} {n:>12,}")
+    print(f"Log in as student<id>@seed.example.edu / teacher<id>@seed.example.edu, password {args.password!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    sys.exit(main())
@@ -9,11 +9,16 @@ import json
 import logging
 from collections import defaultdict
 
+from core.data_version import bump_data_version
 from core.errors import NotFoundError
 from core.extensions import db
+from core.identity import load_student
+from services.dashboard_service import DashboardService
+from services.career_matrix import career_matrix
+from services.recalc_queue import recalc_queue
 from models import (
-    StudentProfile, StudentAcademicRecord, CourseCatalog, AcademicMetric,
-    StudentSkill, StudentGoal, CareerPath, CareerRequiredSkill, Skill,
+    StudentAcademicRecord, CourseCatalog, AcademicMetric,
+    StudentSkill, StudentGoal, CareerPath, Skill,
 )
 
 logger = logging.getLogger(__name__)
@@ -32,7 +37,8 @@ class AcademicService:
 
     @staticmethod
     def _get_student(user_id):
-        student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+        """``user_id`` may also be an already-resolved StudentProfile."""
+        student = load_student(user_id)
         if not student:
             raise NotFoundError("Student profile not found")
         return student
@@ -59,89 +65,47 @@ class AcademicService:
         student_skills = StudentSkill.query.filter_by(student_id=student.id).all()
         student_skill_id_set = {ss.skill_id for ss in student_skills if ss.skill_id}
 
-        # Matching careers
-        matching_careers = []
-        if student_skill_id_set:
-            career_links = (
-                db.session.query(
-                    CareerRequiredSkill.career_id,
-                    db.func.count(CareerRequiredSkill.id).label('match_count'),
-                )
-                .filter(CareerRequiredSkill.skill_id.in_(student_skill_id_set))
-                .group_by(CareerRequiredSkill.career_id)
-                .order_by(db.desc('match_count'))
-                .all()
-            )
-            for career_id, match_count in career_links:
-                career = CareerPath.query.get(career_id)
-                if career:
-                    existing_goal = StudentGoal.query.filter_by(
-                        student_id=student.id, career_id=career_id
-                    ).first()
-                    
-                    req_skills = (
-                        db.session.query(Skill)
-                        .join(CareerRequiredSkill, Skill.id == CareerRequiredSkill.skill_id)
-                        .filter(CareerRequiredSkill.career_id == career.id)
-                        .all()
-                    )
-                    
-                    skill_list = []
-                    for s in req_skills:
-                        skill_list.append({
-                            'id': s.id,
-                            'name': s.skill_name,
-                            'matched': s.id in student_skill_id_set
-                        })
-
-                    matching_careers.append({
-                        'id': career.id,
-                        'title': career.title,
-                        'field_category': career.field_category,
-                        'match_count': match_count,
-                        'total_req': len(skill_list),
-                        'skills': skill_list,
-                        'goal_id': existing_goal.id if existing_goal else None,
-                    })
-
-        # Goals with career titles and match counts
+        # Matching careers and goals, scored against the cached career × skill matrix
         goals_raw = StudentGoal.query.filter_by(student_id=student.id).all()
         goal_career_ids = {g.career_id: g.id for g in goals_raw}
+        first_goal_ids = {}
+        for g in goals_raw:
+            first_goal_ids.setdefault(g.career_id, g.id)
+        matrix = career_matrix.get(career_ids=goal_career_ids)
+        match = matrix.match(student_skill_id_set)
+
+        matching_careers = []
+        if student_skill_id_set:
+            for career_id, match_count in match.ranked():
+                career = matrix.career(career_id)
+                skill_list = match.skills(career_id)
+                matching_careers.append({
+                    'id': career_id,
+                    'title': career['title'],
+                    'field_category': career['field_category'],
+                    'match_count': match_count,
+                    'total_req': len(skill_list),
+                    'skills': skill_list,
+                    'goal_id': first_goal_ids.get(career_id),
+                })
 
         goals = []
         for g in goals_raw:
-            career = CareerPath.query.get(g.career_id)
+            career = matrix.career(g.career_id)
             if not career:
                 continue
 
-            req_skills = (
-                db.session.query(Skill)
-                .join(CareerRequiredSkill, Skill.id == CareerRequiredSkill.skill_id)
-                .filter(CareerRequiredSkill.career_id == g.career_id)
-                .all()
-            )
-            
-            skill_list = []
-            matches_count = 0
-            for s in req_skills:
-                is_matched = s.id in student_skill_id_set
-                if is_matched: matches_count += 1
-                skill_list.append({
-                    'id': s.id,
-                    'name': s.skill_name,
-                    'matched': is_matched
-                })
-            
+            skill_list = match.skills(g.career_id)
             goals.append({
                 'id': g.id,
                 'career_id': g.career_id,
-                'career_title': career.title,
+                'career_title': career['title'],
                 'goal_type': g.goal_type,
                 'is_primary': g.is_primary,
-                'match_count': matches_count,
+                'match_count': match.count(g.career_id),
                 'total_req': len(skill_list),
                 'skills': skill_list,
-                'field_category': career.field_category
+                'field_category': career['field_category']
             })
 
         # Academic records
@@ -219,8 +183,7 @@ class AcademicService:
 
         AcademicService.recalculate_cgpa(student)
 
-        from dashboard.recalculate import recalculate_weekly_update
-        recalculate_weekly_update(student.id)
+        recalc_queue.enqueue(student.id)
 
         logger.info("Grade added for student_id=%d, course=%s",
                      student.id, data.course_name)
@@ -235,6 +198,7 @@ class AcademicService:
         ).first()
         if record:
             db.session.delete(record)
+            DashboardService.invalidate_snapshot(student.id)
             db.session.commit()
             AcademicService.recalculate_cgpa(student)
             logger.info("Grade %d deleted for student_id=%d", record_id, student.id)
@@ -296,8 +260,7 @@ class AcademicService:
         student.target_cgpa = target
         db.session.commit()
 
-        from dashboard.recalculate import recalculate_weekly_update
-        recalculate_weekly_update(student.id)
+        recalc_queue.enqueue(student.id)
 
     # ── Goal Management ───────────────────────────────────────
 
@@ -322,8 +285,7 @@ class AcademicService:
         db.session.add(goal)
         db.session.commit()
 
-        from dashboard.recalculate import recalculate_weekly_update
-        recalculate_weekly_update(student.id)
+        recalc_queue.enqueue(student.id)
         logger.info("Goal added for student_id=%d, career_id=%d", student.id, career_id)
         return goal.id
 
@@ -334,6 +296,7 @@ class AcademicService:
         goal = StudentGoal.query.filter_by(id=goal_id, student_id=student.id).first()
         if goal:
             db.session.delete(goal)
+            DashboardService.invalidate_snapshot(student.id)
             db.session.commit()
 
     @staticmethod
@@ -342,13 +305,13 @@ class AcademicService:
         student = AcademicService._get_student(user_id)
 
         StudentGoal.query.filter_by(student_id=student.id).update({"is_primary": False})
+        bump_data_version([student.id])
         goal = StudentGoal.query.filter_by(id=goal_id, student_id=student.id).first()
         if goal:
             goal.is_primary = True
         db.session.commit()
 
-        from dashboard.recalculate import recalculate_weekly_update
-        recalculate_weekly_update(student.id)
+        recalc_queue.enqueue(student.id)
 
     # ── Skills Management ──────────────────────────────────────
 
@@ -387,8 +350,7 @@ class AcademicService:
         db.session.add(new_ss)
         db.session.commit()
         
-        from dashboard.recalculate import recalculate_weekly_update
-        recalculate_weekly_update(student.id)
+        recalc_queue.enqueue(student.id)
         
         logger.info("Skill '%s' added for student_id=%d", name, student.id)
 
@@ -403,8 +365,7 @@ class AcademicService:
             db.session.delete(ss)
             db.session.commit()
 
-            from dashboard.recalculate import recalculate_weekly_update
-            recalculate_weekly_update(student.id)
+            recalc_queue.enqueue(student.id)
 
             logger.info("Skill id=%d removed for student_id=%d",
                          student_skill_id, student.id)
@@ -438,6 +399,7 @@ class AcademicService:
             if ss.skill_name not in selected_names:
                 db.session.delete(ss)
 
+        DashboardService.invalidate_snapshot(student.id)
         db.session.commit()
         logger.info("Skills synced for student_id=%d (%d selected)",
                      student.id, len(selected_skill_ids))
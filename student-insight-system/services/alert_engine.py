@@ -0,0 +1,267 @@
+"""
+Rule-based student alert engine — the producer behind ``StudentAlert``.
+
+Each rule is one set-based query over every student (or over the given
+student ids) that returns the students currently meeting its condition:
+
+  burnout_risk          latest weekly update (last 2 weeks) has
+                        burnout_risk_score >= ALERT_BURNOUT_THRESHOLD
+  inactivity            last study session is older than ALERT_INACTIVITY_DAYS
+                        (students who never logged one are left alone)
+  cgpa_drop             the latest semester pulled CGPA down by >= ALERT_CGPA_DROP
+  failing_assessments   >= ALERT_FAILING_MIN_COUNT results below
+                        ALERT_FAILING_PERCENT within ALERT_LOOKBACK_DAYS
+  low_attendance        present rate below ALERT_ATTENDANCE_MIN_RATE within
+                        ALERT_LOOKBACK_DAYS (at least 5 records)
+
+Candidates are de-duplicated against open alerts of the same type and
+against alerts raised in the last ALERT_COOLDOWN_DAYS (so a resolved alert
+is not re-raised by the very next sweep), then written with one bulk
+INSERT. A partial unique index on open (student_id, type) keeps concurrent
+evaluators from opening duplicates.
+
+Event-driven: the recalc queue evaluates a student after every weekly
+recalculation, which check-ins, study sessions and grade edits all trigger.
+Periodic: ``flask alerts-sweep`` (e.g. from cron) runs one set-based pass.
+
+Register in app factory:
+    from services.alert_engine import alert_engine
+    alert_engine.init_app(app)
+
+Usage:
+    alert_engine.evaluate([student_id])   # incremental
+    alert_engine.evaluate()               # every student
+"""
+
+import logging
+from collections import Counter
+from datetime import date, datetime, timedelta
+from itertools import groupby
+
+from sqlalchemy import case, func, or_
+
+from core.data_version import bump_data_version
+from core.extensions import db
+from models import (
+    Assessment, AssessmentResult, Attendance, CourseCatalog,
+    StudentAcademicRecord, StudentAlert, StudySession, WeeklyUpdate,
+)
+
+logger = logging.getLogger(__name__)
+
+INSERT_BATCH_SIZE = 1000
+MIN_ATTENDANCE_RECORDS = 5
+BURNOUT_RECENT_DAYS = 14
+
+
+class AlertEngine:
+    """Evaluates the alert rules and bulk-inserts new ``StudentAlert`` rows."""
+
+    def __init__(self, app=None):
+        self.burnout_threshold = 0.7
+        self.inactivity_days = 7
+        self.cgpa_drop = 0.2
+        self.failing_percent = 50.0
+        self.failing_min_count = 2
+        self.attendance_min_rate = 0.75
+        self.lookback_days = 30
+        self.cooldown_days = 7
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        config = app.config
+        self.burnout_threshold = float(config.get("ALERT_BURNOUT_THRESHOLD", 0.7))
+        self.inactivity_days = int(config.get("ALERT_INACTIVITY_DAYS", 7))
+        self.cgpa_drop = float(config.get("ALERT_CGPA_DROP", 0.2))
+        self.failing_percent = float(config.get("ALERT_FAILING_PERCENT", 50))
+        self.failing_min_count = int(config.get("ALERT_FAILING_MIN_COUNT", 2))
+        self.attendance_min_rate = float(config.get("ALERT_ATTENDANCE_MIN_RATE", 0.75))
+        self.lookback_days = int(config.get("ALERT_LOOKBACK_DAYS", 30))
+        self.cooldown_days = int(config.get("ALERT_COOLDOWN_DAYS", 7))
+        app.extensions["alert_engine"] = self
+
+    def rules(self):
+        """``[(type, severity, rule)]``; ``rule(student_ids, today)`` yields (student_id, message)."""
+        return [
+            ("burnout_risk", "high", self._burnout_risk),
+            ("inactivity", "warning", self._inactivity),
+            ("cgpa_drop", "medium", self._cgpa_drop),
+            ("failing_assessments", "high", self._failing_assessments),
+            ("low_attendance", "warning", self._low_attendance),
+        ]
+
+    def evaluate(self, student_ids=None, today: date = None) -> dict:
+        """Raise new alerts for ``student_ids`` (every student when None). Returns {type: count}."""
+        if student_ids is not None:
+            student_ids = sorted(set(student_ids))
+            if not student_ids:
+                return {}
+        today = today or date.today()
+        now = datetime.utcnow()
+
+        candidates = []
+        for alert_type, severity, rule in self.rules():
+            for student_id, message in rule(student_ids, today):
+                candidates.append((student_id, alert_type, severity, message))
+        if not candidates:
+            return {}
+
+        blocked = self._blocked(student_ids, now)
+        rows = [
+            {
+                "student_id": student_id,
+                "type": alert_type,
+                "severity": severity,
+                "message": message[:255],
+                "is_resolved": False,
+                "created_at": now,
+            }
+            for student_id, alert_type, severity, message in candidates
+            if (student_id, alert_type) not in blocked
+        ]
+        if rows:
+            self._insert(rows)
+        created = dict(Counter(row["type"] for row in rows))
+        if created:
+            logger.info("Alerts raised: %s", created)
+        return created
+
+    # ── Rules ─────────────────────────────────────────────────
+
+    def _burnout_risk(self, student_ids, today):
+        # Recent weeks only (one or two rows per student); the latest week wins.
+        query = db.session.query(
+            WeeklyUpdate.student_id, WeeklyUpdate.burnout_risk_score,
+        ).filter(WeeklyUpdate.week_start_date >= today - timedelta(days=BURNOUT_RECENT_DAYS))
+        rows = (
+            _scoped(query, WeeklyUpdate.student_id, student_ids)
+            .order_by(WeeklyUpdate.student_id, WeeklyUpdate.week_start_date.desc(),
+                      WeeklyUpdate.burnout_risk_score.desc())
+        )
+        for student_id, weeks in groupby(rows, key=lambda r: r[0]):
+            score = next(weeks)[1]
+            if score is not None and score >= self.burnout_threshold:
+                yield student_id, f"Burnout risk is {score:.0%} on the latest weekly check-in"
+
+    def _inactivity(self, student_ids, today):
+        last_session = func.max(StudySession.date)
+        query = _scoped(
+            db.session.query(StudySession.student_id, last_session),
+            StudySession.student_id, student_ids,
+        )
+        rows = (
+            query.group_by(StudySession.student_id)
+            .having(last_session < today - timedelta(days=self.inactivity_days))
+        )
+        for student_id, last_date in rows:
+            yield student_id, f"No study sessions logged for {(today - last_date).days} days"
+
+    def _cgpa_drop(self, student_ids, today):
+        # Same weighting as AcademicService.recalculate_cgpa.
+        credits = func.coalesce(CourseCatalog.credit_value, 3)
+        query = (
+            db.session.query(
+                StudentAcademicRecord.student_id,
+                StudentAcademicRecord.semester_taken,
+                func.sum(func.coalesce(StudentAcademicRecord.grade_point, 0) * credits),
+                func.sum(credits),
+            )
+            .join(CourseCatalog, StudentAcademicRecord.course_id == CourseCatalog.id)
+            .filter(StudentAcademicRecord.semester_taken.isnot(None))
+        )
+        rows = (
+            _scoped(query, StudentAcademicRecord.student_id, student_ids)
+            .group_by(StudentAcademicRecord.student_id, StudentAcademicRecord.semester_taken)
+            .order_by(StudentAcademicRecord.student_id, StudentAcademicRecord.semester_taken)
+        )
+        for student_id, semesters in groupby(rows, key=lambda r: r[0]):
+            semesters = list(semesters)
+            if len(semesters) < 2:
+                continue
+            points_before = sum(r[2] for r in semesters[:-1])
+            credits_before = sum(r[3] for r in semesters[:-1])
+            credits_now = credits_before + semesters[-1][3]
+            if not credits_before or not credits_now:
+                continue
+            before = round(points_before / credits_before, 2)
+            now = round((points_before + semesters[-1][2]) / credits_now, 2)
+            if before - now >= self.cgpa_drop:
+                yield student_id, (
+                    f"CGPA dropped from {before:.2f} to {now:.2f} "
+                    f"after semester {semesters[-1][1]}"
+                )
+
+    def _failing_assessments(self, student_ids, today):
+        failed = func.count(AssessmentResult.id)
+        query = (
+            db.session.query(AssessmentResult.student_id, failed)
+            .join(Assessment, AssessmentResult.assessment_id == Assessment.id)
+            .filter(
+                AssessmentResult.percentage < self.failing_percent,
+                Assessment.date >= today - timedelta(days=self.lookback_days),
+            )
+        )
+        rows = (
+            _scoped(query, AssessmentResult.student_id, student_ids)
+            .group_by(AssessmentResult.student_id)
+            .having(failed >= self.failing_min_count)
+        )
+        for student_id, count in rows:
+            yield student_id, f"Failed {count} assessments in the last {self.lookback_days} days"
+
+    def _low_attendance(self, student_ids, today):
+        present = func.sum(case((Attendance.status == "present", 1), else_=0))
+        total = func.count(Attendance.id)
+        query = db.session.query(Attendance.student_id, present, total).filter(
+            Attendance.date >= today - timedelta(days=self.lookback_days)
+        )
+        rows = (
+            _scoped(query, Attendance.student_id, student_ids)
+            .group_by(Attendance.student_id)
+            .having(total >= MIN_ATTENDANCE_RECORDS)
+            .having(present < total * self.attendance_min_rate)
+        )
+        for student_id, present_count, total_count in rows:
+            yield student_id, (
+                f"Attendance at {present_count / total_count:.0%} "
+                f"over the last {self.lookback_days} days"
+            )
+
+    # ── internals ──
+
+    def _blocked(self, student_ids, now):
+        """(student_id, type) pairs with an open or recent alert."""
+        cooldown_start = now - timedelta(days=self.cooldown_days)
+        query = db.session.query(StudentAlert.student_id, StudentAlert.type).filter(
+            StudentAlert.type.in_([alert_type for alert_type, _, _ in self.rules()]),
+            or_(StudentAlert.is_resolved == False, StudentAlert.created_at >= cooldown_start),  # noqa: E712
+        )
+        return set(_scoped(query, StudentAlert.student_id, student_ids).all())
+
+    def _insert(self, rows):
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy import insert
+        stmt = insert(StudentAlert)
+        if dialect in ("postgresql", "sqlite"):
+            # Another process may have opened the same alert since _blocked() ran.
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=["student_id", "type"],
+                index_where=db.text("NOT is_resolved"),
+            )
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            db.session.execute(stmt, rows[start:start + INSERT_BATCH_SIZE])
+        bump_data_version(row["student_id"] for row in rows)
+        db.session.commit()
+
+
+def _scoped(query, column, student_ids):
+    return query if student_ids is None else query.filter(column.in_(student_ids))
+
+
+alert_engine = AlertEngine()
@@ -3,14 +3,22 @@ Analytics service — AI-powered insight report generation.
 
 Extracted from routes.py: student_insight_report().
 Wraps the Gemini API calls behind the AIServiceInterface.
+
+Reports are normally generated in the background: the route calls
+``enqueue_insight_report`` and the browser polls ``get_insight_job``.
 """
 
+import json
 import logging
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta
+
+from flask import current_app
 
 from core.errors import NotFoundError
-from core.extensions import db
-from models import StudentProfile, StudentInsight
+from core.extensions import ai_worker_pool, db
+from core.identity import load_student
+from models import StudentProfile, StudentInsight, InsightJob
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +39,28 @@ class AnalyticsService:
         Returns:
             HTML string of the generated report
         """
+        prompt = AnalyticsService.build_insight_prompt(form_data)
+        report_html = ai_service.generate_text(prompt)
+        AnalyticsService._save_insight(user_id, report_html)
+        return report_html
+
+    @staticmethod
+    def stream_insight_report(user_id: str, form_data: dict, ai_service):
+        """
+        Yield report chunks as the AI produces them; the assembled report is
+        saved once the stream completes. The final item is the saved
+        StudentInsight (or None), so callers can tell chunks from the end.
+        """
+        prompt = AnalyticsService.build_insight_prompt(form_data)
+        chunks = []
+        for chunk in ai_service.generate_text_stream(prompt):
+            chunks.append(chunk)
+            yield chunk
+        yield AnalyticsService._save_insight(user_id, "".join(chunks))
+
+    @staticmethod
+    def build_insight_prompt(form_data: dict) -> str:
+        """Render the advisor prompt for the insight report form."""
         department = form_data.get("department", "Computer Science")
         cgpa = form_data.get("cgpa", "3.0")
         semester_gpas = form_data.get("semester_gpas", "2.8, 3.0, 3.2")
@@ -39,7 +69,7 @@ class AnalyticsService:
         weak_courses = form_data.get("weak_courses", "Math")
         interests = form_data.get("interests", "Web Development")
 
-        prompt = f"""
+        return f"""
         You are a Senior Academic Advisor and Technical Career Mentor for a {department} student.
         Your goal is to provide a harsh but constructive reality check and a clear roadmap for their career.
 
@@ -70,11 +100,11 @@ class AnalyticsService:
            <p>Suggest 2 specific job titles based on interests and strengths.</p>
         """
 
-        report_html = ai_service.generate_text(prompt)
-
-        # Save to database
+    @staticmethod
+    def _save_insight(user_id, report_html):
+        """Persist a generated report; returns the StudentInsight or None."""
         try:
-            student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+            student = load_student(user_id)
             if student:
                 insight = StudentInsight(
                     student_id=student.id,
@@ -84,7 +114,83 @@ class AnalyticsService:
                 db.session.add(insight)
                 db.session.commit()
                 logger.info("Insight report saved for student_id=%d", student.id)
+                return insight
         except Exception:
+            db.session.rollback()
             logger.exception("Failed to save insight report to DB")
+        return None
 
-        return report_html
+    # ── Background generation ─────────────────────────────────
+
+    @staticmethod
+    def enqueue_insight_report(user_id: str, form_data: dict, ai_service) -> dict:
+        """Create an InsightJob, hand it to the AI worker pool, return its status."""
+        student = load_student(user_id)
+        if not student:
+            raise NotFoundError("Student profile not found")
+
+        job = InsightJob(
+            id=uuid.uuid4().hex,
+            student_id=student.id,
+            status=InsightJob.QUEUED,
+            form_data=json.dumps(form_data),
+        )
+        db.session.add(job)
+        db.session.commit()
+        job_id = job.id
+
+        ai_worker_pool.submit(AnalyticsService.run_insight_job, job_id, user_id, ai_service)
+        return AnalyticsService.get_insight_job(user_id, job_id)
+
+    @staticmethod
+    def run_insight_job(job_id: str, user_id: str, ai_service) -> None:
+        """Worker entry point: generate the report and record the outcome."""
+        job = db.session.get(InsightJob, job_id)
+        if job is None or job.status != InsightJob.QUEUED:
+            return
+        job.status = InsightJob.RUNNING
+        job.started_at = datetime.utcnow()
+        db.session.commit()
+
+        try:
+            prompt = AnalyticsService.build_insight_prompt(json.loads(job.form_data))
+            report_html = ai_service.generate_text(prompt)
+            insight = AnalyticsService._save_insight(user_id, report_html)
+            job = db.session.get(InsightJob, job_id)
+            job.status = InsightJob.SUCCEEDED if insight else InsightJob.FAILED
+            job.insight_id = insight.id if insight else None
+            job.error = None if insight else "Report could not be saved"
+        except Exception as e:
+            db.session.rollback()
+            logger.exception("Insight job %s failed", job_id)
+            job = db.session.get(InsightJob, job_id)
+            job.status = InsightJob.FAILED
+            job.error = getattr(e, "message", None) or str(e) or "Failed to generate report"
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+
+    @staticmethod
+    def get_insight_job(user_id: str, job_id: str) -> dict:
+        """Status of one of the student's insight jobs (report included when done)."""
+        job = (
+            db.session.query(InsightJob)
+            .join(StudentProfile, InsightJob.student_id == StudentProfile.id)
+            .filter(InsightJob.id == job_id, StudentProfile.user_id == int(user_id))
+            .first()
+        )
+        if not job:
+            raise NotFoundError("Insight job not found")
+
+        status, error = job.status, job.error
+        timeout = current_app.config.get("INSIGHT_JOB_TIMEOUT_SECONDS", 300)
+        if (status in (InsightJob.QUEUED, InsightJob.RUNNING)
+                and job.created_at < datetime.utcnow() - timedelta(seconds=timeout)):
+            # The worker that owned it is gone (restart, crash) — stop polling.
+            status, error = InsightJob.FAILED, "Report generation timed out"
+
+        result = {"job_id": job.id, "status": status}
+        if status == InsightJob.SUCCEEDED and job.insight:
+            result["report"] = job.insight.content
+        if status == InsightJob.FAILED:
+            result["error"] = error
+        return result
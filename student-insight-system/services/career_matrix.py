@@ -0,0 +1,244 @@
+"""
+In-memory career × skill incidence matrix.
+
+``CareerRequiredSkill`` is small and changes rarely, but the goals page and
+the dashboard used to re-query it once per career. This module loads it
+once into a CSR matrix (rows = careers, columns = skills) so that a
+student's match counts against *every* career come from a single sparse
+matrix–vector product with the student's 0/1 skill vector.
+
+The cached matrix is dropped whenever a commit touches ``CareerPath``,
+``CareerRequiredSkill`` or ``Skill``, when tables are (re)created, and
+after ``CAREER_MATRIX_TTL_SECONDS`` so edits made by other processes are
+picked up too.
+
+numpy is imported on first use rather than at module import, so web
+workers that never render a goals page don't pay for it at startup.
+
+Register in app factory:
+    from services.career_matrix import career_matrix
+    career_matrix.init_app(app)
+
+Usage:
+    match = career_matrix.get().match(student_skill_ids)
+    match.ranked()            # [(career_id, match_count), ...]
+    match.percent(career_id)  # 0–100
+
+``career_matrix.fingerprint()`` identifies the catalog contents; ETags of
+responses built from the matrix include it (core/data_version.py).
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from core.extensions import db
+from models import CareerPath, CareerRequiredSkill, Skill
+
+logger = logging.getLogger(__name__)
+
+_WATCHED_MODELS = (CareerPath, CareerRequiredSkill, Skill)
+
+
+class CareerSkillMatrix:
+    """Immutable CSR snapshot of ``career_required_skills``.
+
+    Duplicate (career, skill) links are kept as separate entries so counts
+    agree with the ``COUNT(career_required_skills.id)`` queries they replace.
+    """
+
+    def __init__(self, careers, links):
+        import numpy as np
+
+        # careers: [(id, title, field_category)]
+        # links:   [(career_id, skill_id, skill_name)] ordered by link id
+        self.careers = {cid: {"id": cid, "title": title, "field_category": category}
+                        for cid, title, category in careers}
+        self.career_ids = np.array(sorted(self.careers), dtype=np.int64)
+        self._row = {cid: i for i, cid in enumerate(self.career_ids.tolist())}
+
+        self.skill_names = {}
+        for _, skill_id, name in links:
+            self.skill_names[skill_id] = name
+        self.skill_ids = np.array(sorted(self.skill_names), dtype=np.int64)
+        self._col = {sid: j for j, sid in enumerate(self.skill_ids.tolist())}
+
+        rows = [[] for _ in range(len(self.career_ids))]
+        for career_id, skill_id, _ in links:
+            i = self._row.get(career_id)
+            if i is not None:
+                rows[i].append(self._col[skill_id])
+        lengths = np.array([len(r) for r in rows], dtype=np.int64)
+        self.indptr = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        self.indices = np.array([j for r in rows for j in r], dtype=np.int64)
+        # Row number of every stored entry, for the bincount-based product.
+        self._entry_row = np.repeat(np.arange(len(rows), dtype=np.int64), lengths)
+
+        # Same careers and links → same value, in every process.
+        content = repr((sorted(tuple(c) for c in careers), [tuple(link) for link in links]))
+        self.fingerprint = hashlib.sha1(content.encode()).hexdigest()[:12]
+
+    @classmethod
+    def load(cls):
+        careers = db.session.query(
+            CareerPath.id, CareerPath.title, CareerPath.field_category,
+        ).all()
+        links = (
+            db.session.query(CareerRequiredSkill.career_id, Skill.id, Skill.skill_name)
+            .join(Skill, CareerRequiredSkill.skill_id == Skill.id)
+            .order_by(CareerRequiredSkill.id)
+            .all()
+        )
+        return cls(careers, links)
+
+    def __contains__(self, career_id):
+        return career_id in self._row
+
+    def career(self, career_id):
+        """``{"id", "title", "field_category"}`` or None."""
+        return self.careers.get(career_id)
+
+    def required_skill_ids(self, career_id):
+        i = self._row.get(career_id)
+        if i is None:
+            return []
+        return self.skill_ids[self.indices[self.indptr[i]:self.indptr[i + 1]]].tolist()
+
+    def match(self, skill_ids):
+        """One sparse mat-vec: required-skill matches per career for ``skill_ids``."""
+        import numpy as np
+
+        x = np.zeros(len(self.skill_ids))
+        cols = [self._col[s] for s in skill_ids if s in self._col]
+        x[cols] = 1.0
+        counts = np.bincount(
+            self._entry_row, weights=x[self.indices], minlength=len(self.career_ids)
+        ).astype(np.int64)
+        return SkillMatch(self, set(skill_ids), counts)
+
+
+class SkillMatch:
+    """Match counts of one student's skills against every career."""
+
+    def __init__(self, matrix, skill_ids, counts):
+        import numpy as np
+
+        self.matrix = matrix
+        self.skill_ids = skill_ids
+        self.counts = counts
+        self.totals = np.diff(matrix.indptr)
+
+    def count(self, career_id) -> int:
+        i = self.matrix._row.get(career_id)
+        return int(self.counts[i]) if i is not None else 0
+
+    def total(self, career_id) -> int:
+        i = self.matrix._row.get(career_id)
+        return int(self.totals[i]) if i is not None else 0
+
+    def percent(self, career_id) -> int:
+        """Matched share of required skills, 0 when none are defined."""
+        total = self.total(career_id)
+        return min(int(self.count(career_id) / total * 100), 100) if total else 0
+
+    def ranked(self):
+        """``[(career_id, match_count)]`` with at least one match, best first."""
+        import numpy as np
+
+        hits = np.flatnonzero(self.counts)
+        order = np.lexsort((self.matrix.career_ids[hits], -self.counts[hits]))
+        return [
+            (int(self.matrix.career_ids[k]), int(self.counts[k]))
+            for k in hits[order]
+        ]
+
+    def skills(self, career_id):
+        """Required skills for a career, each flagged as matched or not."""
+        return [
+            {
+                "id": sid,
+                "name": self.matrix.skill_names[sid],
+                "matched": sid in self.skill_ids,
+            }
+            for sid in self.matrix.required_skill_ids(career_id)
+        ]
+
+
+class CareerMatrixCache:
+    """Process-wide holder of the current ``CareerSkillMatrix``."""
+
+    def __init__(self, app=None):
+        self.ttl = 300.0
+        self._matrix = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.ttl = float(app.config.get("CAREER_MATRIX_TTL_SECONDS", 300))
+        app.extensions["career_matrix"] = self
+
+    def get(self, career_ids=()) -> CareerSkillMatrix:
+        """Current matrix; rebuilt if expired or missing any of ``career_ids``."""
+        matrix = self._usable(career_ids)
+        if matrix is not None:
+            return matrix
+        with self._lock:
+            # Whoever held the lock before us may have rebuilt it already.
+            matrix = self._usable(career_ids)
+            if matrix is not None:
+                return matrix
+            matrix = CareerSkillMatrix.load()
+            self._matrix = matrix
+            self._built_at = time.monotonic()
+        logger.debug("Career matrix rebuilt: %d careers, %d links",
+                     len(matrix.career_ids), len(matrix.indices))
+        return matrix
+
+    def _usable(self, career_ids):
+        """The cached matrix if it is within the TTL and has every id in ``career_ids``."""
+        matrix, built_at = self._matrix, self._built_at
+        if matrix is None or time.monotonic() - built_at >= self.ttl:
+            return None
+        return matrix if all(cid in matrix for cid in career_ids) else None
+
+    def fingerprint(self) -> str:
+        """Content hash of the current matrix; changes whenever the catalog does."""
+        return self.get().fingerprint
+
+    def invalidate(self):
+        self._matrix = None
+
+
+career_matrix = CareerMatrixCache()
+
+
+# ── Invalidation hooks ────────────────────────────────────────
+
+@event.listens_for(Session, "after_flush")
+def _note_career_changes(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _WATCHED_MODELS):
+            session.info["career_matrix_dirty"] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop("career_matrix_dirty", False):
+        career_matrix.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("career_matrix_dirty", None)
+
+
+@event.listens_for(db.metadata, "after_create")
+def _invalidate_after_create(target, connection, **kw):
+    career_matrix.invalidate()
@@ -9,7 +9,9 @@ from datetime import datetime, timedelta
 
 from core.errors import NotFoundError
 from core.extensions import db
-from models import StudentProfile, WeeklyUpdate
+from core.identity import load_student
+from models import WeeklyUpdate
+from services.recalc_queue import recalc_queue
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +21,8 @@ class CheckinService:
 
     @staticmethod
     def _get_student(user_id):
-        student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+        """``user_id`` may also be an already-resolved StudentProfile."""
+        student = load_student(user_id)
         if not student:
             raise NotFoundError("Student not found")
         return student
@@ -123,7 +126,6 @@ class CheckinService:
 
         db.session.commit()
 
-        from dashboard.recalculate import recalculate_weekly_update
-        recalculate_weekly_update(student.id)
+        recalc_queue.enqueue(student.id)
 
         logger.info("Check-in submitted for student_id=%d", student.id)
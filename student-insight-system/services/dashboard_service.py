@@ -3,43 +3,157 @@ Dashboard data aggregation service.
 
 Extracts the 220+ line student_dashboard() data aggregation logic
 into a testable, HTTP-unaware service.
+
+The full aggregation is materialised into ``StudentDashboardSnapshot``
+whenever the recalculation engine runs, so the hot read path is a single
+query. Stale or missing snapshots fall back to live computation.
 """
 
+import json
 import logging
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from collections import defaultdict
 
 from sqlalchemy import func
 
+from core.db_routing import primary_reads, read_replica, reading_replica
 from core.errors import NotFoundError
 from core.extensions import db
+from core.identity import load_student
 from models import (
     StudentProfile, StudentSkill, StudySession, WeeklyUpdate,
-    StudentAcademicRecord, CourseCatalog, StudentGoal, CareerPath,
-    CareerRequiredSkill, Skill as SkillModel,
+    StudentAcademicRecord, CourseCatalog, StudentGoal,
+    Skill as SkillModel, StudentDashboardSnapshot,
 )
+from services.career_matrix import career_matrix
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the dashboard payload shape changes — older rows are
+# then treated as stale and rebuilt on next read.
+SNAPSHOT_SCHEMA_VERSION = 1
+
 
 class DashboardService:
     """Aggregates all dashboard widget data — HTTP-unaware."""
 
     @staticmethod
     def get_student_or_404(user_id):
-        """Resolve user_id → StudentProfile or raise NotFoundError."""
-        try:
-            student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
-        except (ValueError, TypeError):
+        """Resolve user_id (or a resolved StudentProfile) → StudentProfile or raise NotFoundError."""
+        student = load_student(user_id)
+        if student is None and not str(user_id).isdigit():
             raise NotFoundError("Invalid user identity")
         if not student:
             raise NotFoundError("Student profile not found")
         return student
 
     @staticmethod
-    def get_dashboard_data(user_id: str) -> dict:
+    @read_replica
+    def get_dashboard_data(user_id: str, use_snapshot: bool = True) -> dict:
+        """
+        Return the dashboard data dict, served from the snapshot when fresh.
+
+        Student and snapshot are fetched together in one query. When the
+        snapshot is missing or stale the payload is computed live and the
+        snapshot refreshed for the next request. ``user_id`` may also be a
+        resolved StudentProfile, in which case only the snapshot is read.
+        The snapshot is read from the replica when one is configured
+        (core/db_routing.py); rebuilding it reads and writes the primary.
+        """
+        if isinstance(user_id, StudentProfile):
+            student = user_id
+            snapshot = StudentDashboardSnapshot.query.get(student.id)
+            return DashboardService._serve(student, snapshot, use_snapshot)
+
+        try:
+            uid = int(user_id)
+        except (ValueError, TypeError):
+            raise NotFoundError("Invalid user identity")
+
+        row = (
+            db.session.query(StudentProfile, StudentDashboardSnapshot)
+            .outerjoin(
+                StudentDashboardSnapshot,
+                StudentDashboardSnapshot.student_id == StudentProfile.id,
+            )
+            .filter(StudentProfile.user_id == uid)
+            .first()
+        )
+        if not row:
+            raise NotFoundError("Student profile not found")
+        student, snapshot = row
+        return DashboardService._serve(student, snapshot, use_snapshot)
+
+    @staticmethod
+    def _serve(student, snapshot, use_snapshot) -> dict:
+        if use_snapshot and DashboardService.snapshot_is_fresh(snapshot):
+            return json.loads(snapshot.payload)
+
+        # Rebuild from the primary: a lagging replica's copy must not
+        # overwrite a snapshot the recalc worker already refreshed there.
+        from_replica = reading_replica(db.session())
+        with primary_reads():
+            if from_replica:
+                db.session.refresh(student)
+                snapshot = db.session.get(StudentDashboardSnapshot, student.id, populate_existing=True)
+                if use_snapshot and DashboardService.snapshot_is_fresh(snapshot):
+                    return json.loads(snapshot.payload)
+
+            data = DashboardService.build_dashboard_data(student)
+            try:
+                DashboardService._store_snapshot(student.id, data, snapshot)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                logger.exception(
+                    "Failed to store dashboard snapshot for student_id=%d", student.id
+                )
+        return data
+
+    # ── Snapshot maintenance ──────────────────────────────────
+
+    @staticmethod
+    def snapshot_is_fresh(snapshot) -> bool:
+        """True if a snapshot row may be served without recomputation."""
+        return (
+            snapshot is not None
+            and not snapshot.is_stale
+            and snapshot.schema_version == SNAPSHOT_SCHEMA_VERSION
+            and snapshot.built_for_date == date.today()
+        )
+
+    @staticmethod
+    def refresh_snapshot(student) -> dict:
+        """Recompute and persist the dashboard snapshot for a student."""
+        data = DashboardService.build_dashboard_data(student)
+        snapshot = StudentDashboardSnapshot.query.get(student.id)
+        DashboardService._store_snapshot(student.id, data, snapshot)
+        db.session.commit()
+        return data
+
+    @staticmethod
+    def invalidate_snapshot(student_id: int) -> None:
+        """Mark a student's snapshot stale (no commit — caller owns the transaction)."""
+        StudentDashboardSnapshot.query.filter_by(student_id=student_id).update(
+            {"is_stale": True}, synchronize_session=False
+        )
+
+    @staticmethod
+    def _store_snapshot(student_id, data, snapshot=None) -> None:
+        if snapshot is None:
+            snapshot = StudentDashboardSnapshot(student_id=student_id)
+            db.session.add(snapshot)
+        snapshot.payload = json.dumps(data)
+        snapshot.schema_version = SNAPSHOT_SCHEMA_VERSION
+        snapshot.is_stale = False
+        snapshot.built_for_date = date.today()
+        snapshot.built_at = datetime.utcnow()
+
+    # ── Live aggregation ──────────────────────────────────────
+
+    @staticmethod
+    def build_dashboard_data(student) -> dict:
         """Build the complete data dict consumed by student_dashboard.html."""
-        student = DashboardService.get_student_or_404(user_id)
 
         # ── 1. CGPA TREND ──
         records_raw = (
@@ -142,34 +256,19 @@ class DashboardService:
             StudentGoal.is_primary.desc()
         ).all()
         student_skill_ids = {s.skill_id for s in skills if s.skill_id}
+        matrix = career_matrix.get(career_ids={g.career_id for g in goals_list[:3]})
+        match = matrix.match(student_skill_ids)
         careers = []
 
         for g in goals_list[:3]:
-            career = CareerPath.query.get(g.career_id)
+            career = matrix.career(g.career_id)
             if not career:
                 continue
-            required = CareerRequiredSkill.query.filter_by(career_id=g.career_id).count()
-            matched = 0
-            if student_skill_ids:
-                matched = (
-                    db.session.query(CareerRequiredSkill)
-                    .filter(
-                        CareerRequiredSkill.career_id == g.career_id,
-                        CareerRequiredSkill.skill_id.in_(student_skill_ids),
-                    )
-                    .count()
-                )
             # Use a threshold or flag if no required skills are defined for this career
-            if required > 0:
-                match_pct = min(int(matched / required * 100), 100)
-                no_data = False
-            else:
-                match_pct = 0
-                no_data = True # Indicate that requirements haven't been defined yet
             careers.append({
-                "role": career.title,
-                "match": match_pct,
-                "no_data": no_data,
+                "role": career["title"],
+                "match": match.percent(g.career_id),
+                "no_data": match.total(g.career_id) == 0,
                 "is_primary": g.is_primary
             })
 
@@ -203,9 +302,9 @@ class DashboardService:
             round(float(current_cgpa) + 0.2, 1) if current_cgpa else 3.5
         )
         if primary_goal:
-            cp = CareerPath.query.get(primary_goal.career_id)
+            cp = career_matrix.get(career_ids=[primary_goal.career_id]).career(primary_goal.career_id)
             if cp:
-                target_career = cp.title
+                target_career = cp["title"]
 
         # ── QUICK STATS ──
         total_credits = sum(c.credit_value for _, c in records_raw)
@@ -254,6 +353,7 @@ class DashboardService:
         }
 
     @staticmethod
+    @read_replica
     def get_onboarding_data(user_id: str) -> dict:
         """Build onboarding checklist data."""
         student = DashboardService.get_student_or_404(user_id)
@@ -10,7 +10,9 @@ from werkzeug.utils import secure_filename
 
 from core.errors import NotFoundError
 from core.extensions import db
-from models import StudentProfile, User
+from core.identity import forget_profiles, load_student
+from models import User
+from services.dashboard_service import DashboardService
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +22,8 @@ class ProfileService:
 
     @staticmethod
     def _get_student(user_id):
-        student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+        """``user_id`` may also be an already-resolved StudentProfile."""
+        student = load_student(user_id)
         if not student:
             raise NotFoundError("Student not found")
         return student
@@ -71,6 +74,7 @@ class ProfileService:
                 cover_picture_file.save(os.path.join(upload_folder, cover_filename))
                 student.cover_picture = cover_filename
 
+        DashboardService.invalidate_snapshot(student.id)
         db.session.commit()
         logger.info("Profile updated for student_id=%d", student.id)
 
@@ -81,7 +85,7 @@ class ProfileService:
         if not user:
             raise NotFoundError("User not found")
 
-        student = StudentProfile.query.filter_by(user_id=user.id).first()
+        student = load_student(user.id)
         if student:
             s_id = student.id
             from models.teacher import TeacherAssignment, AssignmentTransferRequest
@@ -102,13 +106,14 @@ class ProfileService:
 
         db.session.delete(user)
         db.session.commit()
+        forget_profiles()
         logger.info("User %d and profile deleted", user.id)
 
     @staticmethod
     def get_settings_data(user_id: str) -> dict:
         """Build data for the settings page."""
         user = User.query.get(int(user_id))
-        student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+        student = load_student(user_id)
         if not student or not user:
             raise NotFoundError("User not found")
         return {"user": user, "profile": student}
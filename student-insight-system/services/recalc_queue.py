@@ -0,0 +1,210 @@
+"""
+Coalescing background queue for weekly-update recalculation.
+
+Mutating services call ``recalc_queue.enqueue(student.id)`` instead of
+running ``recalculate_weekly_update`` on the request path. The request
+only upserts a ``RecalcJob`` row (marking the student dirty) and stales
+the dashboard snapshot; a dispatcher thread waits for the debounce window
+to pass and hands each dirty student to the shared worker pool once, no
+matter how many edits arrived in the meantime.
+
+Once a student is recalculated the alert rules are re-evaluated for them
+(services/alert_engine.py).
+
+Jobs live in the database, so they survive restarts and are picked up by
+whichever process polls next. Claims use a conditional UPDATE, so several
+processes can share the table safely.
+
+Register in app factory:
+    from services.recalc_queue import recalc_queue
+    recalc_queue.init_app(app)
+
+Tests (WORKER_POOL_SIZE = 0) run no dispatcher — drain explicitly:
+    recalc_queue.flush()
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+
+from core.extensions import db, worker_pool
+from models import RecalcJob
+from services.alert_engine import alert_engine
+from services.dashboard_service import DashboardService
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+
+
+class RecalcQueue:
+    """Debounced, de-duplicated recalculation jobs backed by ``recalc_job``."""
+
+    def __init__(self, app=None):
+        self._app = None
+        self.debounce = 2.0
+        self.poll_interval = 30.0
+        self.claim_timeout = 300.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self._app = app
+        self.debounce = float(app.config.get("RECALC_DEBOUNCE_SECONDS", 2.0))
+        self.poll_interval = float(app.config.get("RECALC_POLL_SECONDS", 30.0))
+        self.claim_timeout = float(app.config.get("RECALC_CLAIM_TIMEOUT_SECONDS", 300.0))
+        app.extensions["recalc_queue"] = self
+
+        @app.before_request
+        def _start_recalc_dispatcher():
+            self._ensure_dispatcher()
+
+    # ── Producer side ─────────────────────────────────────────
+
+    def enqueue(self, student_id: int) -> None:
+        """Mark a student dirty. Commits; call after the caller's own commit."""
+        now = datetime.utcnow()
+        job = RecalcJob.query.get(student_id)
+        if job:
+            job.requested_at = now
+        else:
+            db.session.add(RecalcJob(student_id=student_id, requested_at=now))
+        DashboardService.invalidate_snapshot(student_id)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another request inserted the row first — just bump it.
+            db.session.rollback()
+            RecalcJob.query.filter_by(student_id=student_id).update(
+                {"requested_at": now}, synchronize_session=False
+            )
+            DashboardService.invalidate_snapshot(student_id)
+            db.session.commit()
+
+        self._ensure_dispatcher()
+        self._wake.set()
+
+    # ── Consumer side ─────────────────────────────────────────
+
+    def flush(self) -> int:
+        """Synchronously process every pending job in this thread. Returns count."""
+        student_ids = [sid for (sid,) in db.session.query(RecalcJob.student_id).all()]
+        processed = 0
+        for student_id in student_ids:
+            if self._claim(student_id, datetime.utcnow(), force=True):
+                self._process(student_id)
+                processed += 1
+        return processed
+
+    def pending_count(self) -> int:
+        return RecalcJob.query.count()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def _ensure_dispatcher(self):
+        if worker_pool.is_inline or self._app is None:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._dispatch_loop, name="recalc-dispatcher", daemon=True
+                )
+                self._thread.start()
+
+    def _dispatch_loop(self):
+        while not self._stop.is_set():
+            woken = self._wake.wait(timeout=self.poll_interval)
+            self._wake.clear()
+            if woken:
+                # Let the burst settle before looking for ready jobs.
+                self._stop.wait(self.debounce)
+            try:
+                with self._app.app_context():
+                    ready = self._claim_ready()
+                for student_id in ready:
+                    worker_pool.submit(self._process, student_id)
+            except Exception:
+                logger.exception("Recalc dispatcher iteration failed")
+
+    def _claim_ready(self) -> list[int]:
+        now = datetime.utcnow()
+        settled_before = now - timedelta(seconds=self.debounce)
+        candidates = (
+            db.session.query(RecalcJob.student_id)
+            .filter(RecalcJob.requested_at <= settled_before)
+            .all()
+        )
+        return [sid for (sid,) in candidates if self._claim(sid, now)]
+
+    def _claim(self, student_id, now, force=False) -> bool:
+        """Atomically take ownership of a job row; False if someone else holds it."""
+        query = RecalcJob.query.filter(RecalcJob.student_id == student_id)
+        if not force:
+            expired = now - timedelta(seconds=self.claim_timeout)
+            query = query.filter(db.or_(
+                RecalcJob.claimed_at.is_(None),
+                RecalcJob.claimed_at < expired,
+            ))
+        claimed = query.update({"claimed_at": now}, synchronize_session=False)
+        db.session.commit()
+        return claimed == 1
+
+    def _process(self, student_id: int) -> None:
+        from dashboard.recalculate import recalculate_weekly_update
+
+        job = RecalcJob.query.get(student_id)
+        if job is None:
+            return
+        seen_requested_at = job.requested_at
+
+        try:
+            recalculate_weekly_update(student_id)
+        except Exception as e:
+            db.session.rollback()
+            logger.exception("Recalculation failed for student_id=%d", student_id)
+            job = RecalcJob.query.get(student_id)
+            if job is None:
+                return
+            job.attempts = (job.attempts or 0) + 1
+            job.last_error = str(e)[:1000]
+            job.claimed_at = None
+            if job.attempts >= MAX_ATTEMPTS:
+                logger.error("Dropping recalc job for student_id=%d after %d attempts",
+                             student_id, job.attempts)
+                db.session.delete(job)
+            db.session.commit()
+            return
+
+        # Remove the job unless a newer edit arrived while we were running —
+        # in that case release the claim so the next pass picks it up.
+        deleted = RecalcJob.query.filter(
+            RecalcJob.student_id == student_id,
+            RecalcJob.requested_at <= seen_requested_at,
+        ).delete(synchronize_session=False)
+        if not deleted:
+            RecalcJob.query.filter_by(student_id=student_id).update(
+                {"claimed_at": None}, synchronize_session=False
+            )
+            self._wake.set()
+        db.session.commit()
+        logger.info("Weekly update recalculated for student_id=%d", student_id)
+
+        try:
+            alert_engine.evaluate([student_id])
+        except Exception:
+            db.session.rollback()
+            logger.exception("Alert evaluation failed for student_id=%d", student_id)
+
+
+recalc_queue = RecalcQueue()
@@ -10,7 +10,10 @@ from collections import defaultdict
 
 from core.errors import NotFoundError
 from core.extensions import db
-from models import StudentProfile, StudySession, Skill
+from core.identity import load_student
+from models import StudySession, Skill
+from services.dashboard_service import DashboardService
+from services.recalc_queue import recalc_queue
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +23,8 @@ class SessionService:
 
     @staticmethod
     def _get_student(user_id):
-        student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+        """``user_id`` may also be an already-resolved StudentProfile."""
+        student = load_student(user_id)
         if not student:
             raise NotFoundError("Student profile not found")
         return student
@@ -91,9 +95,8 @@ class SessionService:
         db.session.add(session)
         db.session.commit()
 
-        # Recalculate dashboard data
-        from dashboard.recalculate import recalculate_weekly_update
-        recalculate_weekly_update(student.id)
+        # Queue a (coalesced) recalculation of dashboard data
+        recalc_queue.enqueue(student.id)
 
         logger.info("Study session created for student_id=%d, topic=%s",
                      student.id, data.topic_studied)
@@ -118,6 +121,7 @@ class SessionService:
         if "skill" in data:
             session.related_skill = data["skill"] if data["skill"] else None
 
+        DashboardService.invalidate_snapshot(student.id)
         db.session.commit()
 
         logger.info("Study session %d updated", session_id)
@@ -138,5 +142,6 @@ class SessionService:
             raise NotFoundError("Session not found")
 
         db.session.delete(session)
+        DashboardService.invalidate_snapshot(student.id)
         db.session.commit()
         logger.info("Study session %d deleted by student_id=%d", session_id, student.id)
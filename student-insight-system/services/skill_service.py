@@ -10,9 +10,11 @@ from datetime import datetime
 
 from core.errors import NotFoundError
 from core.extensions import db
+from core.identity import load_student
 from models import (
-    StudentProfile, StudentSkill, StudentSkillProgress, ActionPlan,
+    StudentSkill, StudentSkillProgress, ActionPlan,
 )
+from services.dashboard_service import DashboardService
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +24,8 @@ class SkillService:
 
     @staticmethod
     def _get_student(user_id):
-        student = StudentProfile.query.filter_by(user_id=int(user_id)).first()
+        """``user_id`` may also be an already-resolved StudentProfile."""
+        student = load_student(user_id)
         if not student:
             raise NotFoundError("Student not found")
         return student
@@ -65,6 +68,7 @@ class SkillService:
             date=datetime.utcnow().date(),
         )
         db.session.add(history)
+        DashboardService.invalidate_snapshot(student.id)
         db.session.commit()
 
         logger.info("Skill '%s' updated for student_id=%d", skill_name, student.id)
@@ -175,6 +179,7 @@ class SkillService:
                 max(0, min(1.0, (100 - prof) / 100 * (4.0 - cgpa) / 4.0 + 0.1)), 2
             )
             new_score = plan.skill.proficiency_score
+            DashboardService.invalidate_snapshot(student.id)
 
         db.session.commit()
         logger.info("Action plan %d completed", plan_id)
@@ -0,0 +1,277 @@
+"""
+Ranked substring search over student names and codes.
+
+Teachers search their students as they type, so ``ILIKE '%term%'`` over
+``student_profile`` (a sequential scan) is answered from an index chosen
+per database:
+
+  trigram   PostgreSQL: pg_trgm GIN indexes on full_name / student_code
+            serve the same ILIKE filter; similarity() refines the rank
+  fts5      SQLite: an FTS5 trigram table (student_search_fts) kept in
+            sync by triggers; terms under 3 characters fall back to LIKE
+  memory    anything else: an in-process trigram index over every
+            student, dropped when a commit touches StudentProfile and
+            after STUDENT_SEARCH_INDEX_TTL_SECONDS
+  like      plain ILIKE (STUDENT_SEARCH_BACKEND=like; also used for short
+            terms whose match set is too large for the memory index)
+
+The match is applied as a filter on the caller's query, so teacher scope
+and class / section / status filters stay in SQL. Results are ranked by
+one score — exact code, name prefix, word or code prefix, any substring —
+with the student id as tie-breaker, and paged with a keyset cursor.
+
+Register in app factory:
+    from services.student_search import student_search
+    student_search.init_app(app)
+
+Usage:
+    page = student_search.search(query, "joh", cursor=cursor, limit=20)
+    page.items        # rows of ``query`` plus ``search_score``, best first
+    page.next_cursor
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from sqlalchemy import Float, case, column, event, func, literal_column, or_, select, table
+from sqlalchemy.orm import Session
+
+from core.extensions import db
+from core.pagination import keyset_page
+from models import StudentProfile
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "student_search_fts"
+MAX_MEMORY_CANDIDATES = 5000
+
+_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "full_name, student_code, content='student_profile', content_rowid='id', "
+    "tokenize='trigram')",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON student_profile BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, full_name, student_code)
+        VALUES (new.id, new.full_name, new.student_code);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON student_profile BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, full_name, student_code)
+        VALUES ('delete', old.id, old.full_name, old.student_code);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+        AFTER UPDATE OF full_name, student_code ON student_profile BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, full_name, student_code)
+        VALUES ('delete', old.id, old.full_name, old.student_code);
+        INSERT INTO {FTS_TABLE}(rowid, full_name, student_code)
+        VALUES (new.id, new.full_name, new.student_code);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+)
+
+_fts = table(FTS_TABLE, column("rowid"))
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _like_escape(term):
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class NgramIndex:
+    """Trigram postings over ``full_name`` + ``student_code`` of every student."""
+
+    def __init__(self, rows):
+        # rows: [(id, full_name, student_code)]
+        self.texts = {}
+        self.postings = defaultdict(set)
+        for student_id, name, code in rows:
+            # NUL keeps a match from spanning the two fields.
+            text = f"{name or ''}\x00{code or ''}".lower()
+            self.texts[student_id] = text
+            for gram in _trigrams(text):
+                self.postings[gram].add(student_id)
+
+    @classmethod
+    def load(cls):
+        return cls(db.session.query(
+            StudentProfile.id, StudentProfile.full_name, StudentProfile.student_code,
+        ).all())
+
+    def candidates(self, term):
+        """Ids whose name or code contains ``term`` (case-insensitive)."""
+        term = term.lower()
+        grams = sorted((self.postings.get(g, set()) for g in _trigrams(term)), key=len)
+        pool = set.intersection(*grams) if grams else self.texts
+        return [sid for sid in pool if term in self.texts[sid]]
+
+
+class StudentSearch:
+    """Backend selection, match filter and ranking for student search."""
+
+    BACKENDS = ("trigram", "fts5", "memory", "like")
+
+    def __init__(self, app=None):
+        self.configured_backend = "auto"
+        self.index_ttl = 300.0
+        self._index = None
+        self._built_at = 0.0
+        self._fts_binds = set()
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.configured_backend = app.config.get("STUDENT_SEARCH_BACKEND", "auto")
+        self.index_ttl = float(app.config.get("STUDENT_SEARCH_INDEX_TTL_SECONDS", 300))
+        app.extensions["student_search"] = self
+
+    def backend(self) -> str:
+        if self.configured_backend in self.BACKENDS:
+            return self.configured_backend
+        bind = db.session.get_bind()
+        if bind.dialect.name == "postgresql":
+            return "trigram"
+        if bind.dialect.name == "sqlite" and self._has_fts(bind):
+            return "fts5"
+        return "memory"
+
+    def search(self, query, term, cursor=None, limit=20):
+        """Filter ``query`` to matches of ``term``, ranked and paged.
+
+        ``query`` selects columns from StudentProfile, one of them labelled ``id``.
+        """
+        term = " ".join(term.split())
+        backend = self.backend()
+        score = self.score(term, backend).label("search_score")
+        return keyset_page(
+            query.filter(self.match(term, backend)).add_columns(score),
+            [score, StudentProfile.id],
+            cursor=cursor,
+            limit=limit,
+            row_key=lambda row: (row.search_score, row.id),
+        )
+
+    def match(self, term, backend):
+        """WHERE clause selecting students whose name or code contains ``term``."""
+        if backend == "fts5" and len(term) >= 3:
+            phrase = '"' + term.replace('"', '""') + '"'
+            return StudentProfile.id.in_(
+                select(_fts.c.rowid).where(literal_column(FTS_TABLE).op("MATCH")(phrase))
+            )
+        if backend == "memory":
+            ids = self.ngram_index().candidates(term)
+            if len(ids) <= MAX_MEMORY_CANDIDATES:
+                return StudentProfile.id.in_(ids)
+        pattern = f"%{_like_escape(term)}%"
+        return or_(
+            StudentProfile.full_name.ilike(pattern, escape="\\"),
+            StudentProfile.student_code.ilike(pattern, escape="\\"),
+        )
+
+    def score(self, term, backend):
+        """Higher is better: exact code 4, name prefix 3, word/code prefix 2, substring 1."""
+        lowered = term.lower()
+        escaped = _like_escape(lowered)
+        name = func.lower(StudentProfile.full_name)
+        code = func.lower(func.coalesce(StudentProfile.student_code, ""))
+        score = case(
+            (code == lowered, 4.0),
+            (name.like(f"{escaped}%", escape="\\"), 3.0),
+            (or_(
+                name.like(f"% {escaped}%", escape="\\"),
+                code.like(f"{escaped}%", escape="\\"),
+            ), 2.0),
+            else_=1.0,
+        )
+        if backend == "trigram":
+            score = score + func.similarity(StudentProfile.full_name, term, type_=Float)
+        return score
+
+    def ngram_index(self) -> NgramIndex:
+        index = self._index
+        if index is not None and time.monotonic() - self._built_at < self.index_ttl:
+            return index
+        with self._lock:
+            index = NgramIndex.load()
+            self._index = index
+            self._built_at = time.monotonic()
+        logger.debug("Student n-gram index rebuilt: %d students", len(index.texts))
+        return index
+
+    def invalidate(self):
+        self._index = None
+
+    def _has_fts(self, bind):
+        key = str(bind.url)
+        if key in self._fts_binds:
+            return True
+        found = db.session.execute(
+            db.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first() is not None
+        if found:
+            self._fts_binds.add(key)
+        return found
+
+
+student_search = StudentSearch()
+
+
+# ── SQLite FTS5 table lifecycle ───────────────────────────────
+
+def create_fts_index(connection):
+    """Create (or rebuild) the FTS5 table and its sync triggers; False if FTS5 is missing."""
+    try:
+        for statement in _FTS_DDL:
+            connection.exec_driver_sql(statement)
+    except Exception:
+        logger.warning("SQLite FTS5 unavailable — student search uses the in-memory index")
+        return False
+    return True
+
+
+@event.listens_for(StudentProfile.__table__, "after_create")
+def _create_fts_after_create(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        create_fts_index(connection)
+
+
+@event.listens_for(StudentProfile.__table__, "before_drop")
+def _drop_fts_before_drop(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+        student_search._fts_binds.discard(str(connection.engine.url))
+
+
+# ── In-memory index invalidation ──────────────────────────────
+
+def _search_fields_changed(obj):
+    state = db.inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in ("full_name", "student_code"))
+
+
+@event.listens_for(Session, "after_flush")
+def _note_student_changes(session, flush_context):
+    # Only name / code edits matter (last_activity is bumped constantly).
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, StudentProfile):
+            session.info["student_search_dirty"] = True
+            return
+    for obj in session.dirty:
+        if isinstance(obj, StudentProfile) and _search_fields_changed(obj):
+            session.info["student_search_dirty"] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop("student_search_dirty", False):
+        student_search.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("student_search_dirty", None)
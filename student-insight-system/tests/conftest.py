@@ -57,3 +57,26 @@ def auth_headers(app, db_session):
             )
             return {"Authorization": f"Bearer {token}"}
     return _make
+
+
+@pytest.fixture(scope="function")
+def login_as(app, client):
+    """
+    Factory fixture that registers a user and sets the JWT cookie on ``client``.
+
+    Usage:
+        user = login_as("student")            # returns the User row
+        user = login_as("teacher", name="T")
+    """
+    from services.auth_service import AuthService
+
+    counter = {"n": 0}
+
+    def _login(role="student", name="Test User", email=None):
+        counter["n"] += 1
+        email = email or f"{role}{counter['n']}@example.com"
+        AuthService.register_user(name, email, "password123", role)
+        result = AuthService.login_user(email, "password123", role)
+        client.set_cookie("access_token_cookie", result["access_token"])
+        return User.query.filter_by(email=email).first()
+    return _login
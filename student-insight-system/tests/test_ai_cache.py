@@ -0,0 +1,102 @@
+"""DB-backed AI response cache."""
+
+from datetime import datetime, timedelta
+
+from core.extensions import db
+from infrastructure.ai.cached_service import CachedAIService
+from infrastructure.ai.mock_service import MockAIService
+from models import AIResponseCache, Skill
+
+
+class CountingAI(MockAIService):
+    def __init__(self):
+        self.calls = 0
+
+    def generate_text(self, prompt):
+        self.calls += 1
+        return f"report #{self.calls}"
+
+    def generate_json(self, prompt):
+        self.calls += 1
+        return [{"title": f"task #{self.calls}"}]
+
+
+def test_repeat_prompt_is_served_from_cache(db_session):
+    inner = CountingAI()
+    before = CachedAIService.stats()
+    ai = CachedAIService(inner)
+
+    assert ai.generate_text("Hello\n   world") == "report #1"
+    assert ai.generate_text("  Hello world ") == "report #1"
+    assert ai.generate_json("Hello world") == [{"title": "task #2"}]
+    assert ai.generate_json("Hello world") == [{"title": "task #2"}]
+    assert inner.calls == 2
+
+    after = CachedAIService.stats()
+    assert after["hits"] - before["hits"] == 2
+    assert after["misses"] - before["misses"] == 2
+
+
+def test_bypass_and_expiry_call_the_provider(db_session):
+    inner = CountingAI()
+    CachedAIService(inner).generate_text("prompt")
+    assert CachedAIService(inner, bypass=True).generate_text("prompt") == "report #2"
+    # the bypassed call refreshed the entry
+    assert CachedAIService(inner).generate_text("prompt") == "report #2"
+
+    AIResponseCache.query.update({"expires_at": datetime.utcnow() - timedelta(seconds=1)})
+    db.session.commit()
+    assert CachedAIService(inner).generate_text("prompt") == "report #3"
+
+
+def test_least_recently_used_entries_are_evicted(db_session):
+    inner = CountingAI()
+    ai = CachedAIService(inner, max_entries=2, sweep_seconds=0)
+    ai.generate_text("a")
+    ai.generate_text("b")
+    AIResponseCache.query.filter_by(cache_key=ai.cache_key("text", "a")).update(
+        {"last_accessed_at": datetime.utcnow() + timedelta(seconds=5)}
+    )
+    db.session.commit()
+    ai.generate_text("c")
+
+    keys = {row.cache_key for row in AIResponseCache.query.all()}
+    assert keys == {ai.cache_key("text", "a"), ai.cache_key("text", "c")}
+
+
+def test_eviction_sweeps_at_most_once_per_interval(db_session):
+    inner = CountingAI()
+    CachedAIService(inner, max_entries=1, sweep_seconds=0).generate_text("a")
+
+    ai = CachedAIService(inner, max_entries=1, sweep_seconds=3600)
+    ai.generate_text("b")
+    ai.generate_text("c")
+
+    assert AIResponseCache.query.count() == 3
+
+
+def test_cache_does_not_commit_the_callers_session(db_session):
+    ai = CachedAIService(CountingAI())
+    ai.generate_text("prompt")
+
+    db.session.add(Skill(skill_name="Half-finished"))
+    assert ai.generate_text("prompt") == "report #1"
+    db.session.rollback()
+
+    assert Skill.query.filter_by(skill_name="Half-finished").first() is None
+    assert AIResponseCache.query.one().hit_count == 1
+
+
+def test_insight_route_reuses_cached_report(app, client, login_as, monkeypatch):
+    inner = CountingAI()
+    monkeypatch.setitem(app.config, "AI_SERVICE", inner)
+    login_as("student")
+    form = {"department": "CSE", "cgpa": "3.4", "skills": "Python"}
+
+    first = client.post("/student/insight-report", data=form).get_json()
+    second = client.post("/student/insight-report", data=form).get_json()
+    refreshed = client.post("/student/insight-report", data={**form, "refresh": "1"}).get_json()
+
+    assert first["report"] == second["report"] == "report #1"
+    assert refreshed["report"] == "report #2"
+    assert inner.calls == 2
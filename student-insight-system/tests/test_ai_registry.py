@@ -0,0 +1,77 @@
+"""Process-wide AI provider registry."""
+
+import threading
+import time
+
+from infrastructure.ai.mock_service import MockAIService
+from infrastructure.ai.registry import AIProviderRegistry
+
+
+class SlowAI(MockAIService):
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.warmed = False
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        self.warmed = True
+
+    def generate_text(self, prompt):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return "ok"
+
+
+def _registry(app, monkeypatch, **config):
+    monkeypatch.setitem(app.config, "AI_SERVICE", None)
+    for key, value in config.items():
+        monkeypatch.setitem(app.config, key, value)
+    return AIProviderRegistry(app)
+
+
+def test_client_is_built_once_and_reused(app, monkeypatch):
+    registry = _registry(app, monkeypatch, AI_PROVIDER="slow")
+    built = []
+    registry.register("slow", lambda config: built.append(1) or SlowAI())
+
+    first, second = registry.get(), registry.get()
+    assert first.inner is second.inner
+    assert len(built) == 1
+    assert first.model_name == "mock"
+
+
+def test_concurrency_limit_is_shared(app, monkeypatch):
+    registry = _registry(app, monkeypatch, AI_PROVIDER="slow", AI_MAX_CONCURRENCY=2)
+    client = SlowAI()
+    registry.register("slow", lambda config: client)
+
+    threads = [threading.Thread(target=lambda: registry.get().generate_text("x")) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert client.peak == 2
+
+
+def test_warm_up_and_config_override(app, monkeypatch):
+    registry = _registry(app, monkeypatch, AI_PROVIDER="slow")
+    client = SlowAI()
+    registry.register("slow", lambda config: client)
+    registry.warm_up()
+    assert client.warmed
+
+    override = MockAIService()
+    monkeypatch.setitem(app.config, "AI_SERVICE", override)
+    assert registry.get().inner is override
+
+
+def test_missing_gemini_key_is_reported(app, monkeypatch):
+    registry = _registry(app, monkeypatch, AI_PROVIDER="gemini", GEMINI_API_KEY="")
+    assert not registry.is_configured()
+    assert registry.is_configured("mock")
@@ -0,0 +1,132 @@
+"""Rate limits, timeouts and circuit breaker around AI providers."""
+
+import time
+
+import pytest
+
+from core.errors import ExternalServiceError, RateLimitError
+from infrastructure.ai.mock_service import MockAIService
+from infrastructure.ai.resilience import CircuitBreaker, ResiliencePolicy, ResilientAIService
+
+
+class FlakyAI(MockAIService):
+    def __init__(self, fail=False, delay=0.0):
+        self.fail = fail
+        self.delay = delay
+        self.calls = 0
+
+    def generate_text(self, prompt):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ExternalServiceError("AI service unavailable: 503")
+        return "ok"
+
+
+def _policy(**overrides):
+    options = dict(max_concurrency=2, acquire_timeout=0.05, call_timeout=1.0,
+                   global_rate_per_minute=1000, user_rate_per_minute=1000,
+                   breaker_failures=3, breaker_reset_seconds=60)
+    options.update(overrides)
+    return ResiliencePolicy(**options)
+
+
+def test_per_user_and_global_rate_limits():
+    policy = _policy(user_rate_per_minute=2, global_rate_per_minute=3)
+    inner = FlakyAI()
+
+    ResilientAIService(inner, policy, user_id="1").generate_text("x")
+    ResilientAIService(inner, policy, user_id="1").generate_text("x")
+    with pytest.raises(RateLimitError):
+        ResilientAIService(inner, policy, user_id="1").generate_text("x")
+
+    ResilientAIService(inner, policy, user_id="2").generate_text("x")
+    with pytest.raises(RateLimitError):
+        ResilientAIService(inner, policy, user_id="3").generate_text("x")
+    assert inner.calls == 3
+
+
+def test_slow_call_times_out_and_keeps_its_slot():
+    policy = _policy(max_concurrency=1, call_timeout=0.05)
+    slow = FlakyAI(delay=0.3)
+
+    with pytest.raises(ExternalServiceError, match="timed out"):
+        ResilientAIService(slow, policy).generate_text("x")
+    # Provider is still busy with the first call: no slot for a second one.
+    with pytest.raises(ExternalServiceError, match="capacity"):
+        ResilientAIService(FlakyAI(), policy).generate_text("x")
+
+    time.sleep(0.35)
+    assert ResilientAIService(FlakyAI(), policy).generate_text("x") == "ok"
+
+
+def test_breaker_opens_fails_fast_and_recovers_after_probe():
+    policy = _policy(breaker_failures=3, breaker_reset_seconds=0.1)
+    broken = FlakyAI(fail=True)
+    ai = ResilientAIService(broken, policy)
+
+    for _ in range(3):
+        with pytest.raises(ExternalServiceError, match="503"):
+            ai.generate_text("x")
+    assert policy.breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(ExternalServiceError, match="temporarily unavailable"):
+        ai.generate_text("x")
+    assert broken.calls == 3
+
+    time.sleep(0.15)
+    broken.fail = False
+    assert ai.generate_text("x") == "ok"
+    assert policy.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(ExternalServiceError):
+        breaker.before_call()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_stream_is_limited_and_times_out_between_chunks():
+    class SlowStream(MockAIService):
+        def generate_text_stream(self, prompt):
+            yield "<h3>"
+            time.sleep(0.3)
+            yield "</h3>"
+
+    policy = _policy(call_timeout=0.05)
+    stream = ResilientAIService(SlowStream(), policy).generate_text_stream("x")
+    assert next(stream) == "<h3>"
+    with pytest.raises(ExternalServiceError, match="timed out"):
+        next(stream)
+
+    chunks = ResilientAIService(MockAIService(), _policy()).generate_text_stream("x")
+    assert list(chunks) == list(MockAIService().generate_text_stream("x"))
+
+
+def test_cancelled_stream_probe_closes_the_breaker():
+    class ChattyStream(MockAIService):
+        def generate_text_stream(self, prompt):
+            for chunk in ("<h3>", "Report", "</h3>"):
+                time.sleep(0.02)
+                yield chunk
+
+    policy = _policy(breaker_failures=1, breaker_reset_seconds=0.05)
+    policy.breaker.record_failure()
+    time.sleep(0.06)
+
+    stream = ResilientAIService(ChattyStream(), policy).generate_text_stream("x")
+    assert next(stream) == "<h3>"
+    assert policy.breaker.state == CircuitBreaker.HALF_OPEN
+    stream.close()  # the client disconnected mid-stream
+
+    deadline = time.monotonic() + 1
+    while policy.breaker.state == CircuitBreaker.HALF_OPEN and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert policy.breaker.state == CircuitBreaker.CLOSED
+    assert ResilientAIService(FlakyAI(), policy).generate_text("x") == "ok"
@@ -0,0 +1,123 @@
+"""Alert rules raise de-duplicated StudentAlert rows, incrementally or in a sweep."""
+
+from datetime import date, datetime, timedelta
+
+from core.extensions import db
+from models import (
+    Assessment, AssessmentResult, Attendance, CourseCatalog, StudentAcademicRecord,
+    StudentAlert, StudentProfile, StudySession, User, WeeklyUpdate,
+)
+from services.alert_engine import alert_engine
+
+TODAY = date(2026, 10, 14)
+
+
+def _student(n):
+    user = User(email=f"alert{n}@example.com", password_hash="x", role="student")
+    db.session.add(user)
+    db.session.flush()
+    student = StudentProfile(user_id=user.id, full_name=f"Student {n}")
+    db.session.add(student)
+    db.session.flush()
+    return student
+
+
+def _build():
+    """One student per rule, plus a healthy one."""
+    burnt, idle, dropping, failing, absent, fine = (_student(n) for n in range(6))
+
+    db.session.add(WeeklyUpdate(student_id=burnt.id, week_start_date=TODAY - timedelta(days=9),
+                                burnout_risk_score=0.2))
+    db.session.add(WeeklyUpdate(student_id=burnt.id, week_start_date=TODAY - timedelta(days=2),
+                                burnout_risk_score=0.8))
+    db.session.add(WeeklyUpdate(student_id=fine.id, week_start_date=TODAY - timedelta(days=2),
+                                burnout_risk_score=0.69))
+
+    db.session.add(StudySession(student_id=idle.id, date=TODAY - timedelta(days=12),
+                                duration_minutes=60))
+    db.session.add(StudySession(student_id=fine.id, date=TODAY - timedelta(days=1),
+                                duration_minutes=60))
+
+    course = CourseCatalog(course_name="Algorithms", credit_value=3)
+    db.session.add(course)
+    db.session.flush()
+    for student, grades in ((dropping, [4.0, 4.0, 2.0]), (fine, [3.0, 3.3, 3.5])):
+        for semester, grade_point in enumerate(grades, start=1):
+            db.session.add(StudentAcademicRecord(student_id=student.id, course_id=course.id,
+                                                 grade_point=grade_point, semester_taken=semester))
+
+    quiz = Assessment(title="Quiz", date=TODAY - timedelta(days=5))
+    old_quiz = Assessment(title="Old quiz", date=TODAY - timedelta(days=90))
+    db.session.add_all([quiz, old_quiz])
+    db.session.flush()
+    for assessment in (quiz, old_quiz, quiz):
+        db.session.add(AssessmentResult(assessment_id=assessment.id, student_id=failing.id,
+                                        percentage=35))
+    db.session.add(AssessmentResult(assessment_id=old_quiz.id, student_id=fine.id, percentage=20))
+
+    for day in range(6):
+        status = "present" if day < 3 else "absent"
+        db.session.add(Attendance(student_id=absent.id, date=TODAY - timedelta(days=day),
+                                  status=status))
+        db.session.add(Attendance(student_id=fine.id, date=TODAY - timedelta(days=day),
+                                  status="present"))
+    db.session.commit()
+    return {"burnout_risk": burnt.id, "inactivity": idle.id, "cgpa_drop": dropping.id,
+            "failing_assessments": failing.id, "low_attendance": absent.id}
+
+
+def _open_alerts():
+    return sorted(
+        (a.student_id, a.type, a.severity)
+        for a in StudentAlert.query.filter_by(is_resolved=False)
+    )
+
+
+def test_sweep_raises_one_alert_per_matching_rule(db_session):
+    expected = _build()
+
+    created = alert_engine.evaluate(today=TODAY)
+
+    assert created == {alert_type: 1 for alert_type in expected}
+    severities = {alert_type: severity for alert_type, severity, _ in alert_engine.rules()}
+    assert _open_alerts() == sorted(
+        (student_id, alert_type, severities[alert_type])
+        for alert_type, student_id in expected.items()
+    )
+    message = StudentAlert.query.filter_by(type="cgpa_drop").one().message
+    assert message == "CGPA dropped from 4.00 to 3.33 after semester 3"
+
+
+def test_open_and_recently_resolved_alerts_are_not_duplicated(db_session):
+    expected = _build()
+    alert_engine.evaluate(today=TODAY)
+
+    assert alert_engine.evaluate(today=TODAY) == {}
+
+    StudentAlert.query.filter_by(type="inactivity").update({"is_resolved": True})
+    db.session.commit()
+    assert alert_engine.evaluate(today=TODAY) == {}
+    assert StudentAlert.query.filter_by(student_id=expected["inactivity"]).count() == 1
+
+
+def test_incremental_evaluation_only_touches_given_students(db_session):
+    expected = _build()
+
+    created = alert_engine.evaluate([expected["burnout_risk"], expected["cgpa_drop"]], today=TODAY)
+
+    assert created == {"burnout_risk": 1, "cgpa_drop": 1}
+    assert {a.student_id for a in StudentAlert.query} == {
+        expected["burnout_risk"], expected["cgpa_drop"],
+    }
+    assert alert_engine.evaluate([], today=TODAY) == {}
+
+
+def test_concurrent_duplicate_insert_is_ignored(db_session):
+    student = _student(99)
+    db.session.commit()
+    row = {"student_id": student.id, "type": "inactivity", "severity": "warning",
+           "message": "x", "is_resolved": False, "created_at": datetime.utcnow()}
+
+    alert_engine._insert([row, dict(row)])
+
+    assert StudentAlert.query.filter_by(student_id=student.id).count() == 1
@@ -0,0 +1,100 @@
+"""Teacher alerts page: keyset pagination over (created_at, id)."""
+
+from datetime import datetime, timedelta
+
+from core.extensions import db
+from models import StudentAlert, StudentProfile, TeacherAssignment, TeacherProfile, User
+
+
+def _setup(login_as, alerts=45, other_alerts=5):
+    user = login_as("teacher", name="Teacher")
+    teacher = TeacherProfile.query.filter_by(user_id=user.id).one()
+
+    def student(n):
+        u = User(email=f"paged{n}@example.com", password_hash="x", role="student")
+        db.session.add(u)
+        db.session.flush()
+        s = StudentProfile(user_id=u.id, full_name=f"Student {n}")
+        db.session.add(s)
+        db.session.flush()
+        return s
+
+    mine, other = student(1), student(2)
+    db.session.add(TeacherAssignment(teacher_id=teacher.id, student_id=mine.id))
+
+    # Many alerts share a timestamp (bulk-raised), so the id tie-breaker matters.
+    base = datetime(2026, 10, 1, 9, 0)
+    for n in range(alerts):
+        db.session.add(StudentAlert(student_id=mine.id, type=f"t{n}", message=f"m{n}",
+                                    created_at=base + timedelta(minutes=n // 4)))
+    for n in range(other_alerts):
+        db.session.add(StudentAlert(student_id=other.id, type=f"o{n}", message="x",
+                                    created_at=base))
+    db.session.commit()
+    expected = [
+        a.id for a in StudentAlert.query.filter_by(student_id=mine.id)
+        .order_by(StudentAlert.created_at.desc(), StudentAlert.id.desc())
+    ]
+    return expected
+
+
+def _fetch(client, cursor=None, **params):
+    params = {"json": "true", **params}
+    if cursor:
+        params["cursor"] = cursor
+    resp = client.get("/teacher/alerts", query_string=params)
+    assert resp.status_code == 200, resp.get_data(as_text=True)
+    return resp.get_json()
+
+
+def test_cursor_pages_walk_every_alert_once_in_order(client, login_as):
+    expected = _setup(login_as)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        data = _fetch(client, cursor)
+        seen += [a["id"] for a in data["alerts"]]
+        pages += 1
+        if not data["has_next"]:
+            assert data["next_cursor"] is None
+            break
+        cursor = data["next_cursor"]
+
+    assert seen == expected
+    assert pages == 3
+
+
+def test_resolving_alerts_mid_scroll_does_not_skip_rows(client, login_as):
+    expected = _setup(login_as)
+
+    first = _fetch(client, limit=10)
+    StudentAlert.query.filter(StudentAlert.id.in_(expected[:10])).update(
+        {"is_resolved": True}, synchronize_session=False
+    )
+    db.session.commit()
+    second = _fetch(client, first["next_cursor"], limit=10)
+
+    assert [a["id"] for a in second["alerts"]] == expected[10:20]
+
+
+def test_total_is_capped_and_only_sent_on_first_page(client, login_as, monkeypatch):
+    import dashboard.teacher_routes as teacher_routes
+
+    _setup(login_as)
+    first = _fetch(client)
+    assert (first["total_alerts"], first["total_is_exact"]) == (45, True)
+    assert _fetch(client, first["next_cursor"])["total_alerts"] is None
+
+    monkeypatch.setattr(teacher_routes, "ALERTS_TOTAL_CAP", 30)
+    assert (_fetch(client)["total_alerts"], _fetch(client)["total_is_exact"]) == (30, False)
+    page = client.get("/teacher/alerts").get_data(as_text=True)
+    assert "30+</span>" in page
+    assert f'id="nextCursor" value="{first["next_cursor"]}"' in page
+
+
+def test_malformed_cursor_is_rejected(client, login_as):
+    _setup(login_as, alerts=1, other_alerts=0)
+
+    resp = client.get("/teacher/alerts", query_string={"json": "true", "cursor": "not-a-cursor"})
+
+    assert resp.status_code == 400
@@ -0,0 +1,56 @@
+"""benchmarks/: every case runs against a seeded database and reports its numbers."""
+
+import json
+
+import pytest
+
+import seed
+from benchmarks.cases import CASES, BenchContext
+from benchmarks.harness import CaseResult, build_report, format_table, measure, write_report
+from core.extensions import db
+
+
+@pytest.fixture
+def bench(app, db_session):
+    args = seed.build_parser().parse_args([
+        "--all", "--num-students", "12", "--students-per-teacher", "6", "--weeks", "3",
+        "--sessions-per-student", "5", "--today", "2026-10-14",
+    ])
+    with db.engine.connect() as connection:
+        seed.run(args, connection)
+    return BenchContext(app, sample_size=5)
+
+
+def test_percentiles_interpolate():
+    result = CaseResult("x", [float(n) for n in range(1, 101)], [3] * 100)
+
+    assert result.percentile(50) == pytest.approx(50.5)
+    assert result.percentile(99) == pytest.approx(99.01)
+    summary = result.summary()
+    assert summary["min_ms"] == 1 and summary["max_ms"] == 100
+    assert summary["queries_per_op"] == 3
+    assert summary["ops_per_sec"] == pytest.approx(100 / 5.05, rel=1e-3)
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_case_runs(bench, name):
+    result = measure(name, CASES[name](bench), db.engine, iterations=3, warmup=1)
+
+    summary = result.summary()
+    assert summary["iterations"] == 3
+    assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+    assert summary["queries_per_op"] > 0
+
+
+def test_report_round_trips_and_compares(tmp_path):
+    results = [CaseResult("login", [10.0, 12.0], [3, 3])]
+    report = build_report(results, {"students": 12})
+    path = tmp_path / "out" / "run.json"
+
+    write_report(report, str(path))
+
+    loaded = json.loads(path.read_text())
+    assert loaded["cases"]["login"]["p50_ms"] == 11.0
+    assert loaded["environment"] == {"students": 12}
+    baseline = {"cases": {"login": {"p50_ms": 22.0, "p95_ms": 11.9}}}
+    assert "-50.0%" in format_table(loaded, baseline)
@@ -0,0 +1,101 @@
+"""Career × skill matrix: counts, ordering, invalidation and query count."""
+
+import threading
+import time
+
+from sqlalchemy import event
+
+from core.extensions import db
+from models import CareerPath, CareerRequiredSkill, Skill, StudentSkill, StudentGoal
+from services.academic_service import AcademicService
+from services.career_matrix import CareerMatrixCache, CareerSkillMatrix, career_matrix
+
+
+def _catalog(n_careers=40):
+    skills = [Skill(skill_name=f"Skill {i}") for i in range(6)]
+    careers = [CareerPath(title=f"Career {i}", field_category="Tech") for i in range(n_careers)]
+    db.session.add_all(skills + careers)
+    db.session.flush()
+    for i, career in enumerate(careers):
+        for skill in skills[i % 3: i % 3 + 3]:
+            db.session.add(CareerRequiredSkill(career_id=career.id, skill_id=skill.id))
+    db.session.commit()
+    return skills, careers
+
+
+def test_match_counts_and_ranking():
+    m = CareerSkillMatrix(
+        careers=[(1, "A", None), (2, "B", None), (3, "C", None)],
+        links=[(1, 10, "x"), (1, 11, "y"), (2, 11, "y"), (2, 11, "y"), (3, 12, "z")],
+    )
+    match = m.match({11, 12})
+    assert match.ranked() == [(2, 2), (1, 1), (3, 1)]
+    assert match.total(1) == 2 and match.percent(1) == 50
+    assert match.skills(1) == [
+        {"id": 10, "name": "x", "matched": False},
+        {"id": 11, "name": "y", "matched": True},
+    ]
+    assert match.count(99) == 0 and match.percent(99) == 0
+
+
+def test_matrix_rebuilt_after_career_edit(db_session):
+    skills, careers = _catalog(n_careers=2)
+    first = career_matrix.get()
+    assert career_matrix.get() is first
+
+    db.session.add(CareerRequiredSkill(career_id=careers[0].id, skill_id=skills[5].id))
+    db.session.commit()
+
+    rebuilt = career_matrix.get()
+    assert rebuilt is not first
+    assert skills[5].id in rebuilt.required_skill_ids(careers[0].id)
+
+
+def test_goals_page_query_count_is_independent_of_careers(client, login_as):
+    user = login_as("student")
+    skills, careers = _catalog()
+    student = user.student_profile
+    for skill in skills[:2]:
+        db.session.add(StudentSkill(student_id=student.id, skill_id=skill.id,
+                                    skill_name=skill.skill_name))
+    db.session.add(StudentGoal(student_id=student.id, career_id=careers[1].id, is_primary=True))
+    db.session.commit()
+    career_matrix.get()  # warm
+
+    statements = []
+    engine = db.engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        data = AcademicService.get_goals_grades_data(str(user.id))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) < 10
+    assert len(data["matching_careers"]) == 27  # careers requiring skill 0 or 1
+    top = data["matching_careers"][0]
+    assert top["match_count"] == 2 and top["total_req"] == 3
+    assert data["goals"][0]["career_id"] == careers[1].id
+    assert data["goals"][0]["match_count"] == 1
+
+
+def test_expired_matrix_is_rebuilt_once_by_concurrent_readers(monkeypatch):
+    loads = []
+
+    def slow_load():
+        loads.append(1)
+        time.sleep(0.05)
+        return CareerSkillMatrix([(1, "Data Scientist", "Data")], [(1, 10, "Python")])
+
+    monkeypatch.setattr(CareerSkillMatrix, "load", staticmethod(slow_load))
+    cache = CareerMatrixCache()
+    cache.get()
+    cache._built_at -= cache.ttl  # TTL expired
+
+    threads = [threading.Thread(target=cache.get, args=([1],)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(loads) == 2  # the initial build plus exactly one rebuild
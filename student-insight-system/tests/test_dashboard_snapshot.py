@@ -0,0 +1,60 @@
+"""Dashboard snapshot — materialised on write, served on read."""
+
+from datetime import date, timedelta
+
+from core.extensions import db
+from models import StudentDashboardSnapshot
+from services.dashboard_service import DashboardService
+from services.recalc_queue import recalc_queue
+
+
+def _add_grade(client, **overrides):
+    payload = {"course_name": "Calculus", "course_type": "Core",
+               "credit_value": 3, "semester": 1, "grade": "A"}
+    payload.update(overrides)
+    resp = client.post("/api/gg/grade/add", json=payload)
+    recalc_queue.flush()
+    return resp
+
+
+def test_snapshot_built_on_write_and_served_on_read(client, login_as):
+    user = login_as("student")
+    _add_grade(client)
+
+    student = user.student_profile
+    snapshot = StudentDashboardSnapshot.query.get(student.id)
+    assert snapshot is not None
+    assert DashboardService.snapshot_is_fresh(snapshot)
+
+    cached = DashboardService.get_dashboard_data(user.id)
+    live = DashboardService.get_dashboard_data(user.id, use_snapshot=False)
+    assert cached == live
+    assert cached["cgpa"] == 4.0
+
+
+def test_invalidated_snapshot_falls_back_to_live(client, login_as):
+    user = login_as("student")
+    _add_grade(client)
+    student = user.student_profile
+
+    record_id = student.academic_records[0].id
+    client.post(f"/api/gg/grade/{record_id}/delete")
+
+    snapshot = StudentDashboardSnapshot.query.get(student.id)
+    assert snapshot.is_stale
+
+    data = DashboardService.get_dashboard_data(user.id)
+    assert data["has_grades"] is False
+    assert not StudentDashboardSnapshot.query.get(student.id).is_stale
+
+
+def test_snapshot_from_previous_day_is_not_served(client, login_as):
+    user = login_as("student")
+    _add_grade(client)
+    snapshot = StudentDashboardSnapshot.query.get(user.student_profile.id)
+    snapshot.built_for_date = date.today() - timedelta(days=1)
+    db.session.commit()
+
+    assert not DashboardService.snapshot_is_fresh(snapshot)
+    DashboardService.get_dashboard_data(user.id)
+    assert StudentDashboardSnapshot.query.get(user.student_profile.id).built_for_date == date.today()
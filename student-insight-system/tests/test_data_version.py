@@ -0,0 +1,98 @@
+"""Per-student data version and the ETag / 304 short-circuit on the student JSON APIs."""
+
+from datetime import date
+
+from core.data_version import bump_data_version
+from core.extensions import db
+from models import (
+    CareerPath, CareerRequiredSkill, Skill, StudentDashboardSnapshot, StudentNote, StudentProfile,
+)
+from services.academic_service import AcademicService
+
+
+def _version(user):
+    db.session.expire_all()
+    return StudentProfile.query.filter_by(user_id=user.id).one().data_version
+
+
+def test_unchanged_state_is_a_304_without_running_the_view(client, login_as, monkeypatch):
+    login_as("student")
+    first = client.get("/api/gg/state")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200 and etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    monkeypatch.setattr(AcademicService, "get_goals_grades_data",
+                        lambda *a: (_ for _ in ()).throw(AssertionError("view ran")))
+    again = client.get("/api/gg/state", headers={"If-None-Match": etag})
+
+    assert again.status_code == 304 and again.data == b""
+    assert again.headers["ETag"] == etag
+
+
+def test_a_write_changes_the_etag(client, login_as):
+    login_as("student")
+    etag = client.get("/api/gg/state").headers["ETag"]
+
+    assert client.post("/api/gg/target-cgpa", json={"target_cgpa": 3.6}).status_code == 200
+
+    after = client.get("/api/gg/state", headers={"If-None-Match": etag})
+    assert after.status_code == 200 and after.headers["ETag"] != etag
+    assert after.get_json()["target_cgpa"] == 3.6
+
+
+def test_catalog_changes_change_the_career_dependent_etag(client, login_as):
+    login_as("student")
+    etag = client.get("/api/gg/state").headers["ETag"]
+    skills_etag = client.get("/api/skills/history").headers["ETag"]
+
+    # Another student adds a goal for a career that isn't in the catalog yet.
+    career, skill = CareerPath(title="Robotics Engineer"), Skill(skill_name="ROS")
+    db.session.add_all([career, skill])
+    db.session.flush()
+    db.session.add(CareerRequiredSkill(career_id=career.id, skill_id=skill.id))
+    db.session.commit()
+
+    after = client.get("/api/gg/state", headers={"If-None-Match": etag})
+    assert after.status_code == 200 and after.headers["ETag"] != etag
+    assert client.get("/api/skills/history", headers={"If-None-Match": skills_etag}).status_code == 304
+
+
+def test_etags_are_per_endpoint(client, login_as):
+    login_as("student")
+    tags = {client.get(url).headers["ETag"]
+            for url in ("/api/gg/state", "/api/skills/history", "/api/action-plans", "/api/student/notifications")}
+    assert len(tags) == 4
+
+
+def test_teacher_notes_and_bulk_mark_read_bump_the_student(client, login_as):
+    teacher = login_as("teacher").teacher_profile
+    student = login_as("student")
+    profile = student.student_profile
+    etag = client.get("/api/student/notifications").headers["ETag"]
+    before = _version(student)
+
+    db.session.add(StudentNote(student_id=profile.id, teacher_id=teacher.id, content="Nice work", is_private=False))
+    db.session.commit()
+    assert _version(student) == before + 1
+
+    resp = client.get("/api/student/notifications", headers={"If-None-Match": etag})
+    assert resp.status_code == 200 and resp.get_json()["unread_count"] == 1
+
+    note_id = resp.get_json()["recent"][0]["id"]
+    client.post("/api/student/notifications/mark-read", json={"note_ids": [note_id]})
+    assert _version(student) == before + 2
+
+
+def test_snapshots_do_not_count_and_explicit_bumps_do(db_session, login_as):
+    student = login_as("student")
+    profile = student.student_profile
+    before = _version(student)
+
+    db.session.add(StudentDashboardSnapshot(student_id=profile.id, payload="{}", built_for_date=date.today()))
+    db.session.commit()
+    assert _version(student) == before
+
+    bump_data_version([profile.id])
+    db.session.commit()
+    assert _version(student) == before + 1
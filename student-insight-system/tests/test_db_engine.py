@@ -0,0 +1,98 @@
+"""Engine options, pool checkout metrics, statement timeouts and their 503 responses."""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+
+from core import db_engine
+from core.db_engine import InstrumentedQueuePool, engine_options, pool_metrics
+from core.query_stats import collect
+from services.academic_service import AcademicService
+
+
+def _config(uri, **overrides):
+    config = {
+        "SQLALCHEMY_DATABASE_URI": uri, "DB_POOL_SIZE": 5, "DB_MAX_OVERFLOW": 2, "DB_POOL_TIMEOUT": 3.0,
+        "DB_POOL_RECYCLE": 600, "DB_POOL_PRE_PING": True,
+        "DB_STATEMENT_TIMEOUT_MS": 15000, "DB_IDLE_IN_TRANSACTION_TIMEOUT_MS": 0,
+    }
+    config.update(overrides)
+    return config
+
+
+def test_postgres_gets_pool_and_session_timeouts():
+    options = engine_options(_config("postgresql://u:p@db/app"))
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert (options["pool_size"], options["max_overflow"], options["pool_timeout"]) == (5, 2, 3.0)
+    assert options["pool_recycle"] == 600 and options["pool_pre_ping"] is True
+    assert options["connect_args"] == {"options": "-c statement_timeout=15000"}
+
+
+def test_explicit_engine_options_win_and_sqlite_keeps_defaults():
+    options = engine_options(_config("postgresql://db/app", SQLALCHEMY_ENGINE_OPTIONS={"pool_size": 50}))
+    assert options["pool_size"] == 50
+
+    assert engine_options(_config("sqlite:///:memory:")) == {}
+
+
+@pytest.fixture
+def tiny_pool(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+                           pool_size=1, max_overflow=0, pool_timeout=0.05)
+    pool_metrics.reset()
+    yield engine
+    engine.dispose()
+
+
+def test_exhausted_pool_is_counted_and_logged(tiny_pool, caplog):
+    held = tiny_pool.connect()
+    with caplog.at_level(logging.WARNING, logger="core.db_engine"), collect() as stats:
+        with pytest.raises(PoolTimeoutError):
+            tiny_pool.connect()
+    held.close()
+    tiny_pool.connect().close()
+
+    snapshot = pool_metrics.snapshot(tiny_pool.pool)
+    assert snapshot["timeouts"] == 1 and snapshot["checkouts"] == 2
+    assert snapshot["wait_ms_max"] >= 50 and snapshot["checked_out"] == 0
+    assert stats.pool_wait_ms >= 50
+    assert any("DB pool exhausted" in r.getMessage() for r in caplog.records)
+
+
+def test_statement_timeout_override_sets_local_limit_on_postgres(app):
+    executed = []
+    connection = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"), exec_driver_sql=executed.append)
+
+    with app.app_context(), db_engine.statement_timeout(0):
+        db_engine._apply_statement_timeout(None, None, connection)
+    db_engine._apply_statement_timeout(None, None, connection)
+
+    assert executed == ["SET LOCAL statement_timeout = 0"]
+
+
+def test_pool_timeout_is_a_503(client, login_as, monkeypatch):
+    login_as("student")
+    monkeypatch.setattr(AcademicService, "get_goals_grades_data",
+                        lambda *a: (_ for _ in ()).throw(PoolTimeoutError("QueuePool limit reached")))
+
+    resp = client.get("/api/gg/state")
+
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "5"
+    assert "busy" in resp.get_json()["error"]
+
+
+def test_statement_timeout_is_a_503(client, login_as, monkeypatch):
+    login_as("student")
+    cancelled = OperationalError("SELECT ...", {}, SimpleNamespace(pgcode=db_engine.QUERY_CANCELED))
+    monkeypatch.setattr(AcademicService, "get_goals_grades_data",
+                        lambda *a: (_ for _ in ()).throw(cancelled))
+
+    resp = client.get("/api/gg/state")
+
+    assert resp.status_code == 503
+    assert "too long" in resp.get_json()["error"]
@@ -0,0 +1,136 @@
+"""Read-replica routing against two SQLite databases: the in-memory primary and a file replica."""
+
+import json
+import logging
+import sqlite3
+import time
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from core.db_routing import STICKY_COOKIE, replica_reads
+from core.extensions import db
+from models import StudentDashboardSnapshot, StudentProfile, TeacherProfile
+from services.auth_service import AuthService
+from services.dashboard_service import DashboardService
+
+
+@pytest.fixture
+def replica(app, db_session, tmp_path, monkeypatch):
+    """A replica bind, plus ``sync()`` to copy the primary into it (replication)."""
+    path = tmp_path / "replica.db"
+    engine = create_engine(f"sqlite:///{path}")
+    monkeypatch.setitem(db.engines, "replica", engine)
+
+    def sync():
+        db.session.commit()
+        engine.dispose()
+        target = sqlite3.connect(path)
+        db.engine.raw_connection().driver_connection.backup(target)
+        target.close()
+        db.session.expire_all()
+
+    def execute(sql, **params):
+        with engine.begin() as conn:
+            conn.execute(text(sql), params)
+        db.session.expire_all()
+
+    engine.sync, engine.execute_sql = sync, execute
+    yield engine
+    engine.dispose()
+
+
+def _primary_name(table, user_id):
+    with db.engine.connect() as conn:
+        return conn.execute(text(f"SELECT full_name FROM {table} WHERE user_id = :u"), {"u": user_id}).scalar()
+
+
+def test_selects_in_a_replica_block_read_the_replica_and_writes_go_to_primary(replica):
+    AuthService.register_user("Primary Name", "s@example.com", "password123", "student")
+    replica.sync()
+    replica.execute_sql("UPDATE student_profile SET full_name = 'Replica Name'")
+
+    with replica_reads():
+        profile = StudentProfile.query.one()
+        assert profile.full_name == "Replica Name"
+        profile.full_name = "Edited"
+        db.session.commit()
+
+    assert _primary_name("student_profile", profile.user_id) == "Edited"
+    assert StudentProfile.query.one().full_name == "Edited"  # outside the block: primary
+
+
+def test_no_replica_means_primary(db_session):
+    AuthService.register_user("Only", "o@example.com", "password123", "student")
+    with replica_reads():
+        assert StudentProfile.query.one().full_name == "Only"
+
+
+def test_teacher_dashboard_reads_the_replica(client, login_as, replica):
+    teacher = login_as("teacher", name="Primary Teacher")
+    replica.sync()
+    replica.execute_sql("UPDATE teacher_profile SET full_name = 'Replica Teacher'")
+
+    assert b"Hello, Replica Teacher" in client.get("/teacher/dashboard").data
+
+    # Sticky window after a write: the same browser reads the primary.
+    client.set_cookie(STICKY_COOKIE, str(int(time.time()) + 10))
+    assert b"Hello, Primary Teacher" in client.get("/teacher/dashboard").data
+    assert TeacherProfile.query.filter_by(user_id=teacher.id).one().full_name == "Primary Teacher"
+
+
+def test_only_writing_requests_start_the_sticky_window(client, login_as, replica):
+    login_as("student")
+
+    read = client.get("/api/gg/state")
+    assert STICKY_COOKIE not in read.headers.get("Set-Cookie", "")
+
+    write = client.post("/api/gg/target-cgpa", json={"target_cgpa": 3.7})
+    assert write.status_code == 200
+    cookie = next(c for c in write.headers.getlist("Set-Cookie") if c.startswith(STICKY_COOKIE))
+    until = int(cookie.split(";")[0].split("=")[1])
+    assert time.time() < until <= time.time() + 11
+
+
+def _snapshot_payload():
+    with db.engine.connect() as conn:
+        return json.loads(conn.execute(text("SELECT payload FROM student_dashboard_snapshot")).scalar())
+
+
+@pytest.mark.parametrize("replica_row", ["stale", "missing"])
+def test_lagging_replica_snapshot_never_overwrites_the_fresh_primary(replica, replica_row, caplog):
+    AuthService.register_user("Snap", "snap@example.com", "password123", "student")
+    profile = StudentProfile.query.one()
+    db.session.add(StudentDashboardSnapshot(student_id=profile.id, payload='{"built": "old"}',
+                                            is_stale=True, built_for_date=date.today()))
+    replica.sync()
+    if replica_row == "missing":
+        replica.execute_sql("DELETE FROM student_dashboard_snapshot")
+    # The recalc worker refreshes the snapshot on the primary; the replica lags.
+    snapshot = db.session.get(StudentDashboardSnapshot, profile.id)
+    snapshot.payload, snapshot.is_stale = '{"built": "fresh"}', False
+    db.session.commit()
+
+    with caplog.at_level(logging.ERROR, logger="services.dashboard_service"):
+        data = DashboardService.get_dashboard_data(profile.user_id)
+
+    assert data == {"built": "fresh"}
+    assert _snapshot_payload() == {"built": "fresh"}
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
+def test_snapshot_rebuilt_from_a_replica_read_is_built_from_the_primary(replica):
+    AuthService.register_user("Primary Name", "rebuild@example.com", "password123", "student")
+    profile = StudentProfile.query.one()
+    replica.sync()
+    replica.execute_sql("UPDATE student_profile SET current_cgpa = 1.0")
+    db.session.query(StudentProfile).update({"current_cgpa": 3.5})
+    db.session.commit()
+    user_id = profile.user_id
+    db.session.expunge_all()  # a new request starts with an empty session
+
+    data = DashboardService.get_dashboard_data(user_id)
+
+    assert data["cgpa"] == 3.5
+    assert _snapshot_payload()["cgpa"] == 3.5
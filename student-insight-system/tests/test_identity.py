@@ -0,0 +1,79 @@
+"""Request-scoped profile resolution: one profile lookup per request."""
+
+import re
+
+import pytest
+from sqlalchemy import event
+
+from core.extensions import db
+from core.identity import load_student
+from models import StudentProfile
+from services.academic_service import AcademicService
+
+PROFILE_LOOKUP = re.compile(r"FROM (student|teacher)_profile\s+WHERE \1_profile\.user_id = \?")
+
+
+@pytest.fixture
+def profile_lookups(app):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if PROFILE_LOOKUP.search(statement):
+            statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_add_grade_resolves_the_student_once(client, login_as, profile_lookups):
+    login_as("student", name="Student")
+
+    resp = client.post("/api/gg/grade/add", json={
+        "course_name": "Algorithms", "course_type": "Core",
+        "credit_value": 3, "semester": 1, "grade": "A",
+    })
+
+    assert resp.status_code == 200
+    assert resp.get_json()["new_cgpa"] == 4.0
+    assert len(profile_lookups) == 1
+
+
+@pytest.mark.parametrize("path", ["/api/gg/state", "/api/student/notifications", "/api/skills/history"])
+def test_student_endpoints_look_the_profile_up_once(client, login_as, profile_lookups, path):
+    login_as("student", name="Student")
+
+    assert client.get(path).status_code == 200
+    assert len(profile_lookups) == 1
+
+
+def test_teacher_endpoint_looks_the_profile_up_once(client, login_as, profile_lookups):
+    login_as("teacher", name="Teacher")
+
+    assert client.get("/api/teacher/students").status_code == 200
+    assert len(profile_lookups) == 1
+
+
+def test_cache_does_not_leak_between_requests(client, login_as):
+    first = login_as("student", name="First")
+    client.post("/api/gg/target-cgpa", json={"target_cgpa": 3.5})
+    second = login_as("student", name="Second")
+    client.post("/api/gg/target-cgpa", json={"target_cgpa": 2.5})
+
+    # The client's app context outlives both requests; each saw its own user.
+    assert StudentProfile.query.filter_by(user_id=first.id).one().target_cgpa == 3.5
+    assert StudentProfile.query.filter_by(user_id=second.id).one().target_cgpa == 2.5
+    assert client.get("/api/gg/state").get_json()["target_cgpa"] == 2.5
+
+
+def test_services_accept_a_resolved_profile(client, login_as, profile_lookups):
+    user = login_as("student", name="Student")
+    student = StudentProfile.query.filter_by(user_id=user.id).one()
+    profile_lookups.clear()
+
+    AcademicService.save_target_cgpa(student, 3.9)
+
+    assert load_student(student) is student
+    assert student.target_cgpa == 3.9
+    assert profile_lookups == []
@@ -0,0 +1,63 @@
+"""Worker startup must not import the heavy numeric / AI packages."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from core.preload import preload_modules
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy packages that must only be imported on first use.
+LAZY_PACKAGES = ("numpy", "scipy", "sklearn", "google.generativeai", "grpc")
+
+# Generous ceiling for ``create_app`` imports (about 0.9 s on a dev laptop
+# today; pulling numpy + sklearn back in roughly doubles it).
+STARTUP_BUDGET_US = 3_000_000
+
+
+def _importtime(code, env_overrides=None):
+    env = dict(os.environ, **(env_overrides or {}))
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    modules, top_level_us = {}, 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+            if len(name) - len(name.lstrip()) == 1:
+                top_level_us += int(cumulative)
+    return modules, top_level_us
+
+
+@pytest.fixture(scope="module")
+def startup_imports():
+    return _importtime(
+        "from app import create_app; create_app('testing')",
+        {"PRELOAD_HEAVY_MODULES": "false"},
+    )
+
+
+def test_startup_does_not_import_heavy_packages(startup_imports):
+    modules, _ = startup_imports
+    loaded = [m for m in modules if m.split(".")[0] in LAZY_PACKAGES
+              or m.startswith("google.generativeai")]
+    assert loaded == []
+
+
+def test_startup_import_time_budget(startup_imports):
+    _, total = startup_imports
+    assert total < STARTUP_BUDGET_US, f"create_app imports took {total / 1e6:.2f}s"
+
+
+def test_preload_skips_missing_modules():
+    preload_modules(["json", "no_such_module_for_preload"])
+    assert "json" in sys.modules
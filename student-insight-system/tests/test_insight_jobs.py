@@ -0,0 +1,91 @@
+"""Background insight-report jobs and the polling endpoint."""
+
+import threading
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+from core.errors import ExternalServiceError
+from core.extensions import ai_worker_pool, db, worker_pool
+from core.workers import WorkerPool
+from infrastructure.ai.mock_service import MockAIService
+from models import InsightJob, StudentInsight
+
+
+class FailingAI(MockAIService):
+    def generate_text(self, prompt):
+        raise ExternalServiceError("AI service unavailable: quota exceeded")
+
+
+def test_post_returns_job_and_status_endpoint_serves_report(app, client, login_as, monkeypatch):
+    monkeypatch.setitem(app.config, "AI_SERVICE", MockAIService())
+    monkeypatch.setitem(app.config, "AI_CACHE_ENABLED", False)
+    login_as("student")
+
+    resp = client.post("/student/insight-report", data={"department": "CSE"})
+    assert resp.status_code == 202
+    body = resp.get_json()
+    assert body["job_id"] and body["status_url"].endswith(body["job_id"])
+
+    status = client.get(body["status_url"]).get_json()
+    assert status["status"] == "succeeded"
+    assert "Mock Insight Report" in status["report"]
+    assert StudentInsight.query.count() == 1
+    assert db.session.get(InsightJob, body["job_id"]).insight_id is not None
+
+
+def test_failed_generation_is_reported(app, client, login_as, monkeypatch):
+    monkeypatch.setitem(app.config, "AI_SERVICE", FailingAI())
+    monkeypatch.setitem(app.config, "AI_CACHE_ENABLED", False)
+    login_as("student")
+
+    job_id = client.post("/student/insight-report", data={}).get_json()["job_id"]
+    status = client.get(f"/api/insight-jobs/{job_id}").get_json()
+
+    assert status["status"] == "failed"
+    assert "quota exceeded" in status["error"]
+    assert StudentInsight.query.count() == 0
+
+
+def test_jobs_are_private_and_abandoned_jobs_time_out(app, client, login_as):
+    owner = login_as("student")
+    job = InsightJob(id="a" * 32, student_id=owner.student_profile.id, form_data="{}",
+                     created_at=datetime.utcnow() - timedelta(hours=1))
+    db.session.add(job)
+    db.session.commit()
+
+    assert client.get(f"/api/insight-jobs/{job.id}").get_json()["status"] == "failed"
+
+    login_as("student")
+    assert client.get(f"/api/insight-jobs/{job.id}").status_code == 404
+
+
+def test_insight_jobs_run_on_the_ai_pool(app, client, login_as, monkeypatch):
+    monkeypatch.setitem(app.config, "AI_SERVICE", MockAIService())
+    monkeypatch.setitem(app.config, "AI_CACHE_ENABLED", False)
+    submitted = []
+    real_submit = ai_worker_pool.submit
+    monkeypatch.setattr(ai_worker_pool, "submit", lambda fn, *a: submitted.append(fn) or real_submit(fn, *a))
+    monkeypatch.setattr(worker_pool, "submit", lambda *a: (_ for _ in ()).throw(AssertionError("shared pool")))
+    login_as("student")
+
+    job_id = client.post("/student/insight-report", data={}).get_json()["job_id"]
+
+    assert [fn.__name__ for fn in submitted] == ["run_insight_job"]
+    assert client.get(f"/api/insight-jobs/{job_id}").get_json()["status"] == "succeeded"
+
+
+def test_busy_ai_pool_leaves_the_worker_pool_free():
+    app = Flask(__name__)
+    app.config.update(WORKER_POOL_SIZE=1, AI_WORKER_POOL_SIZE=1)
+    workers = WorkerPool(app)
+    ai_workers = WorkerPool(app, name="ai_worker", size_setting="AI_WORKER_POOL_SIZE")
+    release = threading.Event()
+    try:
+        slow = [ai_workers.submit(release.wait, 5) for _ in range(3)]
+        assert workers.submit(lambda: "recalculated").result(timeout=2) == "recalculated"
+        assert not any(f.done() for f in slow)
+    finally:
+        release.set()
+        ai_workers.shutdown()
+        workers.shutdown()
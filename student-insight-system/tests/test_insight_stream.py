@@ -0,0 +1,66 @@
+"""Server-Sent Events delivery of insight reports."""
+
+import json
+
+from core.errors import ExternalServiceError
+from infrastructure.ai.mock_service import MockAIService
+from models import StudentInsight
+
+
+def _events(resp):
+    events = []
+    for block in resp.get_data(as_text=True).strip().split("\n\n"):
+        name, data = "message", None
+        for line in block.split("\n"):
+            if line.startswith("event: "):
+                name = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        events.append((name, data))
+    return events
+
+
+def test_stream_forwards_chunks_and_saves_report(app, client, login_as, monkeypatch):
+    ai = MockAIService()
+    monkeypatch.setitem(app.config, "AI_SERVICE", ai)
+    monkeypatch.setitem(app.config, "AI_CACHE_ENABLED", False)
+    login_as("student")
+
+    resp = client.get("/student/insight-report/stream?department=CSE&cgpa=3.2")
+    assert resp.mimetype == "text/event-stream"
+    events = _events(resp)
+
+    chunks = [data["chunk"] for name, data in events if name == "message"]
+    assert chunks == list(ai.generate_text_stream("")) and len(chunks) > 1
+    assert events[-1][0] == "done"
+    insight = StudentInsight.query.one()
+    assert events[-1][1] == {"insight_id": insight.id}
+    assert insight.content == "".join(chunks)
+
+
+def test_stream_reports_provider_failure(app, client, login_as, monkeypatch):
+    class Broken(MockAIService):
+        def generate_text_stream(self, prompt):
+            yield "<h3>"
+            raise ExternalServiceError("AI service unavailable: timeout")
+
+    monkeypatch.setitem(app.config, "AI_SERVICE", Broken())
+    monkeypatch.setitem(app.config, "AI_CACHE_ENABLED", False)
+    login_as("student")
+
+    events = _events(client.get("/student/insight-report/stream"))
+    assert events[0] == ("message", {"chunk": "<h3>"})
+    assert events[-1] == ("failed", {"error": "AI service unavailable: timeout"})
+    assert StudentInsight.query.count() == 0
+
+
+def test_cached_report_is_replayed_in_one_chunk(app, client, login_as, monkeypatch):
+    monkeypatch.setitem(app.config, "AI_SERVICE", MockAIService())
+    login_as("student")
+
+    first = _events(client.get("/student/insight-report/stream?cgpa=3.9"))
+    second = _events(client.get("/student/insight-report/stream?cgpa=3.9"))
+
+    assembled = "".join(d["chunk"] for n, d in first if n == "message")
+    assert [d["chunk"] for n, d in second if n == "message"] == [assembled]
+    assert StudentInsight.query.count() == 2
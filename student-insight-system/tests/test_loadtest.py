@@ -0,0 +1,97 @@
+"""loadtest/: stage parsing, saturation detection, a short live run, and the mock AI provider."""
+
+import threading
+import time
+
+import pytest
+from werkzeug.serving import make_server
+
+import seed
+from core.errors import ExternalServiceError
+from core.extensions import db
+from infrastructure.ai.mock_service import MockAIService
+from infrastructure.ai.registry import AIProviderRegistry
+from loadtest.runner import Accounts, LoadRunner, find_saturation, parse_ids, parse_stages
+
+
+def test_parse_stages_and_ids():
+    stages = parse_stages("10:30, 50:60.5")
+    assert [(s.users, s.seconds) for s in stages] == [(10, 30.0), (50, 60.5)]
+    assert parse_ids("1-3,7") == [1, 2, 3, 7]
+    with pytest.raises(ValueError):
+        parse_stages("10:0")
+
+
+def _stage(users, rps, error_rate=0.0):
+    return {"users": users, "rps": rps, "error_rate": error_rate, "requests": 100}
+
+
+def test_saturation_is_where_throughput_stops_growing():
+    stages = [_stage(10, 100), _stage(20, 190), _stage(40, 200), _stage(80, 150)]
+    assert find_saturation(stages) == {"peak": 1, "saturated": {"stage": 2, "users": 40, "reason": "throughput"}}
+
+    assert find_saturation(stages[:2]) == {"peak": 1, "saturated": None}
+    errors = [_stage(10, 100), _stage(20, 210, error_rate=0.05)]
+    assert find_saturation(errors)["saturated"] == {"stage": 1, "users": 20, "reason": "errors"}
+
+
+@pytest.fixture
+def live_server(app, db_session):
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_short_run_against_live_server(live_server):
+    args = seed.build_parser().parse_args(["--all", "--num-students", "4", "--weeks", "2", "--sessions-per-student", "3"])
+    with db.engine.connect() as connection:
+        seed.run(args, connection)
+    accounts = Accounts([f"student{i}@seed.example.edu" for i in range(1, 5)], ["teacher1@seed.example.edu"],
+                        "password123")
+    # One virtual user: the in-memory test database is a single shared connection.
+    runner = LoadRunner(live_server, "students", parse_stages("1:1"), accounts,
+                        ramp_seconds=0, think_seconds=0, seed=1, timeout=10)
+
+    report = runner.run()
+
+    stage = report["stages"][0]
+    assert stage["users"] == 1 and stage["requests"] > 5
+    assert stage["errors"] == 0, {name: row["statuses"] for name, row in stage["endpoints"].items()}
+    assert {"login", "student_dashboard", "gg_state"} <= set(stage["endpoints"])
+    assert report["saturation"] == {"peak": 0, "saturated": None}
+
+
+def test_mock_latency_and_failure_injection():
+    slow = MockAIService(latency_ms=30)
+    started = time.perf_counter()
+    slow.generate_text("x")
+    assert time.perf_counter() - started >= 0.03
+
+    always = MockAIService(failure_rate=1.0)
+    with pytest.raises(ExternalServiceError, match="injected"):
+        always.generate_json("x")
+    with pytest.raises(ExternalServiceError):
+        list(always.generate_text_stream("x"))
+
+    flaky = MockAIService(failure_rate=0.3, seed=7)
+    failures = 0
+    for _ in range(200):
+        try:
+            flaky.generate_text("x")
+        except ExternalServiceError:
+            failures += 1
+    assert 30 < failures < 90
+
+
+def test_mock_provider_reads_config(app, monkeypatch):
+    monkeypatch.setitem(app.config, "AI_SERVICE", None)
+    monkeypatch.setitem(app.config, "AI_PROVIDER", "mock")
+    monkeypatch.setitem(app.config, "AI_MOCK_LATENCY_MS", 5.0)
+    monkeypatch.setitem(app.config, "AI_MOCK_FAILURE_RATE", 0.25)
+
+    client = AIProviderRegistry(app).get().inner
+
+    assert (client.latency_ms, client.failure_rate) == (5.0, 0.25)
+    assert MockAIService().failure_rate == 0.0
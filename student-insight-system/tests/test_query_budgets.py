@@ -0,0 +1,235 @@
+"""
+Query budgets for hot paths.
+
+Each path is measured for a student with a handful of rows and again for
+one with many times more skills, goals, sessions, grades, results and
+weekly updates. The counts must be identical — a per-row query makes the
+larger student cost more and fails the test — and within the budget.
+Every measurement is taken on a second call, after process-wide caches
+(career matrix, search backend) are warm. Budgets are deliberately
+tight: raise one only together with the change that needs the extra
+query.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+
+from core.extensions import db
+from core.query_stats import collect
+from dashboard.recalculate import recalculate_weekly_update
+from services.dashboard_service import DashboardService
+from models import (
+    Assessment, AssessmentResult, Assignment, AssignmentSubmission, Attendance,
+    CareerPath, CareerRequiredSkill, CourseCatalog, Skill, StudentAcademicRecord,
+    StudentAlert, StudentGoal, StudentNote, StudentProfile, StudentSkill,
+    StudentSkillProgress, StudySession, TeacherAssignment, TeacherProfile,
+    WeeklyUpdate,
+)
+
+SMALL, LARGE = 3, 40
+CATALOG = 50  # skills, careers, courses and assessments shared by everyone
+
+BUDGETS = {
+    "student_dashboard": 10,
+    "student_dashboard_snapshot": 1,
+    "goals_grades_state": 7,
+    "teacher_dashboard": 12,
+    "teacher_student_detail": 22,
+    "recalculate_weekly_update": 19,
+}
+
+
+def _catalog(teacher_id):
+    db.session.execute(insert(Skill), [
+        {"id": i, "skill_name": f"Skill {i}", "department": "CSE"} for i in range(1, CATALOG + 1)
+    ])
+    db.session.execute(insert(CareerPath), [
+        {"id": i, "title": f"Career {i}", "field_category": "Tech"} for i in range(1, CATALOG + 1)
+    ])
+    db.session.execute(insert(CareerRequiredSkill), [
+        {"career_id": c, "skill_id": (c + k) % CATALOG + 1, "importance_level": "High"}
+        for c in range(1, CATALOG + 1) for k in range(4)
+    ])
+    db.session.execute(insert(CourseCatalog), [
+        {"id": i, "course_name": f"Course {i}", "course_type": ("Core", "GED")[i % 2],
+         "department": "CSE", "credit_value": 3}
+        for i in range(1, CATALOG + 1)
+    ])
+    db.session.execute(insert(Assessment), [
+        {"id": i, "title": f"Assessment {i}", "type": ("quiz", "exam")[i % 2],
+         "total_points": 100, "date": date(2026, 9, 1)}
+        for i in range(1, CATALOG + 1)
+    ])
+    db.session.execute(insert(Assignment), [
+        {"id": i, "title": f"Assignment {i}", "teacher_id": teacher_id, "total_points": 100}
+        for i in range(1, CATALOG + 1)
+    ])
+
+
+def _populate(student_id, teacher_id, n):
+    """Give a student ``n`` rows of every per-student kind."""
+    today = datetime.utcnow().date()
+    db.session.execute(insert(StudentSkill), [
+        {"student_id": student_id, "skill_id": k + 1, "skill_name": f"Skill {k + 1}",
+         "proficiency_score": 10 + k % 90, "risk_score": 0.1}
+        for k in range(n)
+    ])
+    skill_ids = [s.id for s in StudentSkill.query.filter_by(student_id=student_id)]
+    db.session.execute(insert(StudentSkillProgress), [
+        {"student_skill_id": sid, "date": today - timedelta(days=d), "proficiency_score": 40 + d}
+        for sid in skill_ids for d in range(2)
+    ])
+    db.session.execute(insert(StudentGoal), [
+        {"student_id": student_id, "career_id": k + 1, "goal_type": "Long Term", "is_primary": k == 0}
+        for k in range(n)
+    ])
+    db.session.execute(insert(StudySession), [
+        {"student_id": student_id, "date": today - timedelta(days=k % 10),
+         "duration_minutes": 30 + k, "topic_studied": "Revision", "related_skill": f"Skill {k % n + 1}"}
+        for k in range(n)
+    ])
+    db.session.execute(insert(WeeklyUpdate), [
+        {"student_id": student_id, "week_start_date": today - timedelta(days=today.weekday() + 7 * (k + 1)),
+         "total_hours_studied": 5 + k % 7, "productivity_rating": 3, "mood_score": 3,
+         "burnout_risk_score": 0.3, "consistency_score": 0.5}
+        for k in range(n)
+    ])
+    db.session.execute(insert(StudentAcademicRecord), [
+        {"student_id": student_id, "course_id": k + 1, "grade": "B+", "grade_point": 3.3,
+         "semester_taken": k % 8 + 1}
+        for k in range(n)
+    ])
+    db.session.execute(insert(AssessmentResult), [
+        {"student_id": student_id, "assessment_id": k + 1, "score": 60 + k % 40, "percentage": 60 + k % 40}
+        for k in range(n)
+    ])
+    db.session.execute(insert(AssignmentSubmission), [
+        {"student_id": student_id, "assignment_id": k + 1, "score": 70, "status": "submitted",
+         "submitted_at": datetime(2026, 9, 1) + timedelta(days=k)}
+        for k in range(n)
+    ])
+    db.session.execute(insert(Attendance), [
+        {"student_id": student_id, "date": today - timedelta(days=k), "status": ("present", "absent")[k % 4 == 0]}
+        for k in range(n)
+    ])
+    db.session.execute(insert(StudentAlert), [
+        {"student_id": student_id, "type": f"rule{k}", "severity": "warning", "message": "m",
+         "created_at": datetime(2026, 9, 1) + timedelta(hours=k)}
+        for k in range(n)
+    ])
+    db.session.execute(insert(StudentNote), [
+        {"student_id": student_id, "teacher_id": teacher_id, "content": f"Note {k}", "is_private": False,
+         "created_at": datetime.utcnow() - timedelta(days=k)}
+        for k in range(n)
+    ])
+    db.session.execute(insert(TeacherAssignment), [{"teacher_id": teacher_id, "student_id": student_id}])
+    db.session.query(StudentProfile).filter_by(id=student_id).update(
+        {"department": "CSE", "current_cgpa": 3.3, "target_cgpa": 3.6}
+    )
+
+
+@pytest.fixture
+def dataset(client, login_as):
+    """A teacher with one small and one large student, logged in as needed."""
+    teacher_user = login_as("teacher", name="Teacher")
+    teacher = TeacherProfile.query.filter_by(user_id=teacher_user.id).one()
+    _catalog(teacher.id)
+
+    students = {}
+    for size in (SMALL, LARGE):
+        user = login_as("student", name=f"Student {size}")
+        profile = StudentProfile.query.filter_by(user_id=user.id).one()
+        _populate(profile.id, teacher.id, size)
+        students[size] = (user, profile.id)
+    db.session.commit()
+
+    def as_student(size):
+        user, _ = students[size]
+        _login_as_existing(client, user)
+        return students[size][1]
+
+    def as_teacher():
+        _login_as_existing(client, teacher_user)
+
+    return as_student, as_teacher, {size: sid for size, (_, sid) in students.items()}
+
+
+def _login_as_existing(client, user):
+    token = create_access_token(identity=str(user.id), additional_claims={"role": user.role})
+    client.set_cookie("access_token_cookie", token)
+
+
+def _request_queries(client, path, warm=True):
+    if warm:
+        client.get(path)
+    resp = client.get(path)
+    assert resp.status_code == 200, (path, resp.status_code)
+    match = re.search(r'desc="(\d+) queries"', resp.headers["Server-Timing"])
+    return int(match.group(1))
+
+
+def _assert_budget(name, counts):
+    small, large = counts[SMALL], counts[LARGE]
+    assert small == large, f"{name}: {small} queries with {SMALL} rows, {large} with {LARGE} — per-row query?"
+    assert large <= BUDGETS[name], f"{name}: {large} queries, budget {BUDGETS[name]}"
+
+
+def test_student_dashboard(client, dataset):
+    as_student, _, _ = dataset
+    live, cached = {}, {}
+    for size in (SMALL, LARGE):
+        student_id = as_student(size)
+        cached[size] = _request_queries(client, "/student/dashboard")
+        DashboardService.invalidate_snapshot(student_id)
+        db.session.commit()
+        live[size] = _request_queries(client, "/student/dashboard", warm=False)
+    _assert_budget("student_dashboard", live)
+    _assert_budget("student_dashboard_snapshot", cached)
+
+
+def test_goals_grades_state(client, dataset):
+    as_student, _, _ = dataset
+    counts = {}
+    for size in (SMALL, LARGE):
+        as_student(size)
+        counts[size] = _request_queries(client, "/api/gg/state")
+    _assert_budget("goals_grades_state", counts)
+
+
+def test_teacher_dashboard(client, dataset):
+    _, as_teacher, _ = dataset
+    as_teacher()
+    counts = {}
+    # The teacher's cohort grows: the large measurement adds more students.
+    counts[SMALL] = _request_queries(client, "/teacher/dashboard")
+    extra = [StudentProfile(user_id=10_000 + k, full_name=f"Extra {k}") for k in range(LARGE)]
+    db.session.add_all(extra)
+    db.session.flush()
+    for profile in extra:
+        _populate(profile.id, TeacherProfile.query.one().id, SMALL)
+    db.session.commit()
+    counts[LARGE] = _request_queries(client, "/teacher/dashboard")
+    _assert_budget("teacher_dashboard", counts)
+
+
+def test_teacher_student_detail(client, dataset):
+    _, as_teacher, student_ids = dataset
+    as_teacher()
+    counts = {size: _request_queries(client, f"/teacher/student/{sid}") for size, sid in student_ids.items()}
+    _assert_budget("teacher_student_detail", counts)
+
+
+def test_recalculate_weekly_update(dataset):
+    _, _, student_ids = dataset
+    counts = {}
+    for size, sid in student_ids.items():
+        recalculate_weekly_update(sid)
+        db.session.expire_all()
+        with collect() as stats:
+            recalculate_weekly_update(sid)
+        counts[size] = stats.count
+    _assert_budget("recalculate_weekly_update", counts)
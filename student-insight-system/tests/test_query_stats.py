@@ -0,0 +1,64 @@
+"""Per-request SQL counters, Server-Timing and N+1 detection."""
+
+import logging
+import re
+
+from core.extensions import db
+from core.query_stats import collect, fingerprint
+from models import User
+
+
+def test_fingerprint_ignores_values_and_in_list_length():
+    a = fingerprint("SELECT * FROM user\n WHERE id = 7 AND email = 'a@b.c' LIMIT 1")
+    b = fingerprint("SELECT *  FROM user WHERE id = 12 AND email = 'o''brien@x.y' LIMIT 1")
+    assert a == b == "SELECT * FROM user WHERE id = ? AND email = ? LIMIT ?"
+    assert fingerprint("SELECT a FROM t WHERE t.id IN (?, ?, ?)") == \
+        fingerprint("SELECT a FROM t WHERE t.id IN (?)")
+    assert fingerprint("SELECT anon_1.x FROM t_2") == "SELECT anon_1.x FROM t_2"
+
+
+def test_loop_of_single_row_loads_is_flagged_with_call_site(db_session):
+    for n in range(6):
+        db.session.add(User(email=f"n{n}@example.com", password_hash="x", role="student"))
+    db.session.commit()
+    ids = [u.id for u in User.query.all()]
+    db.session.expire_all()
+
+    with collect(repeat_threshold=5) as stats:
+        for user_id in ids:
+            User.query.filter_by(id=user_id).first()
+
+    assert stats.count == 6
+    [(fp, count, site)] = stats.repeated()
+    assert count == 6 and "FROM user" in fp
+    assert site.startswith("tests/test_query_stats.py:")
+
+
+def test_in_lists_of_any_length_share_a_fingerprint(db_session):
+    with collect(repeat_threshold=2) as stats:
+        User.query.filter(User.id.in_([1, 2, 3])).all()
+        User.query.filter(User.id.in_([4, 5])).all()
+
+    assert stats.count == 2
+    assert [n for _, n, _ in stats.repeated()] == [2]
+
+
+def test_request_reports_server_timing_and_logs(client, login_as, caplog):
+    login_as("student", name="Student")
+
+    with caplog.at_level(logging.INFO, logger="core.query_stats"):
+        resp = client.get("/api/gg/state", headers={"X-Request-ID": "req-42"})
+
+    timing = resp.headers["Server-Timing"]
+    match = re.fullmatch(r'db;dur=([\d.]+);desc="(\d+) queries"', timing)
+    assert match and int(match.group(2)) > 0
+    summary = [r for r in caplog.records if r.getMessage().startswith("sql queries=")]
+    assert summary and f"queries={match.group(2)} " in summary[-1].getMessage()
+    assert "path=/api/gg/state" in summary[-1].getMessage()
+
+
+def test_statements_outside_a_request_are_not_recorded(db_session):
+    with collect() as stats:
+        pass
+    User.query.all()
+    assert stats.count == 0
@@ -0,0 +1,46 @@
+"""Coalescing recalculation queue."""
+
+from datetime import datetime, timedelta
+
+from models import RecalcJob, WeeklyUpdate
+from services.recalc_queue import recalc_queue
+
+
+def test_burst_of_edits_coalesces_into_one_job(client, login_as):
+    user = login_as("student")
+    for i in range(5):
+        client.post("/api/gg/grade/add", json={
+            "course_name": f"Course {i}", "semester": 1, "grade": "B",
+        })
+
+    assert recalc_queue.pending_count() == 1
+    assert WeeklyUpdate.query.count() == 0
+
+    assert recalc_queue.flush() == 1
+    assert recalc_queue.pending_count() == 0
+
+    update = WeeklyUpdate.query.filter_by(student_id=user.student_profile.id).one()
+    assert update.status_label is not None
+
+
+def test_job_is_kept_when_edit_arrives_during_processing(client, login_as, monkeypatch):
+    user = login_as("student")
+    client.post("/api/gg/target-cgpa", json={"target_cgpa": 3.8})
+    student_id = user.student_profile.id
+
+    import dashboard.recalculate as recalc_module
+    original = recalc_module.recalculate_weekly_update
+
+    def edit_midway(sid):
+        result = original(sid)
+        job = RecalcJob.query.get(sid)
+        job.requested_at = datetime.utcnow() + timedelta(seconds=1)
+        from core.extensions import db
+        db.session.commit()
+        return result
+
+    monkeypatch.setattr(recalc_module, "recalculate_weekly_update", edit_midway)
+    recalc_queue.flush()
+
+    job = RecalcJob.query.get(student_id)
+    assert job is not None and job.claimed_at is None
@@ -0,0 +1,116 @@
+"""Cohort-wide recalculation must agree with the per-student engine."""
+
+import random
+from datetime import datetime, timedelta
+
+from core.extensions import db
+from dashboard.recalculate import recalculate_weekly_update
+from dashboard.recalculate_batch import recalculate_all_weekly_updates
+from models import (
+    User, StudentProfile, StudySession, WeeklyUpdate, CourseCatalog,
+    StudentAcademicRecord, Skill, StudentSkill, CareerPath, CareerRequiredSkill,
+    StudentGoal,
+)
+
+SYSTEM_FIELDS = (
+    "total_hours_studied", "consistency_score", "burnout_risk_score",
+    "goal_achievability_prob", "status_label",
+)
+
+
+def _build_cohort(size=12, seed=7):
+    rng = random.Random(seed)
+    today = datetime.utcnow().date()
+    week_start = today - timedelta(days=today.weekday())
+
+    skills = [Skill(skill_name=name) for name in ("Python", "SQL", "Statistics", "Docker")]
+    career = CareerPath(title="Data Scientist")
+    db.session.add_all(skills + [career])
+    db.session.flush()
+    for skill in skills[:3]:
+        db.session.add(CareerRequiredSkill(career_id=career.id, skill_id=skill.id))
+    courses = [
+        CourseCatalog(course_name=f"C{i}", course_type=kind, credit_value=credits)
+        for i, (kind, credits) in enumerate([("Core", 3), ("Elective", 2), ("GED", None), (None, 4)])
+    ]
+    db.session.add_all(courses)
+    db.session.flush()
+
+    for n in range(size):
+        user = User(email=f"s{n}@example.com", password_hash="x", role="student")
+        db.session.add(user)
+        db.session.flush()
+        student = StudentProfile(
+            user_id=user.id, full_name=f"Student {n}",
+            current_cgpa=rng.choice([None, 2.4, 3.1, 3.9]),
+            target_cgpa=rng.choice([None, 3.0, 3.7]),
+        )
+        db.session.add(student)
+        db.session.flush()
+
+        for _ in range(rng.randint(0, 15)):
+            db.session.add(StudySession(
+                student_id=student.id,
+                date=today - timedelta(days=rng.randint(0, 35)),
+                duration_minutes=rng.randint(0, 240),
+            ))
+        for course in rng.sample(courses, rng.randint(0, len(courses))):
+            db.session.add(StudentAcademicRecord(
+                student_id=student.id, course_id=course.id,
+                grade_point=rng.choice([None, 2.0, 3.33, 4.0]),
+            ))
+        if n % 3:
+            db.session.add(StudentGoal(student_id=student.id, career_id=career.id, is_primary=True))
+            for skill in rng.sample(skills, rng.randint(0, len(skills))):
+                db.session.add(StudentSkill(
+                    student_id=student.id, skill_name=f" {skill.skill_name.lower()} ",
+                    proficiency_score=rng.randint(0, 100),
+                ))
+        if n % 2:
+            db.session.add(WeeklyUpdate(
+                student_id=student.id, week_start_date=week_start,
+                productivity_rating=rng.randint(1, 5), mood_score=rng.randint(1, 5),
+                difficulty_rating=rng.choice(["Easy", "Medium", "Hard"]),
+            ))
+    db.session.commit()
+
+
+def _system_values():
+    return {
+        u.student_id: tuple(getattr(u, f) for f in SYSTEM_FIELDS)
+        for u in WeeklyUpdate.query.all()
+    }
+
+
+def test_batch_matches_per_student_recalculation(db_session):
+    _build_cohort()
+
+    for (student_id,) in db.session.query(StudentProfile.id).all():
+        recalculate_weekly_update(student_id)
+    expected = _system_values()
+
+    WeeklyUpdate.query.filter(WeeklyUpdate.productivity_rating.is_(None)).delete()
+    WeeklyUpdate.query.update({f: None for f in SYSTEM_FIELDS})
+    db.session.commit()
+
+    summary = recalculate_all_weekly_updates()
+    db.session.expire_all()
+
+    assert summary["students"] == 12
+    assert summary["updated"] == 6 and summary["inserted"] == 6
+    assert _system_values() == expected
+
+
+def test_batch_preserves_check_in_fields_and_is_idempotent(db_session):
+    _build_cohort(size=4)
+    recalculate_all_weekly_updates()
+    first = _system_values()
+    ratings = {u.id: (u.productivity_rating, u.mood_score) for u in WeeklyUpdate.query.all()}
+
+    summary = recalculate_all_weekly_updates()
+    db.session.expire_all()
+
+    assert summary["inserted"] == 0
+    assert WeeklyUpdate.query.count() == 4
+    assert _system_values() == first
+    assert {u.id: (u.productivity_rating, u.mood_score) for u in WeeklyUpdate.query.all()} == ratings
@@ -0,0 +1,68 @@
+"""Content-hashed static assets: the build, fingerprinted URLs and immutable, precompressed responses."""
+
+import gzip
+import json
+
+import pytest
+from flask import url_for
+
+from core.static_assets import MANIFEST_NAME, build_assets, static_assets
+
+
+def test_build_fingerprints_by_content_and_skips_uploads(tmp_path):
+    source, out = tmp_path / "static", tmp_path / "dist"
+    (source / "css").mkdir(parents=True)
+    (source / "uploads").mkdir()
+    (source / "css" / "site.css").write_text("body { color: red; }\n" * 50)
+    (source / "logo.png").write_bytes(b"\x89PNG" + bytes(200))
+    (source / "uploads" / "me.png").write_bytes(b"avatar")
+
+    manifest = build_assets(source, out)
+
+    hashed = manifest["assets"]["css/site.css"]
+    assert hashed.startswith("css/site.") and hashed.endswith(".css") and hashed != "css/site.css"
+    assert set(manifest["assets"]) == {"css/site.css", "logo.png"}
+    assert "gzip" in manifest["encodings"][hashed] and manifest["assets"]["logo.png"] not in manifest["encodings"]
+    assert gzip.decompress((out / (hashed + ".gz")).read_bytes()) == (source / "css" / "site.css").read_bytes()
+    assert json.loads((out / MANIFEST_NAME).read_text()) == manifest
+
+    (source / "css" / "site.css").write_text("body { color: blue; }\n")
+    assert build_assets(source, out)["assets"]["css/site.css"] != hashed
+    assert (out / hashed).exists()  # the previous release's URL keeps working
+
+
+@pytest.fixture
+def built(app, tmp_path):
+    saved = (static_assets.directory, static_assets.assets, static_assets.encodings)
+    manifest = build_assets(app.static_folder, tmp_path)
+    static_assets.load(str(tmp_path))
+    yield manifest
+    static_assets.directory, static_assets.assets, static_assets.encodings = saved
+
+
+def test_url_for_returns_the_fingerprinted_url(app, built):
+    with app.test_request_context():
+        assert url_for("static", filename="css/ui_alerts.css") == "/static/dist/" + built["assets"]["css/ui_alerts.css"]
+        assert url_for("static", filename="uploads/profile_pics/a.png") == "/static/uploads/profile_pics/a.png"
+
+
+def test_fingerprinted_assets_are_immutable_and_precompressed(client, built):
+    url = "/static/dist/" + built["assets"]["css/unified_styles.css"]
+
+    plain = client.get(url)
+    compressed = client.get(url, headers={"Accept-Encoding": "gzip, deflate"})
+
+    for resp in (plain, compressed):
+        assert resp.status_code == 200 and resp.mimetype == "text/css"
+        assert set(resp.headers["Cache-Control"].split(", ")) == {"public", "max-age=31536000", "immutable"}
+        assert "Accept-Encoding" in resp.headers["Vary"]
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.data) == plain.data
+    assert len(compressed.data) < len(plain.data)
+
+
+def test_pages_link_the_fingerprinted_files(client, built):
+    page = client.get("/").get_data(as_text=True)
+    assert "/static/dist/" + built["assets"]["css/ui_alerts.css"] in page
+    assert "/static/css/ui_alerts.css" not in page
@@ -0,0 +1,120 @@
+"""/api/teacher/students: SQL-side sorting, keyset pages and sparse fieldsets."""
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from core.extensions import db
+from models import StudentProfile, TeacherAssignment, TeacherProfile, User, WeeklyUpdate
+
+
+def _cohort(login_as, size=23, seed=5):
+    rng = random.Random(seed)
+    user = login_as("teacher", name="Teacher")
+    teacher = TeacherProfile.query.filter_by(user_id=user.id).one()
+    for n in range(size):
+        u = User(email=f"list{n}@example.com", password_hash="x", role="student")
+        db.session.add(u)
+        db.session.flush()
+        s = StudentProfile(
+            user_id=u.id, full_name=f"{rng.choice('ABCDE')}student {n}",
+            current_cgpa=rng.choice([None, 2.0, 2.75, 3.2, 3.9]),
+            last_activity=rng.choice([None, datetime(2026, 10, 1) + timedelta(hours=n)]),
+            section=rng.choice(["A", "B"]),
+        )
+        db.session.add(s)
+        db.session.flush()
+        db.session.add(TeacherAssignment(teacher_id=teacher.id, student_id=s.id))
+        for week in range(rng.randint(0, 2)):
+            db.session.add(WeeklyUpdate(student_id=s.id, week_start_date=date(2026, 9, 7 + 7 * week),
+                                        burnout_risk_score=rng.choice([0.1, 0.5, 0.9])))
+    # Another teacher's student must never appear.
+    u = User(email="other@example.com", password_hash="x", role="student")
+    db.session.add(u)
+    db.session.flush()
+    db.session.add(StudentProfile(user_id=u.id, full_name="Astudent other", current_cgpa=4.0))
+    db.session.commit()
+
+
+def _walk(client, **params):
+    rows, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        resp = client.get("/api/teacher/students", query_string=query)
+        assert resp.status_code == 200, resp.get_data(as_text=True)
+        rows += resp.get_json()
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return rows
+
+
+def _latest_burnout(student):
+    updates = sorted(student.weekly_updates, key=lambda w: w.week_start_date)
+    return updates[-1].burnout_risk_score if updates else None
+
+
+@pytest.mark.parametrize("sort", ["name", "-name", "cgpa", "-cgpa", "last_active",
+                                  "-last_active", "burnout", "-burnout"])
+def test_every_sort_pages_in_order_with_nulls_last(client, login_as, sort):
+    _cohort(login_as)
+    name = sort.lstrip("-")
+    value = {
+        "name": lambda s: s.full_name.lower(),
+        "cgpa": lambda s: s.current_cgpa,
+        "last_active": lambda s: s.last_activity,
+        "burnout": _latest_burnout,
+    }[name]
+    students = StudentProfile.query.join(TeacherAssignment).all()
+    present = [s for s in students if value(s) is not None]
+    missing = [s for s in students if value(s) is None]
+    descending = sort.startswith("-")
+    expected = (
+        sorted(present, key=lambda s: (value(s), s.id), reverse=descending)
+        + sorted(missing, key=lambda s: s.id, reverse=descending)
+    )
+
+    rows = _walk(client, sort=sort, limit=4, fields="burnout")
+
+    assert [r["id"] for r in rows] == [s.id for s in expected]
+    if name == "burnout":
+        assert [r["burnout"] for r in rows] == [_latest_burnout(s) for s in expected]
+
+
+def test_fields_select_a_compact_projection(client, login_as):
+    _cohort(login_as, size=3)
+
+    rows = client.get("/api/teacher/students?fields=cgpa,last_active").get_json()
+    default = client.get("/api/teacher/students").get_json()
+
+    assert all(set(r) == {"id", "cgpa", "last_active"} for r in rows)
+    assert set(default[0]) == {"id", "name", "student_code", "class_level", "section",
+                               "cgpa", "status", "last_active"}
+
+
+def test_filters_combine_with_sort_and_search(client, login_as):
+    _cohort(login_as)
+
+    rows = _walk(client, search="student 1", sort="-cgpa", section="A", limit=2, fields="section,name")
+
+    assert rows and all(r["section"] == "A" and "student 1" in r["name"] for r in rows)
+
+
+def test_without_limit_or_cursor_the_whole_roster_is_returned(client, login_as):
+    _cohort(login_as, size=120)
+
+    everyone = client.get("/api/teacher/students?fields=id")
+    matches = client.get("/api/teacher/students?fields=id&search=student")
+    paged = client.get("/api/teacher/students?fields=id&limit=10")
+
+    assert len(everyone.get_json()) == 120 and "X-Next-Cursor" not in everyone.headers
+    assert len(matches.get_json()) == 120 and "X-Next-Cursor" not in matches.headers
+    assert len(paged.get_json()) == 10 and "X-Next-Cursor" in paged.headers
+
+
+def test_bad_parameters_are_rejected(client, login_as):
+    _cohort(login_as, size=1)
+
+    assert client.get("/api/teacher/students?fields=password_hash").status_code == 400
+    assert client.get("/api/teacher/students?sort=email").status_code == 400
+    assert client.get("/api/teacher/students?limit=ten").status_code == 400
@@ -0,0 +1,146 @@
+"""Indexed, ranked student search behind /api/teacher/students?search=."""
+
+import statistics
+import time
+
+import pytest
+from sqlalchemy import insert
+
+from core.extensions import db
+from models import StudentProfile, TeacherAssignment, TeacherProfile, User
+from services.student_search import student_search
+
+NAMES = [
+    ("Alice Johnson", "STU001"),
+    ("Johnny Appleseed", "STU002"),
+    ("Bob Ojohnes", "STU003"),
+    ("Carol King", "JOHN"),
+    ("Dave 100% Sure", "STU005"),
+    ("Erin Smith", None),
+]
+
+
+@pytest.fixture(params=["fts5", "memory", "like"])
+def backend(request):
+    student_search.configured_backend = request.param
+    student_search.invalidate()
+    yield request.param
+    student_search.configured_backend = "auto"
+    student_search.invalidate()
+
+
+def _teacher_with_students(login_as, names=NAMES, cgpas=None):
+    user = login_as("teacher", name="Teacher")
+    teacher = TeacherProfile.query.filter_by(user_id=user.id).one()
+    ids = []
+    for n, (name, code) in enumerate(names):
+        u = User(email=f"search{n}@example.com", password_hash="x", role="student")
+        db.session.add(u)
+        db.session.flush()
+        cgpa = cgpas[n] if cgpas else None
+        s = StudentProfile(user_id=u.id, full_name=name, student_code=code, current_cgpa=cgpa)
+        db.session.add(s)
+        db.session.flush()
+        db.session.add(TeacherAssignment(teacher_id=teacher.id, student_id=s.id))
+        ids.append(s.id)
+    db.session.commit()
+    return ids
+
+
+def _search(client, term, **params):
+    resp = client.get("/api/teacher/students", query_string={"search": term, **params})
+    assert resp.status_code == 200, resp.get_data(as_text=True)
+    return resp
+
+
+def test_results_are_ranked(client, login_as, backend):
+    _teacher_with_students(login_as)
+
+    names = [s["name"] for s in _search(client, "john").get_json()]
+
+    # exact code, name prefix, word prefix, then any substring
+    assert names == ["Carol King", "Johnny Appleseed", "Alice Johnson", "Bob Ojohnes"]
+    assert [s["name"] for s in _search(client, "100%").get_json()] == ["Dave 100% Sure"]
+    assert [s["name"] for s in _search(client, "jo").get_json()][:2] == ["Johnny Appleseed", "Carol King"]
+
+
+def test_search_pages_with_cursor_header(client, login_as, backend):
+    _teacher_with_students(login_as)
+
+    first = _search(client, "john", limit=3)
+    second = _search(client, "john", limit=3, cursor=first.headers["X-Next-Cursor"])
+
+    assert len(first.get_json()) == 3
+    assert [s["name"] for s in second.get_json()] == ["Bob Ojohnes"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_search_with_more_matches_than_a_page_can_be_walked(client, login_as):
+    ids = _teacher_with_students(login_as, names=[(f"Pat Student {n}", f"PS{n:03d}") for n in range(130)])
+
+    # What the students page does: follow X-Next-Cursor until it is absent.
+    found, cursor = [], None
+    while True:
+        params = {"fields": "id", "limit": 100, **({"cursor": cursor} if cursor else {})}
+        resp = _search(client, "pat", **params)
+        found += [row["id"] for row in resp.get_json()]
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert len(found) == 130 and sorted(found) == sorted(ids)
+
+
+def test_fts_index_follows_edits(client, login_as):
+    ids = _teacher_with_students(login_as)
+    student = db.session.get(StudentProfile, ids[-1])
+    student.full_name = "Erin Johnstone"
+    db.session.commit()
+
+    assert student_search.backend() == "fts5"
+    assert {s["name"] for s in _search(client, "johns").get_json()} == {"Alice Johnson", "Erin Johnstone"}
+    assert _search(client, "smith").get_json() == []
+
+
+def test_status_filter_runs_in_sql(client, login_as):
+    cgpas = [3.8, 3.0, 2.1, None, 0.0, 3.5]
+    _teacher_with_students(login_as, cgpas=cgpas)
+
+    for status in ("good", "average", "at-risk", "unknown"):
+        rows = client.get("/api/teacher/students", query_string={"status": status}).get_json()
+        assert rows and all(r["status"] == status for r in rows)
+    by_status = {
+        status: {s.id for s in StudentProfile.query.filter(StudentProfile.performance_status == status)}
+        for status in ("good", "average", "at-risk", "unknown")
+    }
+    for s in StudentProfile.query:
+        assert s.id in by_status[s.performance_status]
+
+
+def test_search_as_you_type_stays_fast(client, login_as):
+    user = login_as("teacher", name="Teacher")
+    teacher = TeacherProfile.query.filter_by(user_id=user.id).one()
+    first, last = ["Amir", "Beatriz", "Chen", "Dmitri", "Esther", "Farah", "Goran", "Hana"], \
+        ["Okafor", "Lindqvist", "Tanaka", "Moreau", "Haddad", "Novak", "Silva", "Kowalski"]
+    n = 5000
+    db.session.execute(insert(User), [
+        {"id": 1000 + i, "email": f"bulk{i}@example.com", "password_hash": "x", "role": "student"}
+        for i in range(n)
+    ])
+    db.session.execute(insert(StudentProfile), [
+        {"id": 1000 + i, "user_id": 1000 + i, "student_code": f"S{i:05d}",
+         "full_name": f"{first[i % 8]} {last[(i // 8) % 8]} {i}", "department": "CSE"}
+        for i in range(n)
+    ])
+    db.session.execute(insert(TeacherAssignment), [
+        {"teacher_id": teacher.id, "student_id": 1000 + i} for i in range(n)
+    ])
+    db.session.commit()
+
+    timings = []
+    for term in ("t", "ta", "tan", "tana", "tanak", "tanaka 4"):
+        started = time.perf_counter()
+        rows = _search(client, term).get_json()
+        timings.append(time.perf_counter() - started)
+        assert rows
+    assert statistics.median(timings) < 0.05